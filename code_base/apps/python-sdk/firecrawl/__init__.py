@@ -8,30 +8,54 @@ and check the status of these jobs.
 For more information visit https://github.com/firecrawl/
 """
 
+import json
 import logging
 import os
 
-from .firecrawl import FirecrawlApp, AsyncFirecrawlApp, JsonConfig, ScrapeOptions, ChangeTrackingOptions # noqa
-
+# Defined before importing the client module, which reads it as its version
 __version__ = "2.5.4"
 
+from .firecrawl import FirecrawlApp, AsyncFirecrawlApp, JsonConfig, ScrapeOptions, ChangeTrackingOptions, NearDuplicateFilter, WatcherPool, RequestScheduler, DomainDispatcher, UrlCanonicalizer, RequestLogger, RequestHooks, RequestTrace, RequestTimings, OpenTelemetryHooks # noqa
+
 # Define the logger for the Firecrawl project
 logger: logging.Logger = logging.getLogger("firecrawl")
 
 
+class _JsonFormatter(logging.Formatter):
+    """Formats records as one JSON object per line, merging request log fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        fields = getattr(record, "firecrawl", None)
+        if fields is not None:
+            entry.update(fields)
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
 def _configure_logger() -> None:
     """
     Configure the firecrawl logger for console output.
 
-    The function attaches a handler for console output with a specific format and date
-    format to the firecrawl logger.
+    The function attaches a handler for console output to the firecrawl logger, with
+    a text format by default or JSON lines when FIRECRAWL_LOGGING_FORMAT=json.
     """
     try:
         # Create the formatter
-        formatter = logging.Formatter(
-            "[%(asctime)s - %(name)s:%(lineno)d - %(levelname)s] %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
+        if os.getenv("FIRECRAWL_LOGGING_FORMAT", "").lower() == "json":
+            formatter = _JsonFormatter()
+        else:
+            formatter = logging.Formatter(
+                "[%(asctime)s - %(name)s:%(lineno)d - %(levelname)s] %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
 
         # Create the console handler and set the formatter
         console_handler = logging.StreamHandler()
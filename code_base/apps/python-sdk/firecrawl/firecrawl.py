@@ -9,39 +9,74 @@ and handles retries for certain HTTP status codes.
 Classes:
     - FirecrawlApp: Main class for interacting with the Firecrawl API.
 """
+import bisect
+import concurrent.futures
+import contextlib
+import contextvars
+import copy
+import fnmatch
+import functools
+import hashlib
 import logging
 import os
+import queue
+import random
+import threading
+import importlib
 import time
-from typing import Any, Dict, Optional, List, Union, Callable, Literal, TypeVar, Generic
+import urllib.parse
+import uuid
+from typing import Any, AsyncIterator, Dict, IO, Iterator, Optional, List, Set, Tuple, Union, Callable, Literal, TypeVar, Generic
 import json
-from datetime import datetime
+from array import array
+import collections
+from collections.abc import Mapping
+from datetime import datetime, timedelta
 import re
 import warnings
+import weakref
 import requests
+import requests.adapters
 import pydantic
-import websockets
-import aiohttp
-import asyncio
 from pydantic import Field
 
-# Suppress Pydantic warnings about attribute shadowing
-warnings.filterwarnings("ignore", message="Field name \"json\" in \"FirecrawlDocument\" shadows an attribute in parent \"BaseModel\"")
-warnings.filterwarnings("ignore", message="Field name \"json\" in \"ChangeTrackingData\" shadows an attribute in parent \"BaseModel\"")
-warnings.filterwarnings("ignore", message="Field name \"schema\" in \"JsonConfig\" shadows an attribute in parent \"BaseModel\"")
-warnings.filterwarnings("ignore", message="Field name \"schema\" in \"ExtractParams\" shadows an attribute in parent \"BaseModel\"")
-warnings.filterwarnings("ignore", message="Field name \"schema\" in \"ChangeTrackingOptions\" shadows an attribute in parent \"BaseModel\"")
+class _LazyModule:
+    """
+    Stands in for a module that only some clients need and imports it on first use.
+
+    The first attribute access imports the module (and `submodules`) and replaces
+    the stand-in in this module's globals, so later lookups cost nothing extra.
+    """
+    def __init__(self, name: str, *submodules: str) -> None:
+        self._name = name
+        self._submodules = submodules
+
+    def __getattr__(self, attr: str) -> Any:
+        module = importlib.import_module(self._name)
+        for submodule in self._submodules:
+            importlib.import_module(submodule)
+        globals()[self._name] = module
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        return f"<lazy module '{self._name}'>"
+
+# The async client, watchers and streaming helpers are the only users of these; a
+# process that only calls the sync HTTP methods never imports them.
+asyncio = _LazyModule('asyncio')
+aiohttp = _LazyModule('aiohttp')
+websockets = _LazyModule('websockets', 'websockets.exceptions')
+
+# Field names "json" and "schema" shadow BaseModel attributes. The warnings are only
+# silenced while the models below are defined, leaving the host's filters untouched.
+_model_warnings = warnings.catch_warnings()
+_model_warnings.__enter__()
+warnings.filterwarnings("ignore", message=r'Field name "(json|schema)" in "\w+" shadows an attribute in parent "BaseModel"')
 
 def get_version():
-  try:
-      from pathlib import Path
-      package_path = os.path.dirname(__file__)
-      version_file = Path(os.path.join(package_path, '__init__.py')).read_text()
-      version_match = re.search(r"^__version__ = ['\"]([^'\"]*)['\"]", version_file, re.M)
-      if version_match:
-          return version_match.group(1).strip()
-  except Exception:
-      print("Failed to get version from __init__.py")
-      return None
+  """Return the package version defined in firecrawl/__init__.py (set before this module is imported)."""
+  from . import __version__
+  return __version__
 
 version = get_version()
 
@@ -49,6 +84,287 @@ logger : logging.Logger = logging.getLogger("firecrawl")
 
 T = TypeVar('T')
 
+# Pydantic v2 ships a compiled validator/serializer (pydantic-core); the v1-style
+# `.dict()` and `Model(**data)` APIs still work there but go through deprecation shims.
+PYDANTIC_V2 = int(pydantic.VERSION.split('.')[0]) >= 2
+
+if PYDANTIC_V2:
+    @functools.lru_cache(maxsize=None)
+    def _type_adapter(model_cls: Any) -> 'pydantic.TypeAdapter':
+        """Return a cached TypeAdapter so each response model is compiled only once."""
+        return pydantic.TypeAdapter(model_cls)
+
+def _model_dump(model: Any) -> Dict[str, Any]:
+    """
+    Serialize a request model to a dict, dropping None values.
+
+    Plain dicts are passed through untouched so callers can mix models and dicts.
+    """
+    if isinstance(model, dict):
+        return model
+    if PYDANTIC_V2:
+        return model.model_dump(exclude_none=True, by_alias=True)
+    return model.dict(exclude_none=True, by_alias=True)
+
+def _validate_model(model_cls: Any, data: Any) -> Any:
+    """Validate already-decoded JSON data into `model_cls`."""
+    trace = _take_trace(data)
+    start = time.perf_counter() if trace is not None else 0.0
+    if PYDANTIC_V2:
+        result = _type_adapter(model_cls).validate_python(data)
+    else:
+        result = model_cls.parse_obj(data)
+    if trace is not None:
+        _attach_timings(trace, result, time.perf_counter() - start)
+    return result
+
+def _validate_model_json(model_cls: Any, raw: Union[str, bytes]) -> Any:
+    """Validate a raw JSON document into `model_cls` without building an intermediate dict."""
+    trace = _take_trace(raw)
+    start = time.perf_counter() if trace is not None else 0.0
+    if PYDANTIC_V2:
+        result = _type_adapter(model_cls).validate_json(raw)
+    else:
+        result = model_cls.parse_raw(raw)
+    if trace is not None:
+        _attach_timings(trace, result, time.perf_counter() - start)
+    return result
+
+def _validate_params(model_cls: Any, data: Any) -> Any:
+    """Validate request parameters into `model_cls`; unlike _validate_model this is never timed."""
+    if PYDANTIC_V2:
+        return _type_adapter(model_cls).validate_python(data)
+    return model_cls.parse_obj(data)
+
+def _validate_response(model_cls: Any, response: requests.Response) -> Any:
+    """
+    Validate an HTTP response body into `model_cls`.
+
+    Validates straight from the response bytes when they are available and falls
+    back to `response.json()` otherwise (e.g. for stubbed responses).
+    """
+    raw = getattr(response, 'content', None)
+    if isinstance(raw, (bytes, str)) and raw:
+        trace = _last_trace.get()
+        if trace is not None and trace.timings is getattr(response, 'timings', None):
+            trace._payload = raw
+        return _validate_model_json(model_cls, raw)
+    return _validate_model(model_cls, response.json())
+
+class FrozenSchema(dict):
+    """
+    An immutable JSON schema shared from the schema cache.
+
+    It is a dict, so it can be placed in request bodies as is, but mutating it
+    raises TypeError; nested objects and arrays are frozen as well.
+    Copies (copy.copy, copy.deepcopy, dict(schema)) are plain and mutable.
+
+    Attributes:
+        json (Optional[str]): The schema serialized to JSON (top-level schemas only)
+    """
+    __slots__ = ('json',)
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError('FrozenSchema is immutable; copy it with dict(schema) to modify it')
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _immutable
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Dict[str, Any]:
+        return copy.deepcopy(_thaw(self), memo)
+
+    def __reduce__(self) -> Any:
+        return (dict, (_thaw(self),))
+
+class _FrozenList(list):
+    """An immutable JSON array inside a FrozenSchema."""
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError('FrozenSchema is immutable; copy it with dict(schema) to modify it')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> List[Any]:
+        return copy.deepcopy(_thaw(self), memo)
+
+    def __reduce__(self) -> Any:
+        return (list, (_thaw(self),))
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, dict):
+        frozen = FrozenSchema((key, _freeze(item)) for key, item in value.items())
+        frozen.json = None
+        return frozen
+    if isinstance(value, (list, tuple)):
+        return _FrozenList(_freeze(item) for item in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_thaw(item) for item in value]
+    return value
+
+def _model_schema(model_cls: type) -> Any:
+    if hasattr(model_cls, 'model_json_schema'):
+        return model_cls.model_json_schema()
+    if hasattr(model_cls, 'schema'):
+        return model_cls.schema()
+    return model_cls
+
+def _schema_key_default(value: Any) -> Any:
+    # Model classes nested in dict schemas are keyed by their cached JSON schema. An id()
+    # would be reused by a later class once this one is collected.
+    if isinstance(value, type):
+        return _compile_schema(value)
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+_model_schemas: 'weakref.WeakKeyDictionary[type, Any]' = weakref.WeakKeyDictionary()
+_dict_schemas: Dict[bytes, FrozenSchema] = {}
+_DICT_SCHEMA_CACHE_SIZE = 1024
+
+def _compile_schema(schema: Any) -> Any:
+    """
+    Convert a schema given as a pydantic model class or a dict (possibly holding
+    model classes) into a cached FrozenSchema.
+
+    Model classes are cached by class and dict schemas by a hash of their content,
+    so repeated requests with the same schema skip model_json_schema() and the
+    recursive walk. Other values are returned unchanged.
+    """
+    if schema is None or type(schema) is FrozenSchema:
+        return schema
+    if isinstance(schema, type):
+        try:
+            compiled = _model_schemas.get(schema)
+        except TypeError:
+            compiled = None
+        if compiled is None:
+            compiled = _freeze(_model_schema(schema))
+            if type(compiled) is FrozenSchema:
+                compiled.json = json.dumps(compiled)
+            try:
+                _model_schemas[schema] = compiled
+            except TypeError:
+                pass
+        return compiled
+    if isinstance(schema, dict):
+        key = hashlib.blake2b(
+            json.dumps(schema, default=_schema_key_default).encode(), digest_size=16
+        ).digest()
+        compiled = _dict_schemas.get(key)
+        if compiled is None:
+            compiled = _freeze(_resolve_schema_models(schema))
+            compiled.json = json.dumps(compiled)
+            if len(_dict_schemas) >= _DICT_SCHEMA_CACHE_SIZE:
+                _dict_schemas.clear()
+            _dict_schemas[key] = compiled
+        return compiled
+    if isinstance(schema, (list, tuple)):
+        return [_compile_schema(item) for item in schema]
+    return schema
+
+def _resolve_schema_models(value: Any) -> Any:
+    """Replace model classes nested in a dict schema with their JSON schemas."""
+    if isinstance(value, type):
+        return _compile_schema(value)
+    if isinstance(value, dict):
+        return {key: _resolve_schema_models(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_resolve_schema_models(item) for item in value]
+    return value
+
+def _schema_options(options: Any) -> Dict[str, Any]:
+    """Dump extract/JSON options with their schema compiled, leaving the caller's object untouched."""
+    options = dict(_model_dump(options))
+    if options.get('schema') is not None:
+        options['schema'] = _compile_schema(options['schema'])
+    return options
+
+def _compile_option_schemas(params: Dict[str, Any], compiled: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Compile the extract/jsonOptions schemas of a request body in place.
+
+    `compiled` is the dict the body was validated from; its already compiled schemas
+    are reused instead of hashing the plain copies that model_dump produces.
+    """
+    for key in ('extract', 'jsonOptions'):
+        options = params.get(key)
+        if not options or options.get('schema') is None:
+            continue
+        source = compiled.get(key) if compiled is not None else None
+        schema = source.get('schema') if isinstance(source, dict) else None
+        params[key] = {**options, 'schema': schema if type(schema) is FrozenSchema else _compile_schema(options['schema'])}
+
+def _schema_model(schema: Any, validation: Optional[str]) -> Optional[type]:
+    """
+    Return the pydantic model class results should be bound to, or None.
+
+    `schema` may be the schema itself or extract/JSON options holding one.
+
+    Raises:
+        ValueError: If validation is requested without a pydantic model schema
+    """
+    if validation is None:
+        return None
+    if validation not in ('strict', 'lenient'):
+        raise ValueError("validation must be 'strict' or 'lenient'")
+    if isinstance(schema, JsonConfig):
+        schema = schema.schema
+    elif isinstance(schema, dict) and not isinstance(schema, FrozenSchema) and 'schema' in schema:
+        schema = schema['schema']
+    if isinstance(schema, type) and issubclass(schema, pydantic.BaseModel):
+        return schema
+    raise ValueError('validation requires the schema to be a pydantic model class')
+
+def _construct_model(model_cls: Any, data: Dict[str, Any]) -> Any:
+    """Build a `model_cls` instance from raw data without validating it."""
+    if PYDANTIC_V2:
+        return model_cls.model_construct(**data)
+    return model_cls.construct(**data)
+
+def _try_bind_schema(envelope_cls: Any, model_cls: Any, response: requests.Response) -> Any:
+    """Validate a response straight into `envelope_cls[model_cls]`, returning None if it does not fit."""
+    try:
+        return _validate_response(envelope_cls[model_cls], response)
+    except ValueError:
+        return None
+
+def _bind_schema(envelope_cls: Any, model_cls: Any, data: Dict[str, Any], validation: str, field: str = 'data') -> Any:
+    """
+    Validate a response into `envelope_cls[model_cls]` in one pass.
+
+    The parametrized envelope is compiled once per schema class and cached. In strict
+    mode a mismatch raises pydantic.ValidationError; in lenient mode the envelope is
+    validated untyped, `field` holds an unvalidated `model_cls` instance built from the
+    raw data and the per-field errors are listed in `validationErrors`.
+    """
+    try:
+        return _validate_model(envelope_cls[model_cls], data)
+    except pydantic.ValidationError as e:
+        if validation != 'lenient':
+            raise
+        errors = []
+        for error in e.errors():
+            loc = tuple(error['loc'])
+            if not loc or loc[0] != field:
+                raise
+            errors.append({'loc': list(loc[1:]), 'msg': error['msg'], 'type': error['type']})
+
+    result = _validate_model(envelope_cls, data)
+    raw = getattr(result, field)
+    if isinstance(raw, dict):
+        setattr(result, field, _construct_model(model_cls, raw))
+    result.validationErrors = errors
+    return result
+
 # class FirecrawlDocumentMetadata(pydantic.BaseModel):
 #     """Metadata for a Firecrawl document."""
 #     title: Optional[str] = None
@@ -123,6 +439,12 @@ class FirecrawlDocument(pydantic.BaseModel, Generic[T]):
     description: Optional[str] = None  # v1 search only
     changeTracking: Optional[ChangeTrackingData] = None
 
+    if PYDANTIC_V2:
+        @pydantic.field_serializer('metadata')
+        def _serialize_metadata(self, metadata: Any) -> Any:
+            # Compact views from a MetadataTable dump as the plain dict they stand for
+            return metadata.to_dict() if isinstance(metadata, CompactMetadata) else metadata
+
 class LocationConfig(pydantic.BaseModel):
     """Location configuration for scraping."""
     country: Optional[str] = None
@@ -224,6 +546,15 @@ class ScrapeResponse(FirecrawlDocument[T], Generic[T]):
     success: bool = True
     warning: Optional[str] = None
     error: Optional[str] = None
+    validationErrors: Optional[List[Dict[str, Any]]] = None  # lenient json_options validation only
+
+class ScrapeManyResult(pydantic.BaseModel):
+    """Outcome of one URL in a client-side concurrent scrape."""
+    index: int
+    url: str
+    success: bool
+    document: Optional[ScrapeResponse[Any]] = None
+    error: Optional[str] = None
 
 class BatchScrapeResponse(pydantic.BaseModel):
     """Response from batch scrape operations."""
@@ -233,6 +564,28 @@ class BatchScrapeResponse(pydantic.BaseModel):
     error: Optional[str] = None
     invalidURLs: Optional[List[str]] = None
 
+class BatchScrapeShard(pydantic.BaseModel):
+    """Sub-job of a sharded batch scrape."""
+    index: int
+    urls: List[str]
+    id: Optional[str] = None
+    status: str = "pending"
+    completed: int = 0
+    total: int = 0
+    creditsUsed: int = 0
+    expiresAt: Optional[datetime] = None
+    attempts: int = 0
+    error: Optional[str] = None
+
+class BatchScrapeRetry(pydantic.BaseModel):
+    """One resubmission of the failed URLs of a batch scrape."""
+    attempt: int
+    urls: List[str]
+    overrides: Dict[str, Any] = {}
+    id: Optional[str] = None
+    recovered: List[str] = []
+    error: Optional[str] = None
+
 class BatchScrapeStatusResponse(pydantic.BaseModel):
     """Response from batch scrape status checks."""
     success: bool = True
@@ -243,6 +596,25 @@ class BatchScrapeStatusResponse(pydantic.BaseModel):
     expiresAt: datetime
     next: Optional[str] = None
     data: List[FirecrawlDocument]
+    shards: Optional[List[BatchScrapeShard]] = None
+    retries: Optional[List[BatchScrapeRetry]] = None
+    failedUrls: Optional[List[str]] = None
+    canonicalUrls: Optional[Dict[str, str]] = None
+
+    def documents_by_input(self) -> Dict[str, Optional[FirecrawlDocument]]:
+        """
+        Maps every input URL of a canonicalized batch to its document.
+
+        Returns:
+            Dict[str, Optional[FirecrawlDocument]]: Document per input URL, None for URLs without one
+        """
+        by_url = {}
+        for document in self.data:
+            metadata = document.metadata if isinstance(document.metadata, Mapping) else {}
+            for key in ('sourceURL', 'url'):
+                if metadata.get(key):
+                    by_url.setdefault(metadata[key], document)
+        return {url: by_url.get(canonical) for url, canonical in (self.canonicalUrls or {}).items()}
 
 class CrawlParams(pydantic.BaseModel):
     """Parameters for crawling operations."""
@@ -321,6 +693,7 @@ class ExtractResponse(pydantic.BaseModel, Generic[T]):
     error: Optional[str] = None
     warning: Optional[str] = None
     sources: Optional[List[str]] = None
+    validationErrors: Optional[List[Dict[str, Any]]] = None  # lenient validation only
 
 class SearchParams(pydantic.BaseModel):
     query: str
@@ -347,7 +720,14 @@ class GenerateLLMsTextParams(pydantic.BaseModel):
     """
     maxUrls: Optional[int] = 10
     showFullText: Optional[bool] = False
-    __experimental_stream: Optional[bool] = None
+    # Double-underscore attributes become private (and are mangled), so the wire name is an alias
+    experimental_stream: Optional[bool] = pydantic.Field(None, alias='__experimental_stream')
+
+    if PYDANTIC_V2:
+        model_config = pydantic.ConfigDict(populate_by_name=True)
+    else:
+        class Config:
+            allow_population_by_field_name = True
 
 class DeepResearchParams(pydantic.BaseModel):
     """
@@ -358,7 +738,13 @@ class DeepResearchParams(pydantic.BaseModel):
     maxUrls: Optional[int] = 20
     analysisPrompt: Optional[str] = None
     systemPrompt: Optional[str] = None
-    __experimental_streamSteps: Optional[bool] = None
+    experimental_stream_steps: Optional[bool] = pydantic.Field(None, alias='__experimental_streamSteps')
+
+    if PYDANTIC_V2:
+        model_config = pydantic.ConfigDict(populate_by_name=True)
+    else:
+        class Config:
+            allow_population_by_field_name = True
 
 class DeepResearchResponse(pydantic.BaseModel):
     """
@@ -400,6 +786,24 @@ class GenerateLLMsTextStatusResponse(pydantic.BaseModel):
     status: Literal["processing", "completed", "failed"]
     error: Optional[str] = None
     expiresAt: str
+
+class DeepResearchManyResult(pydantic.BaseModel):
+    """Outcome of one query in a concurrent deep research fan-out."""
+    index: int
+    query: str
+    success: bool
+    id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+class GenerateLLMsTextManyResult(pydantic.BaseModel):
+    """Outcome of one URL in a concurrent LLMs.txt generation fan-out."""
+    index: int
+    url: str
+    success: bool
+    id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
     
 class SearchResponse(pydantic.BaseModel):
     """
@@ -424,6 +828,1958 @@ class ExtractParams(pydantic.BaseModel):
     show_sources: Optional[bool] = False
     agent: Optional[Dict[str, Any]] = None
 
+_model_warnings.__exit__(None, None, None)
+
+class MetadataTable:
+    """
+    Shared, interned storage for document metadata across a large crawl.
+
+    Pages from one site repeat the same metadata keys and many identical values
+    (site name, locale, og:image, ...). The table stores every distinct key/value
+    once; each document only keeps a `CompactMetadata` view holding an array of
+    offsets into the table.
+    """
+    __slots__ = ('_values', '_index')
+
+    def __init__(self) -> None:
+        self._values: List[Any] = []
+        self._index: Dict[Any, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def intern(self, value: Any) -> int:
+        """
+        Return the table offset for a value, adding it if it is not stored yet.
+
+        Args:
+            value (Any): Metadata key or value
+
+        Returns:
+            int: Offset of the value in the table
+        """
+        # Strings are the common case; other types are keyed with their type so
+        # that e.g. 1, 1.0 and True stay distinct entries.
+        if isinstance(value, str):
+            key = value
+        elif isinstance(value, list):
+            key = (list, tuple((type(item), item) for item in value))
+        else:
+            key = (type(value), value)
+        try:
+            offset = self._index.get(key)
+        except TypeError:
+            # Unhashable values (e.g. nested dicts) are stored without sharing
+            self._values.append(value)
+            return len(self._values) - 1
+        if offset is None:
+            offset = len(self._values)
+            self._values.append(value)
+            self._index[key] = offset
+        return offset
+
+    def pack(self, metadata: Dict[str, Any]) -> 'CompactMetadata':
+        """
+        Convert a metadata dict into a compact view backed by this table.
+
+        Args:
+            metadata (Dict[str, Any]): Document metadata
+
+        Returns:
+            CompactMetadata: Read-only mapping with the same items
+        """
+        offsets = array('I')
+        for key, value in metadata.items():
+            offsets.append(self.intern(key))
+            offsets.append(self.intern(value))
+        return CompactMetadata(self, offsets)
+
+    def compact_documents(self, documents: List[Any]) -> List[Any]:
+        """
+        Replace the metadata of each document in place with a compact view.
+
+        Args:
+            documents (List[Any]): Raw document dicts or FirecrawlDocument instances
+
+        Returns:
+            List[Any]: The same list, for chaining
+        """
+        for document in documents:
+            if isinstance(document, dict):
+                metadata = document.get('metadata')
+                if isinstance(metadata, dict):
+                    document['metadata'] = self.pack(metadata)
+            elif isinstance(getattr(document, 'metadata', None), dict):
+                document.metadata = self.pack(document.metadata)
+        return documents
+
+class CompactMetadata(Mapping):
+    """
+    Read-only metadata mapping stored as offsets into a shared MetadataTable.
+
+    Behaves like the original metadata dict for lookups and iteration; use
+    `to_dict()` to get a regular, mutable copy. Interned lists are shared by
+    every document with the same value, so lookups return a copy of them.
+    """
+    __slots__ = ('_table', '_offsets')
+
+    def __init__(self, table: MetadataTable, offsets: array) -> None:
+        self._table = table
+        self._offsets = offsets
+
+    def __getitem__(self, key: str) -> Any:
+        values = self._table._values
+        offsets = self._offsets
+        for i in range(0, len(offsets), 2):
+            if values[offsets[i]] == key:
+                value = values[offsets[i + 1]]
+                return value.copy() if isinstance(value, list) else value
+        raise KeyError(key)
+
+    def __iter__(self):
+        values = self._table._values
+        offsets = self._offsets
+        for i in range(0, len(offsets), 2):
+            yield values[offsets[i]]
+
+    def __len__(self) -> int:
+        return len(self._offsets) // 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metadata as a regular dict."""
+        values = self._table._values
+        offsets = self._offsets
+        metadata = {}
+        for i in range(0, len(offsets), 2):
+            value = values[offsets[i + 1]]
+            metadata[values[offsets[i]]] = value.copy() if isinstance(value, list) else value
+        return metadata
+
+    def __repr__(self) -> str:
+        return f"CompactMetadata({self.to_dict()!r})"
+
+class NearDuplicateFilter:
+    """
+    Client-side near-duplicate detection for crawled documents.
+
+    Each document's markdown is fingerprinted with a 64-bit SimHash over word
+    shingles. Fingerprints are indexed in a banded LSH table: with `max_distance`
+    k the fingerprint is split into k + 1 bands, so any two fingerprints within
+    Hamming distance k share at least one band and only those candidates are
+    compared.
+
+    Attributes:
+        max_distance (int): Maximum Hamming distance (in bits) to treat documents as duplicates
+        shingle_size (int): Number of words per shingle
+        mode (str): How watchers treat duplicates: "drop" skips them, "flag" dispatches them with `duplicateOf` set
+        field (str): Document field to fingerprint
+        max_entries (Optional[int]): Number of most recent fingerprints remembered; unbounded when None
+        duplicates (int): Number of near-duplicates seen so far
+    """
+    _WORD_RE = re.compile(r'\w+')
+
+    def __init__(
+            self,
+            max_distance: int = 3,
+            shingle_size: int = 3,
+            mode: Literal["drop", "flag"] = "drop",
+            field: str = 'markdown',
+            max_entries: Optional[int] = None) -> None:
+        if not 0 <= max_distance < 16:
+            raise ValueError("max_distance must be between 0 and 15")
+        if mode not in ("drop", "flag"):
+            raise ValueError(f"Unknown near-duplicate mode: {mode}")
+        self.max_distance = max_distance
+        self.shingle_size = max(1, shingle_size)
+        self.mode = mode
+        self.field = field
+        self.max_entries = max_entries
+        self.duplicates = 0
+        bands = max_distance + 1
+        width = 64 // bands
+        self._bands = [(i * width, 64 if i == bands - 1 else (i + 1) * width) for i in range(bands)]
+        self._index: List[Dict[int, List[int]]] = [{} for _ in self._bands]
+        # Position -> fingerprint and key; positions grow monotonically so eviction is FIFO
+        self._fingerprints: Dict[int, int] = {}
+        self._keys: Dict[int, str] = {}
+        self._count = 0
+
+    def fingerprint(self, text: str) -> int:
+        """
+        Compute the 64-bit SimHash of a text.
+
+        Args:
+            text (str): Text to fingerprint
+
+        Returns:
+            int: The fingerprint
+        """
+        words = self._WORD_RE.findall(text.lower())
+        size = self.shingle_size
+        if len(words) > size:
+            shingles = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        else:
+            shingles = {' '.join(words)}
+        bits = [
+            format(int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big'), '064b')
+            for shingle in shingles
+        ]
+        # Column-wise majority vote over the shingle hashes (bit 63 first)
+        threshold = len(bits) / 2
+        fingerprint = 0
+        for column in zip(*bits):
+            fingerprint = (fingerprint << 1) | (column.count('1') > threshold)
+        return fingerprint
+
+    def _band_values(self, fingerprint: int):
+        for start, end in self._bands:
+            yield (fingerprint >> start) & ((1 << (end - start)) - 1)
+
+    def check(self, document: Any) -> Optional[str]:
+        """
+        Check a document against everything seen so far and remember it.
+
+        Args:
+            document (Any): Raw document dict or FirecrawlDocument
+
+        Returns:
+            Optional[str]: Key (source URL) of the earlier near-duplicate, or None if the document is new
+        """
+        if isinstance(document, dict):
+            text = document.get(self.field)
+            metadata = document.get('metadata') or {}
+            key = document.get('url')
+        else:
+            text = getattr(document, self.field, None)
+            metadata = getattr(document, 'metadata', None) or {}
+            key = getattr(document, 'url', None)
+        if not text:
+            return None
+        if isinstance(metadata, Mapping):
+            key = metadata.get('sourceURL') or metadata.get('url') or key
+        key = key or f"document-{self._count}"
+
+        fingerprint = self.fingerprint(text)
+        band_values = list(self._band_values(fingerprint))
+        candidates = set()
+        for band, value in zip(self._index, band_values):
+            candidates.update(band.get(value, ()))
+        for candidate in candidates:
+            if bin(fingerprint ^ self._fingerprints[candidate]).count('1') <= self.max_distance:
+                self.duplicates += 1
+                return self._keys[candidate]
+
+        position = self._count
+        self._count += 1
+        self._fingerprints[position] = fingerprint
+        self._keys[position] = key
+        for band, value in zip(self._index, band_values):
+            band.setdefault(value, []).append(position)
+        if self.max_entries is not None and len(self._fingerprints) > self.max_entries:
+            self._forget(position - self.max_entries)
+        return None
+
+    def _forget(self, position: int) -> None:
+        """Removes the fingerprint at `position`, the oldest one remembered."""
+        fingerprint = self._fingerprints.pop(position)
+        del self._keys[position]
+        for band, value in zip(self._index, self._band_values(fingerprint)):
+            bucket = band[value]
+            # Buckets are appended in position order, so the oldest entry comes first
+            del bucket[0]
+            if not bucket:
+                del band[value]
+
+    def filter_documents(self, documents: List[Any]) -> List[Any]:
+        """
+        Return the documents that are not near-duplicates of an earlier one.
+
+        Args:
+            documents (List[Any]): Raw document dicts or FirecrawlDocument instances
+
+        Returns:
+            List[Any]: Documents in their original order, without near-duplicates
+        """
+        return [document for document in documents if self.check(document) is None]
+
+class UrlCanonicalizer:
+    """
+    Fast URL canonicalization for deduplicating URL lists before submission.
+
+    Variants of a page collapse to one URL: the scheme and host are lowercased,
+    default ports, fragments and trailing slashes are dropped, `http` becomes
+    `https`, and tracking query parameters are removed. Parameter patterns are
+    compiled into a single regular expression and canonical forms are cached.
+    URLs without a scheme, or containing wildcards such as those accepted by
+    extract, are only stripped of whitespace.
+
+    Attributes:
+        strip_params (Tuple[str, ...]): Glob patterns of query parameter names to remove
+        force_https (bool): Rewrite `http` URLs to `https`
+        strip_fragment (bool): Remove `#fragment`
+        strip_trailing_slash (bool): Remove a trailing slash from non-root paths
+        sort_query (bool): Sort the remaining query parameters
+    """
+    DEFAULT_STRIP_PARAMS = ('utm_*', 'gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', '_ga', '_hsenc', '_hsmi')
+    _DEFAULT_PORTS = {'http': '80', 'https': '443'}
+    _CACHE_SIZE = 65536
+
+    def __init__(
+            self,
+            strip_params: Optional[List[str]] = None,
+            *,
+            force_https: bool = True,
+            strip_fragment: bool = True,
+            strip_trailing_slash: bool = True,
+            sort_query: bool = True) -> None:
+        self.strip_params = tuple(self.DEFAULT_STRIP_PARAMS if strip_params is None else strip_params)
+        self.force_https = force_https
+        self.strip_fragment = strip_fragment
+        self.strip_trailing_slash = strip_trailing_slash
+        self.sort_query = sort_query
+        self._strip_re = re.compile('|'.join(fnmatch.translate(pattern) for pattern in self.strip_params), re.IGNORECASE) if self.strip_params else None
+        self._cache: Dict[str, str] = {}
+
+    def canonicalize(self, url: str) -> str:
+        """
+        Returns the canonical form of a URL.
+
+        Args:
+            url (str): URL to canonicalize
+
+        Returns:
+            str: Canonical URL
+        """
+        canonical = self._cache.get(url)
+        if canonical is None:
+            canonical = self._canonicalize(url)
+            if len(self._cache) >= self._CACHE_SIZE:
+                self._cache.clear()
+            self._cache[url] = canonical
+        return canonical
+
+    def _canonicalize(self, url: str) -> str:
+        stripped = url.strip()
+        if '://' not in stripped or '*' in stripped:
+            return stripped
+        scheme, netloc, path, query, fragment = urllib.parse.urlsplit(stripped)
+        scheme = scheme.lower()
+        userinfo, _, hostport = netloc.rpartition('@')
+        host, _, port = hostport.lower().partition(':') if not hostport.startswith('[') else (hostport.lower(), '', '')
+        if port and self._DEFAULT_PORTS.get(scheme) == port:
+            port = ''
+        if self.force_https and scheme == 'http':
+            scheme = 'https'
+            if port == '443':
+                port = ''
+        netloc = (userinfo + '@' if userinfo else '') + host + (':' + port if port else '')
+        if self.strip_trailing_slash and len(path) > 1:
+            path = path.rstrip('/') or '/'
+        elif not path:
+            path = '/'
+        if query:
+            pairs = [pair for pair in query.split('&') if pair and not (self._strip_re and self._strip_re.match(pair.partition('=')[0]))]
+            if self.sort_query:
+                pairs.sort()
+            query = '&'.join(pairs)
+        if self.strip_fragment:
+            fragment = ''
+        return urllib.parse.urlunsplit((scheme, netloc, path, query, fragment))
+
+    def dedupe(self, urls: List[str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Canonicalizes and deduplicates a URL list, keeping first-seen order.
+
+        Args:
+            urls (List[str]): Input URLs
+
+        Returns:
+            Tuple[List[str], Dict[str, str]]: The unique canonical URLs, and a mapping from
+            every input URL to the canonical URL it was submitted as
+        """
+        unique: Dict[str, None] = {}
+        mapping: Dict[str, str] = {}
+        for url in urls:
+            canonical = self.canonicalize(url)
+            unique[canonical] = None
+            mapping[url] = canonical
+        return list(unique), mapping
+
+def _resolve_canonicalizer(canonicalize: Union[bool, UrlCanonicalizer]) -> Optional[UrlCanonicalizer]:
+    if canonicalize is True:
+        return UrlCanonicalizer()
+    return canonicalize or None
+
+class IdempotencyRegistry:
+    """
+    Derives idempotency keys from request content and remembers the jobs they started.
+
+    A key is a UUID built from a SHA-256 hash of the endpoint and the canonical JSON
+    of the final request body, salted with the current time window. Resubmitting the
+    same request within the window yields the same key; if the first submission was
+    recorded, the recorded response is returned instead of starting a new job, and
+    otherwise the server rejects the duplicate key. The previous window is checked as
+    well, so a retry that crosses a window boundary still re-attaches.
+
+    A key is reserved before its submission is sent and released again when the
+    server rejects the request. A submission that got no response at all (e.g. a
+    timeout) keeps its reservation, so a retry in the next window reuses its key and
+    the server deduplicates it. Reservations and recorded jobs only live in this
+    registry: a retry from another process, or more than one window later, gets a
+    fresh key and can start a duplicate job.
+
+    Attributes:
+        window (float): Seconds during which identical requests share a key
+        max_entries (int): Recorded submissions kept, oldest evicted first
+    """
+    def __init__(self, window: float = 600, max_entries: int = 10000) -> None:
+        self.window = window
+        self.max_entries = max_entries
+        self._jobs: collections.OrderedDict = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def key(self, url: str, params: Dict[str, Any], window_offset: int = 0) -> str:
+        """
+        Returns the idempotency key of a request.
+
+        Args:
+            url (str): Endpoint URL
+            params (Dict[str, Any]): Final request body
+            window_offset (int): Window relative to the current one
+
+        Returns:
+            str: A version 4 formatted UUID, as required by the API
+        """
+        window = int(time.time() // self.window) + window_offset
+        body = json.dumps(params, sort_keys=True, separators=(',', ':'), default=str)
+        digest = hashlib.sha256(f'{url}\n{window}\n{body}'.encode()).digest()
+        return str(uuid.UUID(bytes=digest[:16], version=4))
+
+    def lookup(self, url: str, params: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Returns the key for a request and the response recorded for it, if any.
+
+        A key of the previous window is returned while it is reserved or recorded.
+        """
+        key = self.key(url, params)
+        with self._lock:
+            for candidate in (key, self.key(url, params, -1)):
+                if candidate in self._jobs:
+                    return candidate, self._jobs[candidate]
+        return key, None
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Returns the response recorded for a key, if any."""
+        with self._lock:
+            return self._jobs.get(key)
+
+    def reserve(self, key: str) -> None:
+        """Marks a key as in use by a submission whose response is not known yet."""
+        with self._lock:
+            if key not in self._jobs:
+                self._store(key, None)
+
+    def release(self, key: str) -> None:
+        """Drops the reservation of a key whose submission the server rejected."""
+        with self._lock:
+            if key in self._jobs and self._jobs[key] is None:
+                del self._jobs[key]
+
+    def record(self, key: str, response: Dict[str, Any]) -> None:
+        """Records the response of a successful submission."""
+        with self._lock:
+            self._store(key, response)
+
+    def _store(self, key: str, value: Optional[Dict[str, Any]]) -> None:
+        self._jobs[key] = value
+        self._jobs.move_to_end(key)
+        while len(self._jobs) > self.max_entries:
+            self._jobs.popitem(last=False)
+
+def _derive_idempotency_key(key: str, *parts: Any) -> str:
+    """Derives a stable UUID key from a base key, for example per batch shard and attempt."""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, '/'.join(map(str, (key, *parts)))))
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Attributes:
+        bounds (Tuple[float, ...]): Upper bucket bounds in seconds; the last bucket is unbounded
+        buckets (List[int]): Number of samples per bucket
+        count (int): Number of samples
+        total (float): Sum of all samples in seconds
+        max (float): Largest sample in seconds
+    """
+    __slots__ = ('bounds', 'buckets', 'count', 'total', 'max')
+
+    DEFAULT_BOUNDS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+    def __init__(self, bounds: Tuple[float, ...] = DEFAULT_BOUNDS) -> None:
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Add a sample, in seconds."""
+        self.buckets[bisect.bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Approximate a percentile as the upper bound of the bucket that contains it.
+
+        Args:
+            q (float): Percentile between 0 and 100
+
+        Returns:
+            float: Latency in seconds (the observed maximum for the unbounded bucket)
+        """
+        if not self.count:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for bound, bucket in zip(self.bounds, self.buckets):
+            seen += bucket
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary."""
+        return {
+            'count': self.count,
+            'mean': self.mean,
+            'max': self.max,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'buckets': dict(zip([*map(str, self.bounds), 'inf'], self.buckets)),
+        }
+
+class _BatchRetry:
+    """
+    Bookkeeping for resubmitting the failed URLs of a batch scrape, shared by the sync and async clients.
+    """
+    def __init__(
+            self,
+            status: Union[BatchScrapeStatusResponse, 'CrawlStatusResponse'],
+            params_dict: Dict[str, Any],
+            budget: int,
+            escalation: Optional[List[Dict[str, Any]]]) -> None:
+        self.status = status
+        self.params_dict = params_dict
+        self.budget = budget
+        if escalation is None:
+            escalation = [
+                {'proxy': 'stealth'},
+                {'proxy': 'stealth', 'timeout': 2 * (params_dict.get('timeout') or 30000)},
+            ]
+        self.escalation = escalation
+        self.retries: List[BatchScrapeRetry] = []
+        self.failed: List[str] = []
+        self._scraped = {url for url in map(self._source_url, status.data) if url}
+
+    @staticmethod
+    def _source_url(document: Any) -> Optional[str]:
+        metadata = document.metadata if isinstance(document, FirecrawlDocument) else document.get('metadata')
+        if isinstance(metadata, Mapping):
+            return metadata.get('sourceURL') or metadata.get('url')
+        return None
+
+    def add_errors(self, errors: Union[CrawlErrorsResponse, Dict[str, Any]]) -> None:
+        """Queues the URLs of a job's error report, except robots-blocked ones and URLs that have a document."""
+        if isinstance(errors, dict):
+            errors = _validate_model(CrawlErrorsResponse, errors)
+        blocked = set(errors.robotsBlocked)
+        for error in errors.errors:
+            url = error.get('url')
+            if url and url not in blocked and url not in self._scraped and url not in self.failed:
+                self.failed.append(url)
+
+    def next_request(self) -> Optional[Dict[str, Any]]:
+        """The request body of the next retry job, or None once nothing is left to retry or the budget is spent."""
+        if not self.failed or len(self.retries) >= self.budget:
+            return None
+        overrides = self.escalation[min(len(self.retries), len(self.escalation) - 1)] if self.escalation else {}
+        retry = BatchScrapeRetry(attempt=len(self.retries) + 1, urls=self.failed, overrides=overrides)
+        self.retries.append(retry)
+        self.failed = []
+        return {**self.params_dict, **overrides, 'urls': retry.urls}
+
+    def started(self, id: Optional[str]) -> None:
+        if not id:
+            raise Exception('Batch scrape retry job failed to start')
+        self.retries[-1].id = id
+
+    def record(self, retry_status: Union[BatchScrapeStatusResponse, 'CrawlStatusResponse']) -> None:
+        """Merges the documents of a finished retry job into the original response."""
+        retry = self.retries[-1]
+        retry.recovered = [url for url in map(self._source_url, retry_status.data) if url]
+        self._scraped.update(retry.recovered)
+        self.status.data.extend(retry_status.data)
+        self.status.completed += retry_status.completed
+        self.status.creditsUsed += retry_status.creditsUsed
+
+    def fail(self, error: str) -> None:
+        """Marks the current retry job as failed; its unrecovered URLs stay queued for the next attempt."""
+        retry = self.retries[-1]
+        retry.error = error
+        self.failed = [url for url in retry.urls if url not in self._scraped]
+
+    def result(self) -> BatchScrapeStatusResponse:
+        return _as_batch_status(self.status, retries=self.retries, failedUrls=self.failed)
+
+def _as_batch_status(status: Union[BatchScrapeStatusResponse, 'CrawlStatusResponse'], **updates: Any) -> BatchScrapeStatusResponse:
+    """Returns a batch status response with `updates` applied, converting crawl-style status responses."""
+    fields = {name: getattr(status, name, None) for name in BatchScrapeStatusResponse.__annotations__}
+    fields = {name: value for name, value in fields.items() if value is not None}
+    fields.update(updates)
+    return BatchScrapeStatusResponse(**fields)
+
+class _FanOut:
+    """
+    Maps scrape_many results for canonical URLs back to every input URL, shared by the sync and async clients.
+    """
+    def __init__(self, urls: List[str], mapping: Dict[str, str], ordered: bool) -> None:
+        self.urls = urls
+        self.ordered = ordered
+        self._positions: Dict[str, List[int]] = {}
+        for index, url in enumerate(urls):
+            self._positions.setdefault(mapping[url], []).append(index)
+        self._ready: Dict[int, ScrapeManyResult] = {}
+        self._next = 0
+
+    def add(self, result: ScrapeManyResult) -> List[ScrapeManyResult]:
+        """Returns the results for every input URL of a canonical result that can be yielded now."""
+        results = [
+            ScrapeManyResult(index=index, url=self.urls[index], success=result.success, document=result.document, error=result.error)
+            for index in self._positions[result.url]
+        ]
+        if not self.ordered:
+            return results
+        self._ready.update((result.index, result) for result in results)
+        ready = []
+        while self._next in self._ready:
+            ready.append(self._ready.pop(self._next))
+            self._next += 1
+        return ready
+
+def _map_shards(
+        links: List[str],
+        filter: Optional[Callable[[str], bool]],
+        shard_size: int,
+        canonicalizer: Optional[UrlCanonicalizer]) -> Iterator[List[str]]:
+    """Lazily filters and deduplicates mapped links into shard-sized URL lists."""
+    seen: Set[str] = set()
+    shard: List[str] = []
+    for link in links:
+        if canonicalizer is not None:
+            link = canonicalizer.canonicalize(link)
+        if link in seen or (filter is not None and not filter(link)):
+            continue
+        seen.add(link)
+        shard.append(link)
+        if len(shard) == shard_size:
+            yield shard
+            shard = []
+    if shard:
+        yield shard
+
+def _unseen_documents(docs: List[Dict[str, Any]], seen: Set[str]) -> Iterator[FirecrawlDocument]:
+    """Validates documents, skipping URLs already yielded (a retried shard repeats its pages)."""
+    for doc in docs:
+        metadata = doc.get('metadata')
+        source_url = metadata.get('sourceURL') if isinstance(metadata, Mapping) else None
+        if source_url is not None:
+            if source_url in seen:
+                continue
+            seen.add(source_url)
+        yield _validate_model(FirecrawlDocument, doc)
+
+class _ShardedBatch:
+    """
+    Bookkeeping for a batch scrape split into sub-jobs, shared by the sync and async pollers.
+    """
+    def __init__(
+            self,
+            urls: List[str],
+            shard_size: int,
+            max_concurrent_shards: Optional[int],
+            shard_retries: int,
+            compact_metadata: bool) -> None:
+        self.shards = [
+            BatchScrapeShard(index=index, urls=urls[start:start + shard_size])
+            for index, start in enumerate(range(0, len(urls), shard_size))
+        ]
+        self.active: List[BatchScrapeShard] = []
+        self.shard_retries = shard_retries
+        self._limit = max_concurrent_shards or max(len(self.shards), 1)
+        self._waiting = collections.deque(self.shards)
+        self._docs: Dict[int, List[Dict[str, Any]]] = {shard.index: [] for shard in self.shards}
+        self._table = MetadataTable() if compact_metadata else None
+
+    @property
+    def has_room(self) -> bool:
+        """Whether another shard could start right away."""
+        return len(self.active) + len(self._waiting) < self._limit
+
+    def add_shard(self, urls: List[str]) -> BatchScrapeShard:
+        """Appends a shard, for batches whose URLs arrive incrementally."""
+        shard = BatchScrapeShard(index=len(self.shards), urls=urls)
+        self.shards.append(shard)
+        self._docs[shard.index] = []
+        self._waiting.append(shard)
+        return shard
+
+    @property
+    def done(self) -> bool:
+        return not self._waiting and not self.active
+
+    def to_start(self) -> List[BatchScrapeShard]:
+        """Shards that can be submitted now without exceeding the concurrency limit."""
+        shards = []
+        while self._waiting and len(self.active) + len(shards) < self._limit:
+            shard = self._waiting.popleft()
+            shard.attempts += 1
+            shards.append(shard)
+        return shards
+
+    def started(self, shard: BatchScrapeShard, id: Optional[str]) -> None:
+        if not id:
+            self.fail(shard, 'Batch scrape job failed to start')
+            return
+        shard.id = id
+        shard.status = 'scraping'
+        self.active.append(shard)
+
+    def skip(self, shard: BatchScrapeShard) -> int:
+        """Number of documents already received for a shard."""
+        return len(self._docs[shard.index])
+
+    def record(self, shard: BatchScrapeShard, status_data: Dict[str, Any]) -> bool:
+        """
+        Records one status page of a shard.
+
+        Returns:
+            bool: Whether more pages are available right away
+        """
+        docs = status_data.get('data') or []
+        if self._table is not None:
+            self._table.compact_documents(docs)
+        self._docs[shard.index].extend(docs)
+        shard.status = status_data.get('status', shard.status)
+        shard.completed = status_data.get('completed', shard.completed)
+        shard.total = status_data.get('total', shard.total)
+        shard.creditsUsed = status_data.get('creditsUsed', shard.creditsUsed)
+        expires_at = status_data.get('expiresAt')
+        if isinstance(expires_at, str):
+            shard.expiresAt = datetime.fromisoformat(expires_at.replace('Z', '+00:00'))
+        more = bool(status_data.get('next') and docs)
+        if shard.status == 'completed' and not more:
+            self.active.remove(shard)
+        elif shard.status in ('failed', 'cancelled'):
+            self.fail(shard, status_data.get('error') or f'Shard job {shard.status}')
+            return False
+        return more
+
+    def fail(self, shard: BatchScrapeShard, error: str) -> None:
+        """Marks a shard as failed, queueing it again while it has retries left."""
+        if shard in self.active:
+            self.active.remove(shard)
+        shard.error = error
+        self._docs[shard.index] = []
+        if shard.attempts <= self.shard_retries:
+            logger.warning("Retrying batch scrape shard %s: %s", shard.index, error)
+            shard.id = None
+            shard.status = 'pending'
+            self._waiting.append(shard)
+        else:
+            shard.status = 'failed'
+
+    def result(self) -> BatchScrapeStatusResponse:
+        """Merges all shards into one response, with documents in input URL order."""
+        data = []
+        for shard in self.shards:
+            by_url: Dict[str, collections.deque] = {}
+            leftovers = []
+            for doc in self._docs[shard.index]:
+                metadata = doc.get('metadata') or {}
+                url = metadata.get('sourceURL') or metadata.get('url')
+                if url is None:
+                    leftovers.append(doc)
+                else:
+                    by_url.setdefault(url, collections.deque()).append(doc)
+            for url in shard.urls:
+                docs = by_url.get(url)
+                if docs:
+                    data.append(docs.popleft())
+            for docs in by_url.values():
+                data.extend(docs)
+            data.extend(leftovers)
+        expiries = [shard.expiresAt for shard in self.shards if shard.expiresAt is not None]
+        failed = any(shard.status != 'completed' for shard in self.shards)
+        return _validate_model(BatchScrapeStatusResponse, {
+            'success': not failed,
+            'status': 'failed' if failed else 'completed',
+            'completed': sum(shard.completed for shard in self.shards),
+            'total': sum(shard.total for shard in self.shards),
+            'creditsUsed': sum(shard.creditsUsed for shard in self.shards),
+            'expiresAt': min(expiries) if expiries else datetime.now(),
+            'data': data,
+            'shards': self.shards,
+        })
+
+def _deliver_progress(status: Dict[str, Any], key: str, cursor: int, callback: Callable[[Dict[str, Any]], None]) -> int:
+    """Passes the entries of status[key] past `cursor` to `callback` and returns the new cursor."""
+    items = status.get(key) or []
+    for position in range(cursor, len(items)):
+        callback(items[position])
+    return max(cursor, len(items))
+
+class _AsyncJobPoller:
+    """
+    Runs many server-side jobs (deep research, LLMs.txt) from one polling loop.
+
+    At most `concurrency` jobs run on the server at once; queued inputs are started as
+    jobs finish. Each sweep checks every running job concurrently, then sleeps
+    `poll_interval` seconds. `on_progress(index, status)` sees every status response.
+    """
+    def __init__(
+            self,
+            start: Callable[[str], Any],
+            check: Callable[[str], Any],
+            concurrency: int,
+            poll_interval: float,
+            on_progress: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> None:
+        if concurrency < 1:
+            raise ValueError('concurrency must be at least 1')
+        self.start = start
+        self.check = check
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.on_progress = on_progress
+
+    async def run(self, inputs: List[str]) -> AsyncIterator[Tuple[int, Optional[str], Optional[Dict[str, Any]], Optional[str]]]:
+        """Yields (index, job id, completed status, error) for each input as its job finishes."""
+        pending = collections.deque(enumerate(inputs))
+        running: Dict[int, str] = {}
+        while pending or running:
+            batch = [pending.popleft() for _ in range(min(len(pending), self.concurrency - len(running)))]
+            started = await asyncio.gather(*(self.start(item) for _, item in batch), return_exceptions=True)
+            for (index, _), response in zip(batch, started):
+                if isinstance(response, Exception):
+                    yield index, None, None, str(response)
+                elif not response.get('success') or not response.get('id'):
+                    yield index, None, None, response.get('error') or 'Failed to start job'
+                else:
+                    running[index] = response['id']
+            if not running:
+                continue
+
+            statuses = await asyncio.gather(*(self.check(job_id) for job_id in running.values()), return_exceptions=True)
+            for (index, job_id), status in zip(list(running.items()), statuses):
+                if isinstance(status, Exception):
+                    del running[index]
+                    yield index, job_id, None, str(status)
+                    continue
+                if self.on_progress is not None:
+                    self.on_progress(index, status)
+                state = status.get('status')
+                if state == 'completed':
+                    del running[index]
+                    yield index, job_id, status, None
+                elif state != 'processing':
+                    del running[index]
+                    yield index, job_id, None, status.get('error') or f'Job {state}'
+            if running:
+                await asyncio.sleep(self.poll_interval)
+
+def _iterate_async(iterator: AsyncIterator[Any]) -> Iterator[Any]:
+    """
+    Iterates an async iterator from synchronous code on a private event loop.
+
+    Must not be called from a thread that is already running an event loop.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(iterator.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        try:
+            loop.run_until_complete(iterator.aclose())
+        finally:
+            loop.close()
+
+class _SSEParser:
+    """Incremental text/event-stream parser: feed it lines, get back (event, data) once an event is complete."""
+    def __init__(self) -> None:
+        self._event: Optional[str] = None
+        self._data: List[str] = []
+
+    def feed(self, line: str) -> Optional[Tuple[str, str]]:
+        line = line.rstrip('\r\n')
+        if not line:
+            event, data = self._event or 'message', self._data
+            self._event, self._data = None, []
+            return (event, '\n'.join(data)) if data else None
+        if line.startswith(':'):
+            return None
+        field, _, value = line.partition(':')
+        if value.startswith(' '):
+            value = value[1:]
+        if field == 'event':
+            self._event = value
+        elif field == 'data':
+            self._data.append(value)
+        return None
+
+class _JobStream:
+    """
+    Turns deep research / LLMs.txt status snapshots into incremental events.
+
+    Emits ('activity', activity) and ('source', source) for entries not seen before,
+    ('text', {'delta', 'text'}) when the generated LLMs.txt grows, then ('done', status)
+    or ('error', status) once the job leaves the processing state.
+    """
+    STEP_EVENTS = ('activity', 'source', 'text')
+
+    def __init__(self) -> None:
+        self.activities = 0
+        self.sources = 0
+        self.text = ''
+        self.finished = False
+
+    def update(self, status: Dict[str, Any]) -> List[Tuple[str, Any]]:
+        """Returns the events a status snapshot adds to what was already emitted."""
+        events: List[Tuple[str, Any]] = []
+        data = status.get('data') if isinstance(status.get('data'), dict) else {}
+        self.activities = _deliver_progress(status, 'activities', self.activities, lambda item: events.append(('activity', item)))
+        self.sources = _deliver_progress(status, 'sources', self.sources, lambda item: events.append(('source', item)))
+        text = data.get('llmstxt')
+        if isinstance(text, str) and text != self.text:
+            delta = text[len(self.text):] if text.startswith(self.text) else text
+            events.append(('text', {'delta': delta, 'text': text}))
+            self.text = text
+        state = status.get('status')
+        if state == 'completed':
+            events.append(('done', status))
+        elif state != 'processing':
+            events.append(('error', status))
+        self.finished = state != 'processing'
+        return events
+
+    def update_sse(self, event: str, payload: str) -> List[Tuple[str, Any]]:
+        """Returns the events of one server-sent event: a step event, or a status snapshot otherwise."""
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            return []
+        if event in self.STEP_EVENTS:
+            # Count step events so later snapshots do not repeat them
+            if event == 'activity':
+                self.activities += 1
+            elif event == 'source':
+                self.sources += 1
+            elif isinstance(data, dict) and isinstance(data.get('text'), str):
+                self.text = data['text']
+            return [(event, data)]
+        if isinstance(data, dict) and 'status' in data:
+            return self.update(data)
+        return []
+
+class _SchedulerWaiter:
+    __slots__ = ('rank', 'seq', 'priority', 'event', 'loop', 'future')
+
+    def __init__(self, rank: int, seq: int, priority: str) -> None:
+        self.rank = rank
+        self.seq = seq
+        self.priority = priority
+        self.event: Optional[threading.Event] = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.future: Optional[asyncio.Future] = None
+
+class RequestScheduler:
+    """
+    Priority-aware admission control for the HTTP requests of a client.
+
+    Every request waits for a slot before it is sent. Slots go to the highest priority
+    class first, and each class can use at most its own share of the total capacity,
+    so a flood of background work (status polls, batch scrapes, extracts) cannot delay
+    interactive calls such as scrape_url or search by more than one service time.
+    Classes are listed from highest to lowest priority.
+
+    Attach a scheduler to a client with ``app.scheduler = RequestScheduler()``. One
+    scheduler can be shared between several clients, sync or async.
+
+    Attributes:
+        max_concurrency (int): Requests in flight across all classes
+        limits (Dict[str, int]): Requests in flight per priority class
+        wait (Dict[str, LatencyHistogram]): Time spent queued, per class
+        service (Dict[str, LatencyHistogram]): Time from admission to response, per class
+    """
+    INTERACTIVE_PATHS = ('/v1/scrape', '/v1/search', '/v1/map')
+    BACKGROUND_PATHS = ('/v1/batch/scrape', '/v1/crawl', '/v1/extract', '/v1/deep-research', '/v1/llmstxt')
+
+    def __init__(
+            self,
+            max_concurrency: int = 8,
+            limits: Optional[Dict[str, int]] = None,
+            classify: Optional[Callable[[str, str], str]] = None) -> None:
+        """
+        Args:
+            max_concurrency (int): Requests in flight across all classes
+            limits (Optional[Dict[str, int]]): Per-class limits, highest priority first.
+                Defaults to interactive and default at full capacity and background at half.
+            classify (Optional[Callable[[str, str], str]]): Maps (method, url) to a class name,
+                replacing the endpoint based default
+
+        Raises:
+            ValueError: If a limit is not positive
+        """
+        if limits is None:
+            limits = {
+                'interactive': max_concurrency,
+                'default': max_concurrency,
+                'background': max(1, max_concurrency // 2),
+            }
+        if max_concurrency < 1 or not limits or any(limit < 1 for limit in limits.values()):
+            raise ValueError('Scheduler limits must be positive')
+        self.max_concurrency = max_concurrency
+        self.limits = dict(limits)
+        self._ranks = {name: rank for rank, name in enumerate(self.limits)}
+        self._classify = classify
+        self._override: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar('firecrawl_priority', default=None)
+        self._lock = threading.Lock()
+        self._active = {name: 0 for name in self.limits}
+        self._in_flight = 0
+        self._waiting: List[_SchedulerWaiter] = []
+        self._seq = 0
+        self.wait = {name: LatencyHistogram() for name in self.limits}
+        self.service = {name: LatencyHistogram() for name in self.limits}
+
+    def classify(self, method: str, url: str) -> str:
+        """
+        Returns the priority class of a request.
+
+        A class set with priority() takes precedence. Otherwise scrape, search and map
+        requests are interactive, job submissions and every GET (status polls) are
+        background, and anything else is default. Unknown class names fall back to
+        the lowest priority class.
+        """
+        name = self._override.get()
+        if name is None:
+            if self._classify is not None:
+                name = self._classify(method, url)
+            else:
+                path = urllib.parse.urlsplit(url).path.rstrip('/')
+                if method.upper() == 'GET' or path.startswith(self.BACKGROUND_PATHS):
+                    name = 'background'
+                elif path in self.INTERACTIVE_PATHS:
+                    name = 'interactive'
+                else:
+                    name = 'default'
+        if name not in self.limits:
+            name = next(reversed(self.limits))
+        return name
+
+    @contextlib.contextmanager
+    def priority(self, name: str) -> Iterator[None]:
+        """
+        Runs every request made inside the block (in this thread or task) in the given class.
+
+        Raises:
+            ValueError: If the class is unknown
+        """
+        if name not in self.limits:
+            raise ValueError(f"Unknown priority class: {name}")
+        token = self._override.set(name)
+        try:
+            yield
+        finally:
+            self._override.reset(token)
+
+    def _enqueue(self, priority: str) -> Optional[_SchedulerWaiter]:
+        """
+        Takes a slot right away when one is free, else queues a waiter. Call with the lock held.
+
+        Every release admits all runnable waiters, so a free slot for this class means
+        nothing queued ahead of the request could use it.
+        """
+        if self._can_run(priority):
+            self._take(priority)
+            return None
+        self._seq += 1
+        waiter = _SchedulerWaiter(self._ranks[priority], self._seq, priority)
+        index = len(self._waiting)
+        while index and (self._waiting[index - 1].rank, self._waiting[index - 1].seq) > (waiter.rank, waiter.seq):
+            index -= 1
+        self._waiting.insert(index, waiter)
+        return waiter
+
+    def _can_run(self, priority: str) -> bool:
+        return self._in_flight < self.max_concurrency and self._active[priority] < self.limits[priority]
+
+    def _take(self, priority: str) -> None:
+        self._in_flight += 1
+        self._active[priority] += 1
+
+    def _release(self, priority: str) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            self._active[priority] -= 1
+            self._grant()
+
+    def _grant(self) -> None:
+        """Admits queued waiters in priority order, skipping classes at their limit. Call with the lock held."""
+        index = 0
+        while index < len(self._waiting) and self._in_flight < self.max_concurrency:
+            waiter = self._waiting[index]
+            if not self._can_run(waiter.priority):
+                index += 1
+                continue
+            del self._waiting[index]
+            self._take(waiter.priority)
+            if waiter.event is not None:
+                waiter.event.set()
+            else:
+                waiter.loop.call_soon_threadsafe(self._wake, waiter)
+
+    def _wake(self, waiter: _SchedulerWaiter) -> None:
+        if waiter.future.done():
+            # The waiting task was cancelled after the slot was granted
+            self._release(waiter.priority)
+        else:
+            waiter.future.set_result(None)
+
+    @contextlib.contextmanager
+    def slot(self, method: str, url: str) -> Iterator[str]:
+        """
+        Blocks until the request may be sent and holds the slot for the duration of the block.
+
+        Yields:
+            str: The priority class of the request
+        """
+        priority = self.classify(method, url)
+        queued = time.perf_counter()
+        with self._lock:
+            waiter = self._enqueue(priority)
+            if waiter is not None:
+                waiter.event = threading.Event()
+        if waiter is not None:
+            waiter.event.wait()
+        started = time.perf_counter()
+        self.wait[priority].record(started - queued)
+        try:
+            yield priority
+        finally:
+            self.service[priority].record(time.perf_counter() - started)
+            self._release(priority)
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self, method: str, url: str) -> AsyncIterator[str]:
+        """
+        Async counterpart of slot(); waiting does not block the event loop.
+
+        Yields:
+            str: The priority class of the request
+        """
+        priority = self.classify(method, url)
+        queued = time.perf_counter()
+        with self._lock:
+            waiter = self._enqueue(priority)
+            if waiter is not None:
+                waiter.loop = asyncio.get_running_loop()
+                waiter.future = waiter.loop.create_future()
+        if waiter is not None:
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                with self._lock:
+                    if waiter in self._waiting:
+                        self._waiting.remove(waiter)
+                        raise
+                # Granted concurrently. _wake releases the slot if it runs after the
+                # cancellation; if it already handed the slot over, release it here.
+                if not waiter.future.cancel() and not waiter.future.cancelled():
+                    self._release(priority)
+                raise
+        started = time.perf_counter()
+        self.wait[priority].record(started - queued)
+        try:
+            yield priority
+        finally:
+            self.service[priority].record(time.perf_counter() - started)
+            self._release(priority)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns queue-wait and service time per priority class.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per class: limit, active and queued requests,
+            and wait and service histogram summaries
+        """
+        with self._lock:
+            queued = collections.Counter(waiter.priority for waiter in self._waiting)
+            return {
+                name: {
+                    'limit': limit,
+                    'active': self._active[name],
+                    'queued': queued[name],
+                    'wait': self.wait[name].to_dict(),
+                    'service': self.service[name].to_dict(),
+                }
+                for name, limit in self.limits.items()
+            }
+
+class _LogFields:
+    """Request log fields, rendered as key=value pairs or JSON only when a handler formats the record."""
+    __slots__ = ('fields', 'format')
+
+    def __init__(self, fields: Dict[str, Any], format: str) -> None:
+        self.fields = fields
+        self.format = format
+
+    def __str__(self) -> str:
+        if self.format == 'json':
+            return json.dumps(self.fields, separators=(',', ':'))
+        return ' '.join(f'{key}={value}' for key, value in self.fields.items() if value is not None)
+
+class RequestLogger:
+    """
+    Structured per-request logging for FirecrawlApp and AsyncFirecrawlApp.
+
+    Assign one to `app.request_logger`. Each HTTP request is logged with its method,
+    endpoint, status, response bytes and elapsed time. Messages are only rendered when
+    a handler emits them, and the fields are also attached to the record as
+    `record.firecrawl` for structured handlers. Requests are not timed at all while
+    the logger is disabled for both levels.
+
+    Args:
+        logger (Optional[logging.Logger]): Logger to write to (default: "firecrawl.requests")
+        format (Literal["kv", "json"]): Render messages as key=value pairs or JSON
+        level (int): Level for successful requests
+        error_level (int): Level for failed requests (exceptions and HTTP errors)
+        sample_rate (float): Fraction of successful requests to log
+        slow_after (Optional[float]): Always log requests slower than this many seconds
+    """
+    def __init__(
+            self,
+            logger: Optional[logging.Logger] = None,
+            *,
+            format: Literal["kv", "json"] = "kv",
+            level: int = logging.INFO,
+            error_level: int = logging.WARNING,
+            sample_rate: float = 1.0,
+            slow_after: Optional[float] = None) -> None:
+        if format not in ('kv', 'json'):
+            raise ValueError("format must be 'kv' or 'json'")
+        if not 0 <= sample_rate <= 1:
+            raise ValueError('sample_rate must be between 0 and 1')
+        self.logger = logger or logging.getLogger('firecrawl.requests')
+        self.format = format
+        self.level = level
+        self.error_level = error_level
+        self.sample_rate = sample_rate
+        self.slow_after = slow_after
+
+    def active(self) -> bool:
+        """Whether any request could be logged at the logger's current level."""
+        return self.logger.isEnabledFor(min(self.level, self.error_level))
+
+    def record(
+            self,
+            method: str,
+            url: str,
+            status: Optional[int],
+            size: Optional[int],
+            elapsed: float,
+            error: Optional[BaseException] = None) -> None:
+        """Logs one request, subject to the level and sampling settings."""
+        failed = error is not None or status is None or status >= 400
+        level = self.error_level if failed else self.level
+        if not self.logger.isEnabledFor(level):
+            return
+        if not failed and self.sample_rate < 1 and (self.slow_after is None or elapsed < self.slow_after):
+            if random.random() >= self.sample_rate:
+                return
+        fields = {
+            'method': method.upper(),
+            'endpoint': urllib.parse.urlsplit(url).path,
+            'status': status,
+            'bytes': size,
+            'elapsed_ms': round(elapsed * 1000, 1),
+        }
+        if error is not None:
+            fields['error'] = f'{type(error).__name__}: {error}'
+        self.logger.log(level, '%s', _LogFields(fields, self.format), extra={'firecrawl': fields})
+
+def _response_size(response: requests.Response, streamed: bool) -> Optional[int]:
+    """Returns the body size without consuming a streamed body."""
+    length = response.headers.get('Content-Length')
+    if length is not None:
+        return int(length)
+    if streamed:
+        return None
+    content = response.content
+    return len(content) if isinstance(content, (bytes, str)) else None
+
+class _WrappedHttp:
+    """Base for HTTP backend wrappers; subclasses implement request()."""
+    def __init__(self, http: Any) -> None:
+        self._http = http
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return getattr(self._http, method)(url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('get', url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('post', url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request('delete', url, **kwargs)
+
+class _ScheduledHttp(_WrappedHttp):
+    """Sends requests through the HTTP backend of a client once the scheduler admits them."""
+    def __init__(self, http: Any, scheduler: RequestScheduler) -> None:
+        super().__init__(http)
+        self._scheduler = scheduler
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        with self._scheduler.slot(method, url):
+            return super().request(method, url, **kwargs)
+
+class _LoggedHttp(_WrappedHttp):
+    """Sends requests through the HTTP backend of a client and reports each one to a RequestLogger."""
+    def __init__(self, http: Any, request_logger: RequestLogger) -> None:
+        super().__init__(http)
+        self._request_logger = request_logger
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, **kwargs)
+        except Exception as e:
+            self._request_logger.record(method, url, None, None, time.perf_counter() - start, e)
+            raise
+        elapsed = time.perf_counter() - start
+        self._request_logger.record(method, url, response.status_code, _response_size(response, kwargs.get('stream', False)), elapsed)
+        return response
+
+class RequestTimings:
+    """
+    Where the time of one HTTP request went, in seconds.
+
+    Phases that could not be measured are None: the sync client cannot separate
+    connection setup from TTFB, and decode is None when a body was validated straight
+    from its bytes (the decode is then part of validate). decode and validate are
+    filled in after the request hook has fired, once the SDK parses the body.
+
+    Attributes:
+        queue (Optional[float]): Wait for a RequestScheduler slot
+        connect (Optional[float]): DNS, TCP and TLS setup of a new connection (async client only)
+        ttfb (Optional[float]): From sending the request to the response headers, excluding connect
+        download (Optional[float]): Reading the response body
+        decode (Optional[float]): Parsing the body as JSON
+        validate (Optional[float]): Validating the result into the response model
+        retries (int): Attempts that preceded this one
+        polls (Optional[int]): For job status checks, the number of checks of this job so far
+        waited (Optional[float]): For job status checks, seconds since the first check of this job
+    """
+    __slots__ = ('queue', 'connect', 'ttfb', 'download', 'decode', 'validate', 'retries', 'polls', 'waited')
+
+    PHASES = ('queue', 'connect', 'ttfb', 'download', 'decode', 'validate')
+
+    def __init__(self, retries: int = 0) -> None:
+        self.queue: Optional[float] = None
+        self.connect: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.download: Optional[float] = None
+        self.decode: Optional[float] = None
+        self.validate: Optional[float] = None
+        self.retries = retries
+        self.polls: Optional[int] = None
+        self.waited: Optional[float] = None
+
+    @property
+    def total(self) -> float:
+        """Sum of the measured phases."""
+        return sum(getattr(self, phase) or 0.0 for phase in self.PHASES)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable summary."""
+        return {
+            **{phase: getattr(self, phase) for phase in self.PHASES},
+            'total': self.total,
+            'retries': self.retries,
+            'polls': self.polls,
+            'waited': self.waited,
+        }
+
+    def __repr__(self) -> str:
+        phases = ', '.join(f'{phase}={getattr(self, phase) * 1000:.1f}ms' for phase in self.PHASES if getattr(self, phase) is not None)
+        return f'RequestTimings({phases}, retries={self.retries})'
+
+class RequestTrace:
+    """
+    One HTTP request attempt, as seen by RequestHooks.
+
+    Attributes:
+        method (str): HTTP method, upper case
+        url (str): Request URL
+        endpoint (str): URL path, e.g. "/v1/scrape"
+        attempt (int): Zero-based attempt number; retries of a request get a new trace
+        status (Optional[int]): HTTP status, once the response headers arrived
+        error (Optional[BaseException]): Transport error that ended the attempt
+        timings (RequestTimings): Timing breakdown, also attached to the response
+        job_id (Optional[str]): Job id, for job status checks
+        context (Dict[str, Any]): Free-form state for hooks, e.g. an open span
+    """
+    __slots__ = ('method', 'url', 'endpoint', 'attempt', 'status', 'error', 'timings', 'job_id', 'context', '_payload')
+
+    def __init__(self, method: str, url: str, attempt: int = 0) -> None:
+        self.method = method.upper()
+        self.url = url
+        self.endpoint = urllib.parse.urlsplit(url).path
+        self.attempt = attempt
+        self.status: Optional[int] = None
+        self.error: Optional[BaseException] = None
+        self.timings = RequestTimings(attempt)
+        self.job_id: Optional[str] = None
+        self.context: Dict[str, Any] = {}
+        # The decoded (or raw) response body; only a model validated from it gets the timings
+        self._payload: Any = None
+
+class RequestHooks:
+    """
+    Callbacks around every HTTP request of FirecrawlApp and AsyncFirecrawlApp.
+
+    Subclass and override any of the methods, then assign an instance to `app.hooks`.
+    For each attempt, on_request_start fires once any scheduler slot is granted and
+    on_request_end once the response headers and body arrived or the attempt failed.
+    on_job_poll follows on_request_end for status checks of crawl, batch scrape,
+    extract, deep research and LLMs.txt jobs, and on_retry fires before a failed
+    attempt is retried. Hooks run on the calling thread or event loop, so they should
+    return quickly; exceptions they raise propagate to the caller.
+    """
+    def on_request_start(self, trace: RequestTrace) -> None:
+        """Called before a request attempt is sent."""
+
+    def on_request_end(self, trace: RequestTrace) -> None:
+        """Called when a request attempt completed or failed."""
+
+    def on_retry(self, trace: RequestTrace) -> None:
+        """Called with the trace of a failed attempt that is about to be retried."""
+
+    def on_job_poll(self, trace: RequestTrace) -> None:
+        """Called after a job status check; trace.job_id and trace.timings.polls identify it."""
+
+class OpenTelemetryHooks(RequestHooks):
+    """
+    RequestHooks that record each request attempt as an OpenTelemetry client span.
+
+    Spans carry the HTTP method, URL and status, and the timing breakdown as
+    `firecrawl.timing.<phase>_ms` attributes. Retries and job polls are added as
+    events to the span that is current in the caller's context. Requires the
+    opentelemetry-api package.
+
+    Args:
+        tracer (Optional[Any]): Tracer to create spans with (default: the global tracer provider's "firecrawl" tracer)
+    """
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        try:
+            from opentelemetry import trace as otel_trace
+        except ImportError as e:
+            raise ImportError('OpenTelemetryHooks requires the opentelemetry-api package') from e
+        self._otel = otel_trace
+        self.tracer = tracer if tracer is not None else otel_trace.get_tracer('firecrawl', get_version())
+
+    def on_request_start(self, trace: RequestTrace) -> None:
+        trace.context['span'] = self.tracer.start_span(
+            f'{trace.method} {trace.endpoint}',
+            kind=self._otel.SpanKind.CLIENT,
+            attributes={
+                'http.request.method': trace.method,
+                'url.full': trace.url,
+                'server.address': urllib.parse.urlsplit(trace.url).hostname or '',
+                'http.request.resend_count': trace.attempt,
+            },
+        )
+
+    def on_request_end(self, trace: RequestTrace) -> None:
+        span = trace.context.pop('span', None)
+        if span is None:
+            return
+        if trace.status is not None:
+            span.set_attribute('http.response.status_code', trace.status)
+        for phase in RequestTimings.PHASES:
+            value = getattr(trace.timings, phase)
+            if value is not None:
+                span.set_attribute(f'firecrawl.timing.{phase}_ms', value * 1000)
+        if trace.error is not None:
+            span.record_exception(trace.error)
+            span.set_status(self._otel.Status(self._otel.StatusCode.ERROR, type(trace.error).__name__))
+        elif trace.status is not None and trace.status >= 400:
+            span.set_status(self._otel.Status(self._otel.StatusCode.ERROR))
+        span.end()
+
+    def on_retry(self, trace: RequestTrace) -> None:
+        self._otel.get_current_span().add_event('firecrawl.retry', {
+            'http.request.method': trace.method,
+            'url.full': trace.url,
+            'firecrawl.attempt': trace.attempt,
+            'http.response.status_code': trace.status or 0,
+        })
+
+    def on_job_poll(self, trace: RequestTrace) -> None:
+        self._otel.get_current_span().add_event('firecrawl.job_poll', {
+            'firecrawl.job_id': trace.job_id,
+            'firecrawl.polls': trace.timings.polls,
+            'firecrawl.waited_ms': trace.timings.waited * 1000,
+        })
+
+# The trace of the last response in this context, until a model validated from its body consumes its timings
+_last_trace: contextvars.ContextVar[Optional[RequestTrace]] = contextvars.ContextVar('firecrawl_last_trace', default=None)
+# Attempt number of the next request sent from a sync retry loop in this context
+_retry_attempt: contextvars.ContextVar[int] = contextvars.ContextVar('firecrawl_retry_attempt', default=0)
+
+def _take_trace(data: Any) -> Optional[RequestTrace]:
+    """
+    Returns and clears the last trace of this context if `data` is its response body
+    (or the body's `data` member). Data from any other source, such as an earlier
+    response or a helper building models itself, never picks up a request's timings.
+    """
+    trace = _last_trace.get()
+    if trace is None:
+        return None
+    payload = trace._payload
+    if data is not payload and not (isinstance(payload, dict) and data is payload.get('data')):
+        return None
+    _last_trace.set(None)
+    return trace
+
+def _attach_timings(trace: RequestTrace, result: Any, elapsed: float) -> None:
+    """Adds validation time to a response's timings and exposes them as `result.timings`."""
+    timings = trace.timings
+    timings.validate = (timings.validate or 0.0) + elapsed
+    # Set around pydantic so the attribute stays out of dumps and equality; v1 dumps __dict__
+    if PYDANTIC_V2 and isinstance(result, pydantic.BaseModel):
+        object.__setattr__(result, 'timings', timings)
+
+class _JobPolls:
+    """Counts the status checks of each job, bounded to the most recently polled jobs."""
+    STATUS_PATH = re.compile(r'^/v1/(?:crawl|batch/scrape|extract|deep-research|llmstxt)/([^/]+)/?$')
+
+    def __init__(self, capacity: int = 1024) -> None:
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._jobs: 'collections.OrderedDict[str, Tuple[int, float]]' = collections.OrderedDict()
+
+    def observe(self, trace: RequestTrace) -> bool:
+        """Records `trace` if it is a job status check and returns whether it was."""
+        if trace.method != 'GET' or trace.status is None or trace.status >= 400:
+            return False
+        match = self.STATUS_PATH.match(trace.endpoint)
+        if match is None:
+            return False
+        now = time.monotonic()
+        key = trace.endpoint.rstrip('/')
+        with self._lock:
+            polls, first = self._jobs.pop(key, (0, now))
+            self._jobs[key] = (polls + 1, first)
+            if len(self._jobs) > self.capacity:
+                self._jobs.popitem(last=False)
+        trace.job_id = match.group(1)
+        trace.timings.polls = polls + 1
+        trace.timings.waited = now - first
+        return True
+
+def _end_trace(hooks: RequestHooks, job_polls: _JobPolls, trace: RequestTrace) -> None:
+    """Reports a finished attempt, and the job poll it may have been, to the hooks."""
+    hooks.on_request_end(trace)
+    if job_polls.observe(trace):
+        hooks.on_job_poll(trace)
+
+def _timed_json(json_method: Callable[..., Any], trace: RequestTrace) -> Callable[..., Any]:
+    """Wraps `response.json` so the time spent decoding is added to the trace's `decode` timing."""
+    def json(**kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            trace._payload = json_method(**kwargs)
+            return trace._payload
+        finally:
+            trace.timings.decode = (trace.timings.decode or 0.0) + time.perf_counter() - start
+    return json
+
+class _TracedHttp(_WrappedHttp):
+    """
+    Sends requests through the HTTP backend of a client, timing each one for RequestHooks.
+
+    Takes over the scheduler slot from _ScheduledHttp so the queue wait can be measured.
+    """
+    def __init__(self, http: Any, hooks: RequestHooks, scheduler: Optional[RequestScheduler], job_polls: _JobPolls) -> None:
+        super().__init__(http)
+        self._hooks = hooks
+        self._scheduler = scheduler
+        self._job_polls = job_polls
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        trace = RequestTrace(method, url, _retry_attempt.get())
+        _retry_attempt.set(0)
+        if self._scheduler is None:
+            return self._send(trace, method, url, kwargs)
+        queued = time.perf_counter()
+        with self._scheduler.slot(method, url):
+            trace.timings.queue = time.perf_counter() - queued
+            return self._send(trace, method, url, kwargs)
+
+    def _send(self, trace: RequestTrace, method: str, url: str, kwargs: Dict[str, Any]) -> requests.Response:
+        timings = trace.timings
+        self._hooks.on_request_start(trace)
+        start = time.perf_counter()
+        try:
+            response = super().request(method, url, **kwargs)
+        except Exception as e:
+            timings.ttfb = time.perf_counter() - start
+            trace.error = e
+            _end_trace(self._hooks, self._job_polls, trace)
+            raise
+        elapsed = time.perf_counter() - start
+        # requests stamps `elapsed` when the headers arrive and reads the body afterwards
+        headers = getattr(response, 'elapsed', None)
+        if isinstance(headers, timedelta) and not kwargs.get('stream', False):
+            timings.ttfb = min(headers.total_seconds(), elapsed)
+            timings.download = elapsed - timings.ttfb
+        else:
+            timings.ttfb = elapsed
+        trace.status = response.status_code
+        response.timings = timings
+        response.json = _timed_json(response.json, trace)
+        _last_trace.set(trace)
+        _end_trace(self._hooks, self._job_polls, trace)
+        return response
+
+@functools.lru_cache(maxsize=None)
+def _connect_trace_config() -> 'aiohttp.TraceConfig':
+    """An aiohttp trace config that adds connection setup time to the RequestTimings passed as trace_request_ctx."""
+    async def on_start(session: Any, context: Any, params: Any) -> None:
+        context.connect_start = time.perf_counter()
+
+    async def on_end(session: Any, context: Any, params: Any) -> None:
+        timings = context.trace_request_ctx
+        if isinstance(timings, RequestTimings):
+            timings.connect = (timings.connect or 0.0) + time.perf_counter() - context.connect_start
+
+    config = aiohttp.TraceConfig()
+    config.on_connection_create_start.append(on_start)
+    config.on_connection_create_end.append(on_end)
+    return config
+
+def _trace_configs(hooks: Optional[RequestHooks]) -> Optional[List['aiohttp.TraceConfig']]:
+    """Trace configs for the aiohttp sessions of a client, so connect time is measured when hooks are set."""
+    return [_connect_trace_config()] if hooks is not None else None
+
+class _HostState:
+    __slots__ = ('queue', 'active', 'limit', 'delay', 'next_start', 'outcomes', 'latency', 'last_decrease')
+
+    def __init__(self, limit: int, window: int) -> None:
+        self.queue: collections.deque = collections.deque()
+        self.active = 0
+        self.limit = float(limit)
+        self.delay = 0.0
+        self.next_start = 0.0
+        self.outcomes: collections.deque = collections.deque(maxlen=window)
+        self.latency = 0.0
+        self.last_decrease = 0.0
+
+class DomainDispatcher:
+    """
+    Per-host politeness for client-side fan-out such as scrape_many.
+
+    Queued jobs are taken round-robin across hosts, so one large domain cannot starve
+    the others, and each host has its own concurrency cap. The cap and a delay between
+    request starts adapt per host (AIMD): when the recent error rate or the smoothed
+    latency of a host crosses its threshold, its cap is halved, and once the cap is down
+    to one request its delay is doubled instead; healthy responses grow the cap back by
+    one request per round trip and shrink the delay again.
+
+    Host state is kept between calls, so a dispatcher passed to several scrape_many
+    calls of the same client keeps what it has learned about each site.
+
+    Attributes:
+        max_per_host (int): Upper bound for the concurrency cap of a host
+        min_delay (float): Seconds between request starts on a healthy host
+        max_delay (float): Upper bound for the delay of a throttled host
+        error_threshold (float): Error rate over the last `window` responses that triggers a slowdown
+        slow_after (Optional[float]): Smoothed latency in seconds that triggers a slowdown
+    """
+    # Target-site status codes that indicate throttling or blocking
+    BLOCKED_STATUS_CODES = (403, 429)
+    # Firecrawl API status codes that report a failure of the scraped site (timeout, failed scrape)
+    SITE_ERROR_STATUS_CODES = (408, 500)
+
+    def __init__(
+            self,
+            max_per_host: int = 2,
+            *,
+            min_delay: float = 0.0,
+            max_delay: float = 30.0,
+            backoff: float = 0.5,
+            error_threshold: float = 0.2,
+            slow_after: Optional[float] = None,
+            window: int = 20) -> None:
+        """
+        Args:
+            max_per_host (int): Upper bound for the concurrency cap of a host
+            min_delay (float): Seconds between request starts on a healthy host
+            max_delay (float): Upper bound for the delay of a throttled host
+            backoff (float): Delay in seconds after the first slowdown of a host
+            error_threshold (float): Error rate over the last `window` responses that triggers a slowdown
+            slow_after (Optional[float]): Smoothed latency in seconds that triggers a slowdown
+            window (int): Number of recent responses per host used for the error rate
+
+        Raises:
+            ValueError: If max_per_host or window is not positive
+        """
+        if max_per_host < 1 or window < 1:
+            raise ValueError('max_per_host and window must be positive')
+        self.max_per_host = max_per_host
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.backoff = backoff
+        self.error_threshold = error_threshold
+        self.slow_after = slow_after
+        self.window = window
+        self._hosts: Dict[str, _HostState] = {}
+        self._ring: collections.deque = collections.deque()
+        self._cond = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = []
+
+    @staticmethod
+    def host(url: str) -> str:
+        return (urllib.parse.urlsplit(url).hostname or '').lower()
+
+    @classmethod
+    def is_healthy(cls, document: Optional[Any]) -> bool:
+        """Whether a scrape result shows the target site serving normally."""
+        if document is None:
+            return False
+        metadata = getattr(document, 'metadata', None)
+        status = metadata.get('statusCode') if isinstance(metadata, Mapping) else None
+        return not (isinstance(status, int) and (status in cls.BLOCKED_STATUS_CODES or status >= 500))
+
+    @classmethod
+    def is_site_error(cls, error: BaseException) -> bool:
+        """
+        Whether a failed scrape reflects on the target site rather than on the Firecrawl API.
+
+        Authentication, billing and API rate-limit responses and connection errors to the
+        API say nothing about the site, so they should not slow its host down.
+        """
+        response = getattr(error, 'response', None)
+        status = getattr(response, 'status_code', None) if response is not None else getattr(error, 'status', None)
+        if isinstance(status, int):
+            return status in cls.SITE_ERROR_STATUS_CODES
+        # Without a status, only a scrape the API reported as failed counts. The async
+        # exception types are only checked once the async client has imported them.
+        transport = [requests.exceptions.RequestException, TimeoutError]
+        if not isinstance(aiohttp, _LazyModule):
+            transport.append(aiohttp.ClientError)
+        if not isinstance(asyncio, _LazyModule):
+            transport.append(asyncio.TimeoutError)
+        return not isinstance(error, tuple(transport))
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.max_per_host, self.window)
+        return state
+
+    def put(self, url: str, job: Callable[[], Any]) -> None:
+        """
+        Queues a job for the host of `url`.
+
+        Args:
+            url (str): URL the job requests
+            job (Callable[[], Any]): Returns (or, for work_async, resolves to) True on a healthy
+                response, False on an error, or None when it was skipped
+        """
+        host = self.host(url)
+        with self._cond:
+            state = self._state(host)
+            if not state.queue:
+                self._ring.append(host)
+            state.queue.append(job)
+            self._notify()
+
+    def discard(self, jobs: List[Callable[[], Any]]) -> None:
+        """Removes jobs that have not started yet from the queue."""
+        ids = set(map(id, jobs))
+        with self._cond:
+            for host in list(self._ring):
+                state = self._hosts[host]
+                state.queue = collections.deque(job for job in state.queue if id(job) not in ids)
+                if not state.queue:
+                    self._ring.remove(host)
+            self._notify()
+
+    def _take(self) -> Tuple[Optional[Tuple[str, Callable[[], Any]]], Optional[float]]:
+        """
+        Takes the next job round-robin across hosts. Call with the lock held.
+
+        Returns:
+            Tuple: ((host, job), None) when a job may start, (None, seconds) to wait for
+            a host delay or a free slot (inf), or (None, None) when nothing is queued
+        """
+        if not self._ring:
+            return None, None
+        now = time.monotonic()
+        wait = float('inf')
+        for _ in range(len(self._ring)):
+            host = self._ring[0]
+            self._ring.rotate(-1)
+            state = self._hosts[host]
+            if state.active >= int(state.limit):
+                continue
+            if state.next_start > now:
+                wait = min(wait, state.next_start - now)
+                continue
+            job = state.queue.popleft()
+            if not state.queue:
+                self._ring.remove(host)
+            state.active += 1
+            state.next_start = now + state.delay
+            return (host, job), None
+        return None, wait
+
+    def release(self, host: str, success: Optional[bool], latency: float = 0.0) -> None:
+        """
+        Records the outcome of a job taken from `host` and adapts its cap and delay.
+
+        Args:
+            host (str): Host returned with the job
+            success (Optional[bool]): Outcome of the job; None for skipped jobs
+            latency (float): Seconds the job took
+        """
+        with self._cond:
+            state = self._hosts[host]
+            state.active -= 1
+            if success is not None:
+                state.outcomes.append(success)
+                state.latency = latency if not state.latency else 0.8 * state.latency + 0.2 * latency
+                error_rate = state.outcomes.count(False) / len(state.outcomes)
+                slow = self.slow_after is not None and state.latency > self.slow_after
+                now = time.monotonic()
+                if (not success and error_rate > self.error_threshold) or slow:
+                    # Back off at most once per round trip, not once per in-flight failure
+                    if now - state.last_decrease >= state.latency:
+                        state.last_decrease = now
+                        if state.limit >= 2:
+                            state.limit = state.limit / 2
+                        else:
+                            # Already down to one request at a time: space requests out
+                            state.delay = min(self.max_delay, max(state.delay * 2, self.backoff))
+                            state.next_start = now + state.delay
+                        logger.debug("Slowing down %s: limit %d, delay %.2fs", host, state.limit, state.delay)
+                elif success:
+                    state.limit = min(float(self.max_per_host), state.limit + 1 / state.limit)
+                    # Halve the delay, snapping back to min_delay once within 10 ms of it
+                    state.delay = state.delay / 2 if state.delay / 2 > self.min_delay + 0.01 else self.min_delay
+            self._notify()
+
+    def _notify(self) -> None:
+        self._cond.notify_all()
+        for loop, event in self._async_waiters:
+            loop.call_soon_threadsafe(event.set)
+        self._async_waiters.clear()
+
+    def acquire(self) -> Optional[Tuple[str, Callable[[], Any]]]:
+        """Blocks until a job may start; returns None once the queue is empty."""
+        with self._cond:
+            while True:
+                picked, wait = self._take()
+                if picked is not None or wait is None:
+                    return picked
+                self._cond.wait(None if wait == float('inf') else wait)
+
+    async def acquire_async(self) -> Optional[Tuple[str, Callable[[], Any]]]:
+        """Async counterpart of acquire()."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                picked, wait = self._take()
+                if picked is not None or wait is None:
+                    return picked
+                event = asyncio.Event()
+                self._async_waiters.append((loop, event))
+            try:
+                await asyncio.wait_for(event.wait(), None if wait == float('inf') else wait)
+            except asyncio.TimeoutError:
+                pass
+
+    def work(self) -> None:
+        """Runs queued jobs until none are left; run one per worker thread."""
+        while True:
+            picked = self.acquire()
+            if picked is None:
+                return
+            host, job = picked
+            start = time.monotonic()
+            success = None
+            try:
+                success = job()
+            finally:
+                self.release(host, success, time.monotonic() - start)
+
+    async def work_async(self) -> None:
+        """Runs queued coroutine jobs until none are left; run one per worker task."""
+        while True:
+            picked = await self.acquire_async()
+            if picked is None:
+                return
+            host, job = picked
+            start = time.monotonic()
+            success = None
+            try:
+                success = await job()
+            finally:
+                self.release(host, success, time.monotonic() - start)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the current state of every host seen so far.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Per host: active and queued jobs, current limit and
+            delay, error rate over the window and smoothed latency in seconds
+        """
+        with self._cond:
+            return {
+                host: {
+                    'active': state.active,
+                    'queued': len(state.queue),
+                    'limit': int(state.limit),
+                    'delay': state.delay,
+                    'errorRate': state.outcomes.count(False) / len(state.outcomes) if state.outcomes else 0.0,
+                    'latency': state.latency,
+                }
+                for host, state in self._hosts.items()
+            }
+
 class FirecrawlApp:
     def __init__(self, api_key: Optional[str] = None, api_url: Optional[str] = None) -> None:
         """
@@ -435,13 +2791,39 @@ class FirecrawlApp:
         """
         self.api_key = api_key or os.getenv('FIRECRAWL_API_KEY')
         self.api_url = api_url or os.getenv('FIRECRAWL_API_URL', 'https://api.firecrawl.dev')
+        # Optional requests.Session for connection reuse; module-level requests are used when unset
+        self.session: Optional[requests.Session] = None
+        # Optional RequestScheduler that admits requests by priority class
+        self.scheduler: Optional[RequestScheduler] = None
+        # Optional RequestLogger that records every HTTP request
+        self.request_logger: Optional[RequestLogger] = None
+        # Optional RequestHooks notified around every HTTP request, with timings
+        self.hooks: Optional[RequestHooks] = None
+        self._job_polls = _JobPolls()
+        # Keys derived for auto_idempotency and the jobs they started
+        self.idempotency_registry = IdempotencyRegistry()
         
         # Only require API key when using cloud service
         if 'api.firecrawl.dev' in self.api_url and self.api_key is None:
             logger.warning("No API key provided for cloud service")
             raise ValueError('No API key provided')
             
-        logger.debug(f"Initialized FirecrawlApp with API URL: {self.api_url}")
+        logger.debug("Initialized FirecrawlApp with API URL: %s", self.api_url)
+
+    @property
+    def _http(self):
+        """
+        The session used for HTTP requests, or the requests module itself, behind the
+        request logger, hooks and scheduler when they are set.
+        """
+        http = self.session if self.session is not None else requests
+        if self.request_logger is not None and self.request_logger.active():
+            http = _LoggedHttp(http, self.request_logger)
+        if self.hooks is not None:
+            return _TracedHttp(http, self.hooks, self.scheduler, self._job_polls)
+        if self.scheduler is not None:
+            return _ScheduledHttp(http, self.scheduler)
+        return http
 
     def scrape_url(
             self,
@@ -463,6 +2845,7 @@ class FirecrawlApp:
             json_options: Optional[JsonConfig] = None,
             actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction]]] = None,
             change_tracking_options: Optional[ChangeTrackingOptions] = None,
+            validation: Optional[Literal["strict", "lenient"]] = None,
             **kwargs) -> ScrapeResponse[Any]:
         """
         Scrape and extract content from a URL.
@@ -485,7 +2868,7 @@ class FirecrawlApp:
           json_options (Optional[JsonConfig]): JSON extraction settings
           actions (Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction]]]): Actions to perform
           change_tracking_options (Optional[ChangeTrackingOptions]): Change tracking settings
-
+          validation (Optional[Literal["strict", "lenient"]]): Bind `json` to the json_options schema model; lenient mode collects per-field errors in `validationErrors` instead of raising
 
         Returns:
           ScrapeResponse with:
@@ -496,7 +2879,10 @@ class FirecrawlApp:
 
         Raises:
           Exception: If scraping fails
+          ValueError: If validation is requested without a schema model
+          pydantic.ValidationError: If strict validation fails
         """
+        schema_model = _schema_model(json_options, validation)
         headers = self._prepare_headers()
 
         # Build scrape parameters
@@ -519,7 +2905,7 @@ class FirecrawlApp:
         if timeout:
             scrape_params['timeout'] = timeout
         if location:
-            scrape_params['location'] = location.dict(exclude_none=True)
+            scrape_params['location'] = _model_dump(location)
         if mobile is not None:
             scrape_params['mobile'] = mobile
         if skip_tls_verification is not None:
@@ -531,29 +2917,20 @@ class FirecrawlApp:
         if proxy:
             scrape_params['proxy'] = proxy
         if extract is not None:
-            extract = self._ensure_schema_dict(extract)
-            if isinstance(extract, dict) and "schema" in extract:
-                extract["schema"] = self._ensure_schema_dict(extract["schema"])
-            scrape_params['extract'] = extract if isinstance(extract, dict) else extract.dict(exclude_none=True)
+            scrape_params['extract'] = _schema_options(extract)
         if json_options is not None:
-            json_options = self._ensure_schema_dict(json_options)
-            if isinstance(json_options, dict) and "schema" in json_options:
-                json_options["schema"] = self._ensure_schema_dict(json_options["schema"])
-            scrape_params['jsonOptions'] = json_options if isinstance(json_options, dict) else json_options.dict(exclude_none=True)
+            scrape_params['jsonOptions'] = _schema_options(json_options)
         if actions:
-            scrape_params['actions'] = [action if isinstance(action, dict) else action.dict(exclude_none=True) for action in actions]
+            scrape_params['actions'] = [_model_dump(action) for action in actions]
         if change_tracking_options:
-            scrape_params['changeTrackingOptions'] = change_tracking_options if isinstance(change_tracking_options, dict) else change_tracking_options.dict(exclude_none=True)
+            scrape_params['changeTrackingOptions'] = _model_dump(change_tracking_options)
         
         scrape_params.update(kwargs)
 
-        if 'extract' in scrape_params and scrape_params['extract'] and 'schema' in scrape_params['extract']:
-            scrape_params['extract']['schema'] = self._ensure_schema_dict(scrape_params['extract']['schema'])
-        if 'jsonOptions' in scrape_params and scrape_params['jsonOptions'] and 'schema' in scrape_params['jsonOptions']:
-            scrape_params['jsonOptions']['schema'] = self._ensure_schema_dict(scrape_params['jsonOptions']['schema'])
+        _compile_option_schemas(scrape_params)
 
         # Make request
-        response = requests.post(
+        response = self._http.post(
             f'{self.api_url}/v1/scrape',
             headers=headers,
             json=scrape_params,
@@ -564,16 +2941,132 @@ class FirecrawlApp:
             try:
                 response_json = response.json()
                 if response_json.get('success') and 'data' in response_json:
-                    return ScrapeResponse(**response_json['data'])
+                    if schema_model is None:
+                        return _validate_model(ScrapeResponse, response_json['data'])
                 elif "error" in response_json:
                     raise Exception(f'Failed to scrape URL. Error: {response_json["error"]}')
                 else:
                     raise Exception(f'Failed to scrape URL. Error: {response_json}')
             except ValueError:
                 raise Exception('Failed to parse Firecrawl response as JSON.')
+            return _bind_schema(ScrapeResponse, schema_model, response_json['data'], validation, 'json')
         else:
             self._handle_error(response, 'scrape URL')
 
+    def scrape_many(
+            self,
+            urls: List[str],
+            *,
+            concurrency: int = 8,
+            ordered: bool = False,
+            deadline: Optional[float] = None,
+            politeness: Optional[DomainDispatcher] = None,
+            canonicalize: Union[bool, UrlCanonicalizer] = False,
+            **scrape_options) -> Iterator[ScrapeManyResult]:
+        """
+        Scrape many URLs concurrently from the client, yielding results as they finish.
+
+        Requests run on a thread pool and share one connection pool. Unlike
+        batch_scrape_urls there is no server-side job, so the first results arrive as
+        soon as their pages are scraped.
+
+        Args:
+            urls (List[str]): URLs to scrape
+            concurrency (int): Maximum number of requests in flight
+            ordered (bool): Yield results in input order instead of completion order
+            deadline (Optional[float]): Seconds after which unfinished URLs are reported as failed
+            politeness (Optional[DomainDispatcher]): Dispatches URLs round-robin across hosts with
+                adaptive per-host concurrency caps; all URLs are started as slots free up when unset
+            canonicalize (Union[bool, UrlCanonicalizer]): Scrape each canonical URL once and report
+                its result for every input URL that maps to it
+            **scrape_options: Options passed to scrape_url for every URL
+
+        Returns:
+            Iterator[ScrapeManyResult]: One result per URL; failures carry `error` instead of raising
+        """
+        canonicalizer = _resolve_canonicalizer(canonicalize)
+        if canonicalizer is not None:
+            unique, mapping = canonicalizer.dedupe(urls)
+            fan_out = _FanOut(urls, mapping, ordered)
+            for result in self.scrape_many(unique, concurrency=concurrency, ordered=ordered, deadline=deadline, politeness=politeness, **scrape_options):
+                yield from fan_out.add(result)
+            return
+
+        app = copy.copy(self)
+        app.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=concurrency)
+        app.session.mount('https://', adapter)
+        app.session.mount('http://', adapter)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=concurrency)
+        if politeness is None:
+            futures = {executor.submit(app.scrape_url, url, **scrape_options): index for index, url in enumerate(urls)}
+        else:
+            futures = {concurrent.futures.Future(): index for index in range(len(urls))}
+
+            def polite_scrape(future: concurrent.futures.Future, url: str) -> Optional[bool]:
+                if not future.set_running_or_notify_cancel():
+                    return None
+                try:
+                    document = app.scrape_url(url, **scrape_options)
+                except Exception as e:
+                    future.set_exception(e)
+                    return False if politeness.is_site_error(e) else None
+                future.set_result(document)
+                return politeness.is_healthy(document)
+
+            jobs = [functools.partial(polite_scrape, future, urls[index]) for future, index in futures.items()]
+            for job, url in zip(jobs, urls):
+                politeness.put(url, job)
+            for _ in range(concurrency):
+                executor.submit(politeness.work)
+        end = time.monotonic() + deadline if deadline is not None else None
+        remaining = set(futures)
+
+        def result(future: concurrent.futures.Future) -> ScrapeManyResult:
+            index = futures[future]
+            remaining.discard(future)
+            try:
+                return ScrapeManyResult(index=index, url=urls[index], success=True, document=future.result())
+            except Exception as e:
+                return ScrapeManyResult(index=index, url=urls[index], success=False, error=str(e))
+
+        try:
+            if ordered:
+                for future in futures:
+                    timeout = max(0, end - time.monotonic()) if end is not None else None
+                    concurrent.futures.wait([future], timeout=timeout)
+                    if not future.done():
+                        break
+                    yield result(future)
+            else:
+                try:
+                    timeout = max(0, end - time.monotonic()) if end is not None else None
+                    for future in concurrent.futures.as_completed(futures, timeout=timeout):
+                        yield result(future)
+                except concurrent.futures.TimeoutError:
+                    pass
+            for future in sorted(remaining, key=futures.get):
+                if future.done():
+                    yield result(future)
+                    continue
+                index = futures[future]
+                yield ScrapeManyResult(index=index, url=urls[index], success=False, error='Deadline exceeded')
+        finally:
+            if politeness is not None:
+                politeness.discard(jobs)
+            for future in futures:
+                future.cancel()
+
+            def release() -> None:
+                executor.shutdown(wait=True)
+                app.session.close()
+
+            if all(future.done() for future in futures):
+                release()
+            else:
+                # Requests still in flight keep using the session; close it once they finish
+                threading.Thread(target=release, daemon=True).start()
+
     def search(
             self,
             query: str,
@@ -634,18 +3127,18 @@ class FirecrawlApp:
         if timeout is not None:
             search_params['timeout'] = timeout
         if scrape_options is not None:
-            search_params['scrapeOptions'] = scrape_options.dict(exclude_none=True)
+            search_params['scrapeOptions'] = _model_dump(scrape_options)
         
         # Add any additional kwargs
         search_params.update(kwargs)
 
         # Create final params object
         final_params = SearchParams(query=query, **search_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
-        response = requests.post(
+        response = self._http.post(
             f"{self.api_url}/v1/search",
             headers={"Authorization": f"Bearer {self.api_key}"},
             json=params_dict
@@ -655,7 +3148,7 @@ class FirecrawlApp:
             try:
                 response_json = response.json()
                 if response_json.get('success') and 'data' in response_json:
-                    return SearchResponse(**response_json)
+                    return _validate_model(SearchResponse, response_json)
                 elif "error" in response_json:
                     raise Exception(f'Search failed. Error: {response_json["error"]}')
                 else:
@@ -685,6 +3178,8 @@ class FirecrawlApp:
         delay: Optional[int] = None,
         poll_interval: Optional[int] = 2,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
+        compact_metadata: bool = False,
         **kwargs
     ) -> CrawlStatusResponse:
         """
@@ -708,6 +3203,9 @@ class FirecrawlApp:
             delay (Optional[int]): Delay in seconds between scrapes
             poll_interval (Optional[int]): Seconds between status checks (default: 2)
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
+            compact_metadata (bool): Store page metadata in a shared, interned MetadataTable
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -742,7 +3240,7 @@ class FirecrawlApp:
         if ignore_sitemap is not None:
             crawl_params['ignoreSitemap'] = ignore_sitemap
         if scrape_options is not None:
-            crawl_params['scrapeOptions'] = scrape_options.dict(exclude_none=True)
+            crawl_params['scrapeOptions'] = _model_dump(scrape_options)
         if webhook is not None:
             crawl_params['webhook'] = webhook
         if deduplicate_similar_urls is not None:
@@ -759,20 +3257,20 @@ class FirecrawlApp:
 
         # Create final params object
         final_params = CrawlParams(**crawl_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['url'] = url
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
-        response = self._post_request(f'{self.api_url}/v1/crawl', params_dict, headers)
+        response = self._post_job(f'{self.api_url}/v1/crawl', params_dict, headers, auto_idempotency)
 
         if response.status_code == 200:
             try:
                 id = response.json().get('id')
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return self._monitor_job_status(id, headers, poll_interval)
+            return self._monitor_job_status(id, headers, poll_interval, compact_metadata)
         else:
             self._handle_error(response, 'start crawl job')
 
@@ -795,6 +3293,7 @@ class FirecrawlApp:
         regex_on_full_url: Optional[bool] = None,
         delay: Optional[int] = None,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
         **kwargs
     ) -> CrawlResponse:
         """
@@ -816,6 +3315,8 @@ class FirecrawlApp:
             ignore_query_parameters (Optional[bool]): Ignore URL parameters
             regex_on_full_url (Optional[bool]): Apply regex to full URLs
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -851,7 +3352,7 @@ class FirecrawlApp:
         if ignore_sitemap is not None:
             crawl_params['ignoreSitemap'] = ignore_sitemap
         if scrape_options is not None:
-            crawl_params['scrapeOptions'] = scrape_options.dict(exclude_none=True)
+            crawl_params['scrapeOptions'] = _model_dump(scrape_options)
         if webhook is not None:
             crawl_params['webhook'] = webhook
         if deduplicate_similar_urls is not None:
@@ -868,28 +3369,29 @@ class FirecrawlApp:
 
         # Create final params object
         final_params = CrawlParams(**crawl_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['url'] = url
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
-        response = self._post_request(f'{self.api_url}/v1/crawl', params_dict, headers)
+        response = self._post_job(f'{self.api_url}/v1/crawl', params_dict, headers, auto_idempotency)
 
         if response.status_code == 200:
             try:
-                return CrawlResponse(**response.json())
+                return _validate_response(CrawlResponse, response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
             self._handle_error(response, 'start crawl job')
 
-    def check_crawl_status(self, id: str) -> CrawlStatusResponse:
+    def check_crawl_status(self, id: str, compact_metadata: bool = False) -> CrawlStatusResponse:
         """
         Check the status and results of a crawl job.
 
         Args:
             id: Unique identifier for the crawl job
+            compact_metadata (bool): Store page metadata in a shared, interned MetadataTable
 
         Returns:
             CrawlStatusResponse containing:
@@ -921,7 +3423,10 @@ class FirecrawlApp:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
                 if 'data' in status_data:
+                    table = MetadataTable() if compact_metadata else None
                     data = status_data['data']
+                    if table is not None:
+                        table.compact_documents(data)
                     while 'next' in status_data:
                         if len(status_data['data']) == 0:
                             break
@@ -932,16 +3437,19 @@ class FirecrawlApp:
                         try:
                             status_response = self._get_request(next_url, headers)
                             if status_response.status_code != 200:
-                                logger.error(f"Failed to fetch next page: {status_response.status_code}")
+                                logger.error("Failed to fetch next page: %s", status_response.status_code)
                                 break
                             try:
                                 next_data = status_response.json()
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            data.extend(next_data.get('data', []))
+                            page = next_data.get('data', [])
+                            if table is not None:
+                                table.compact_documents(page)
+                            data.extend(page)
                             status_data = next_data
                         except Exception as e:
-                            logger.error(f"Error during pagination request: {e}")
+                            logger.error("Error during pagination request: %s", e)
                             break
                     status_data['data'] = data
 
@@ -960,10 +3468,8 @@ class FirecrawlApp:
             if 'next' in status_data:
                 response['next'] = status_data['next']
 
-            return CrawlStatusResponse(
-                success=False if 'error' in status_data else True,
-                **response
-            )
+            response['success'] = False if 'error' in status_data else True
+            return _validate_model(CrawlStatusResponse, response)
         else:
             self._handle_error(response, 'check crawl status')
     
@@ -990,7 +3496,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}/v1/crawl/{id}/errors', headers)
         if response.status_code == 200:
             try:
-                return CrawlErrorsResponse(**response.json())
+                return _validate_response(CrawlErrorsResponse, response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -1039,10 +3545,13 @@ class FirecrawlApp:
             ignore_query_parameters: Optional[bool] = None,
             regex_on_full_url: Optional[bool] = None,
             idempotency_key: Optional[str] = None,
+            auto_idempotency: bool = False,
+            near_duplicate_filter: Optional[NearDuplicateFilter] = None,
+            watcher_options: Optional[Dict[str, Any]] = None,
             **kwargs
-    ) -> 'CrawlWatcher':
+    ) -> 'ThreadedCrawlWatcher':
         """
-        Initiate a crawl job and return a CrawlWatcher to monitor the job via WebSocket.
+        Initiate a crawl job and return a ThreadedCrawlWatcher to monitor the job via WebSocket.
 
         Args:
             url (str): Target URL to start crawling from
@@ -1060,10 +3569,15 @@ class FirecrawlApp:
             ignore_query_parameters (Optional[bool]): Ignore URL parameters
             regex_on_full_url (Optional[bool]): Apply regex to full URLs
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
+            near_duplicate_filter (Optional[NearDuplicateFilter]): Client-side filter applied to streamed documents
+            watcher_options (Optional[Dict[str, Any]]): Further ThreadedCrawlWatcher options, e.g. retain, sink,
+                batch_size, max_buffered, max_queued or handler_concurrency
             **kwargs: Additional parameters to pass to the API
 
         Returns:
-            CrawlWatcher: An instance to monitor the crawl job via WebSocket
+            ThreadedCrawlWatcher: An instance to monitor the crawl job; iterate it or await connect()
 
         Raises:
             Exception: If crawl job fails to start
@@ -1084,10 +3598,11 @@ class FirecrawlApp:
             ignore_query_parameters=ignore_query_parameters,
             regex_on_full_url=regex_on_full_url,
             idempotency_key=idempotency_key,
+            auto_idempotency=auto_idempotency,
             **kwargs
         )
         if crawl_response.success and crawl_response.id:
-            return CrawlWatcher(crawl_response.id, self)
+            return ThreadedCrawlWatcher(crawl_response.id, self, near_duplicate_filter=near_duplicate_filter, **(watcher_options or {}))
         else:
             raise Exception("Crawl job failed to start")
 
@@ -1149,12 +3664,12 @@ class FirecrawlApp:
 
         # Create final params object
         final_params = MapParams(**map_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['url'] = url
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
-        response = requests.post(
+        response = self._http.post(
             f"{self.api_url}/v1/map",
             headers={"Authorization": f"Bearer {self.api_key}"},
             json=params_dict
@@ -1164,7 +3679,7 @@ class FirecrawlApp:
             try:
                 response_json = response.json()
                 if response_json.get('success') and 'links' in response_json:
-                    return MapResponse(**response_json)
+                    return _validate_model(MapResponse, response_json)
                 elif "error" in response_json:
                     raise Exception(f'Map failed. Error: {response_json["error"]}')
                 else:
@@ -1174,6 +3689,59 @@ class FirecrawlApp:
         else:
             self._handle_error(response, 'map')
 
+    def map_and_scrape(
+            self,
+            url: str,
+            *,
+            filter: Optional[Callable[[str], bool]] = None,
+            search: Optional[str] = None,
+            limit: Optional[int] = None,
+            shard_size: int = 25,
+            concurrency: int = 4,
+            scrape_options: Optional[ScrapeOptions] = None,
+            poll_interval: int = 2,
+            shard_retries: int = 1,
+            idempotency_key: Optional[str] = None,
+            canonicalize: Union[bool, UrlCanonicalizer] = False,
+            **map_options) -> Iterator[FirecrawlDocument]:
+        """
+        Map a site, filter its links and scrape the selected pages, yielding documents as they arrive.
+
+        Links from map_url pass lazily through `filter` into batch scrape shards of
+        `shard_size` URLs; up to `concurrency` shards run at once and each new shard is
+        filled only when one can start. Documents are yielded as status pages of the
+        shards arrive, so the first ones are available long before the whole site is
+        scraped.
+
+        Args:
+            url (str): Site to map
+            filter (Optional[Callable[[str], bool]]): Keeps a link when it returns True
+            search (Optional[str]): Map search term, to rank and limit links server-side
+            limit (Optional[int]): Maximum links returned by map_url
+            shard_size (int): URLs per batch scrape job
+            concurrency (int): Batch scrape jobs running at once
+            scrape_options (Optional[ScrapeOptions]): Options for every scraped page
+            poll_interval (int): Seconds between polling rounds
+            shard_retries (int): Times a failed shard is submitted again
+            idempotency_key (Optional[str]): Base key; each shard attempt gets a key derived from it
+            canonicalize (Union[bool, UrlCanonicalizer]): Canonicalize links before deduplicating them
+            **map_options: Additional map_url parameters
+
+        Returns:
+            Iterator[FirecrawlDocument]: Scraped documents in arrival order, each URL at most once
+
+        Raises:
+            Exception: If mapping fails
+        """
+        links = self.map_url(url, search=search, limit=limit, **map_options).links or []
+        batch = _ShardedBatch([], shard_size, concurrency, shard_retries, False)
+        params_dict = {**(_model_dump(scrape_options) if scrape_options else {}), 'origin': f"python-sdk@{version}"}
+        source = _map_shards(links, filter, shard_size, _resolve_canonicalizer(canonicalize))
+        seen: Set[str] = set()
+        for docs in self._iter_sharded_batch(batch, params_dict, idempotency_key, poll_interval, source):
+            for document in _unseen_documents(docs, seen):
+                yield document
+
     def batch_scrape_urls(
         self,
         urls: List[str],
@@ -1197,6 +3765,14 @@ class FirecrawlApp:
         agent: Optional[AgentOptions] = None,
         poll_interval: Optional[int] = 2,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
+        compact_metadata: bool = False,
+        shard_size: Optional[int] = None,
+        max_concurrent_shards: Optional[int] = None,
+        shard_retries: int = 0,
+        retry_failed: int = 0,
+        retry_escalation: Optional[List[Dict[str, Any]]] = None,
+        canonicalize: Union[bool, UrlCanonicalizer] = False,
         **kwargs
     ) -> BatchScrapeStatusResponse:
         """
@@ -1223,6 +3799,18 @@ class FirecrawlApp:
             agent (Optional[AgentOptions]): Agent configuration
             poll_interval (Optional[int]): Seconds between status checks (default: 2)
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
+            compact_metadata (bool): Store page metadata in a shared, interned MetadataTable
+            shard_size (Optional[int]): Split `urls` into sub-jobs of at most this many URLs
+            max_concurrent_shards (Optional[int]): Maximum number of sub-jobs running at once (default: all)
+            shard_retries (int): Times a failed sub-job is submitted again
+            retry_failed (int): Rounds of resubmitting the URLs listed by the errors endpoint
+                (robots-blocked URLs excluded); results are merged into the response
+            retry_escalation (Optional[List[Dict[str, Any]]]): Parameter overrides per retry round, the
+                last one repeating (default: stealth proxy, then stealth proxy with twice the timeout)
+            canonicalize (Union[bool, UrlCanonicalizer]): Canonicalize and deduplicate `urls` before
+                submission; `canonicalUrls` and documents_by_input() map results back to every input URL
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -1255,7 +3843,7 @@ class FirecrawlApp:
         if timeout is not None:
             scrape_params['timeout'] = timeout
         if location is not None:
-            scrape_params['location'] = location.dict(exclude_none=True)
+            scrape_params['location'] = _model_dump(location)
         if mobile is not None:
             scrape_params['mobile'] = mobile
         if skip_tls_verification is not None:
@@ -1267,46 +3855,60 @@ class FirecrawlApp:
         if proxy is not None:
             scrape_params['proxy'] = proxy
         if extract is not None:
-            extract = self._ensure_schema_dict(extract)
-            if isinstance(extract, dict) and "schema" in extract:
-                extract["schema"] = self._ensure_schema_dict(extract["schema"])
-            scrape_params['extract'] = extract if isinstance(extract, dict) else extract.dict(exclude_none=True)
+            scrape_params['extract'] = _schema_options(extract)
         if json_options is not None:
-            json_options = self._ensure_schema_dict(json_options)
-            if isinstance(json_options, dict) and "schema" in json_options:
-                json_options["schema"] = self._ensure_schema_dict(json_options["schema"])
-            scrape_params['jsonOptions'] = json_options if isinstance(json_options, dict) else json_options.dict(exclude_none=True)
+            scrape_params['jsonOptions'] = _schema_options(json_options)
         if actions is not None:
-            scrape_params['actions'] = [action.dict(exclude_none=True) for action in actions]
+            scrape_params['actions'] = [_model_dump(action) for action in actions]
         if agent is not None:
-            scrape_params['agent'] = agent.dict(exclude_none=True)
+            scrape_params['agent'] = _model_dump(agent)
 
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
         # Create final params object
         final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
+        canonicalizer = _resolve_canonicalizer(canonicalize)
+        url_map = None
+        if canonicalizer is not None:
+            urls, url_map = canonicalizer.dedupe(urls)
         params_dict['urls'] = urls
         params_dict['origin'] = f"python-sdk@{version}"
 
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        _compile_option_schemas(params_dict, scrape_params)
 
-        # Make request
-        headers = self._prepare_headers(idempotency_key)
-        response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
-
-        if response.status_code == 200:
-            try:
-                id = response.json().get('id')
-            except:
-                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return self._monitor_job_status(id, headers, poll_interval)
+        if shard_size and len(urls) > shard_size:
+            if auto_idempotency and idempotency_key is None:
+                # Shards use keys derived from it and re-attach to the shard jobs recorded under them
+                idempotency_key, _ = self.idempotency_registry.lookup(f'{self.api_url}/v1/batch/scrape', {**params_dict, 'shardSize': shard_size})
+                self.idempotency_registry.reserve(idempotency_key)
+            batch = _ShardedBatch(urls, shard_size, max_concurrent_shards, shard_retries, compact_metadata)
+            status = self._monitor_sharded_batch(batch, params_dict, idempotency_key, poll_interval)
+            job_ids = [shard.id for shard in status.shards if shard.id]
         else:
-            self._handle_error(response, 'start batch scrape job')
+            # Make request
+            headers = self._prepare_headers(idempotency_key)
+            response = self._post_job(f'{self.api_url}/v1/batch/scrape', params_dict, headers, auto_idempotency)
+
+            if response.status_code == 200:
+                try:
+                    id = response.json().get('id')
+                except:
+                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                status = self._monitor_job_status(id, headers, poll_interval, compact_metadata)
+                job_ids = [id]
+            else:
+                self._handle_error(response, 'start batch scrape job')
+
+        if retry_failed:
+            retry = _BatchRetry(status, params_dict, retry_failed, retry_escalation)
+            for id in job_ids:
+                retry.add_errors(self.check_batch_scrape_errors(id))
+            status = self._retry_failed_batch_urls(retry, poll_interval, compact_metadata)
+        if url_map is not None:
+            status = _as_batch_status(status, canonicalUrls=url_map)
+        return status
 
     def async_batch_scrape_urls(
         self,
@@ -1330,6 +3932,7 @@ class FirecrawlApp:
         actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction]]] = None,
         agent: Optional[AgentOptions] = None,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
         **kwargs
     ) -> BatchScrapeResponse:
         """
@@ -1355,6 +3958,8 @@ class FirecrawlApp:
             actions (Optional[List[Union]]): Actions to perform
             agent (Optional[AgentOptions]): Agent configuration
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -1388,7 +3993,7 @@ class FirecrawlApp:
         if timeout is not None:
             scrape_params['timeout'] = timeout
         if location is not None:
-            scrape_params['location'] = location.dict(exclude_none=True)
+            scrape_params['location'] = _model_dump(location)
         if mobile is not None:
             scrape_params['mobile'] = mobile
         if skip_tls_verification is not None:
@@ -1400,41 +4005,32 @@ class FirecrawlApp:
         if proxy is not None:
             scrape_params['proxy'] = proxy
         if extract is not None:
-            extract = self._ensure_schema_dict(extract)
-            if isinstance(extract, dict) and "schema" in extract:
-                extract["schema"] = self._ensure_schema_dict(extract["schema"])
-            scrape_params['extract'] = extract if isinstance(extract, dict) else extract.dict(exclude_none=True)
+            scrape_params['extract'] = _schema_options(extract)
         if json_options is not None:
-            json_options = self._ensure_schema_dict(json_options)
-            if isinstance(json_options, dict) and "schema" in json_options:
-                json_options["schema"] = self._ensure_schema_dict(json_options["schema"])
-            scrape_params['jsonOptions'] = json_options if isinstance(json_options, dict) else json_options.dict(exclude_none=True)
+            scrape_params['jsonOptions'] = _schema_options(json_options)
         if actions is not None:
-            scrape_params['actions'] = [action.dict(exclude_none=True) for action in actions]
+            scrape_params['actions'] = [_model_dump(action) for action in actions]
         if agent is not None:
-            scrape_params['agent'] = agent.dict(exclude_none=True)
+            scrape_params['agent'] = _model_dump(agent)
 
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
         # Create final params object
         final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['urls'] = urls
         params_dict['origin'] = f"python-sdk@{version}"
 
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        _compile_option_schemas(params_dict, scrape_params)
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
-        response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
+        response = self._post_job(f'{self.api_url}/v1/batch/scrape', params_dict, headers, auto_idempotency)
 
         if response.status_code == 200:
             try:
-                return BatchScrapeResponse(**response.json())
+                return _validate_response(BatchScrapeResponse, response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -1462,10 +4058,13 @@ class FirecrawlApp:
         actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction]]] = None,
         agent: Optional[AgentOptions] = None,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
+        near_duplicate_filter: Optional[NearDuplicateFilter] = None,
+        watcher_options: Optional[Dict[str, Any]] = None,
         **kwargs
-    ) -> 'CrawlWatcher':
+    ) -> 'ThreadedCrawlWatcher':
         """
-        Initiate a batch scrape job and return a CrawlWatcher to monitor the job via WebSocket.
+        Initiate a batch scrape job and return a ThreadedCrawlWatcher to monitor the job via WebSocket.
 
         Args:
             urls (List[str]): URLs to scrape
@@ -1487,10 +4086,15 @@ class FirecrawlApp:
             actions (Optional[List[Union]]): Actions to perform
             agent (Optional[AgentOptions]): Agent configuration
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
+            near_duplicate_filter (Optional[NearDuplicateFilter]): Client-side filter applied to streamed documents
+            watcher_options (Optional[Dict[str, Any]]): Further ThreadedCrawlWatcher options, e.g. retain, sink,
+                batch_size, max_buffered, max_queued or handler_concurrency
             **kwargs: Additional parameters to pass to the API
 
         Returns:
-            CrawlWatcher: An instance to monitor the batch scrape job via WebSocket
+            ThreadedCrawlWatcher: An instance to monitor the batch scrape job; iterate it or await connect()
 
         Raises:
             Exception: If batch scrape job fails to start
@@ -1516,7 +4120,7 @@ class FirecrawlApp:
         if timeout is not None:
             scrape_params['timeout'] = timeout
         if location is not None:
-            scrape_params['location'] = location.dict(exclude_none=True)
+            scrape_params['location'] = _model_dump(location)
         if mobile is not None:
             scrape_params['mobile'] = mobile
         if skip_tls_verification is not None:
@@ -1528,43 +4132,35 @@ class FirecrawlApp:
         if proxy is not None:
             scrape_params['proxy'] = proxy
         if extract is not None:
-            extract = self._ensure_schema_dict(extract)
-            if isinstance(extract, dict) and "schema" in extract:
-                extract["schema"] = self._ensure_schema_dict(extract["schema"])
-            scrape_params['extract'] = extract if isinstance(extract, dict) else extract.dict(exclude_none=True)
+            scrape_params['extract'] = _schema_options(extract)
         if json_options is not None:
-            json_options = self._ensure_schema_dict(json_options)
-            if isinstance(json_options, dict) and "schema" in json_options:
-                json_options["schema"] = self._ensure_schema_dict(json_options["schema"])
-            scrape_params['jsonOptions'] = json_options if isinstance(json_options, dict) else json_options.dict(exclude_none=True)
+            scrape_params['jsonOptions'] = _schema_options(json_options)
         if actions is not None:
-            scrape_params['actions'] = [action.dict(exclude_none=True) for action in actions]
+            scrape_params['actions'] = [_model_dump(action) for action in actions]
         if agent is not None:
-            scrape_params['agent'] = agent.dict(exclude_none=True)
+            scrape_params['agent'] = _model_dump(agent)
 
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
         # Create final params object
         final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['urls'] = urls
         params_dict['origin'] = f"python-sdk@{version}"
 
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        _compile_option_schemas(params_dict, scrape_params)
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
-        response = self._post_request(f'{self.api_url}/v1/batch/scrape', params_dict, headers)
+        response = self._post_job(f'{self.api_url}/v1/batch/scrape', params_dict, headers, auto_idempotency)
 
         if response.status_code == 200:
             try:
-                crawl_response = BatchScrapeResponse(**response.json())
+                crawl_response = _validate_response(BatchScrapeResponse, response)
                 if crawl_response.success and crawl_response.id:
-                    return CrawlWatcher(crawl_response.id, self)
+                    return ThreadedCrawlWatcher(
+                        crawl_response.id, self, near_duplicate_filter=near_duplicate_filter, job_type='batch', **(watcher_options or {}))
                 else:
                     raise Exception("Batch scrape job failed to start")
             except:
@@ -1572,12 +4168,13 @@ class FirecrawlApp:
         else:
             self._handle_error(response, 'start batch scrape job')
     
-    def check_batch_scrape_status(self, id: str) -> BatchScrapeStatusResponse:
+    def check_batch_scrape_status(self, id: str, compact_metadata: bool = False) -> BatchScrapeStatusResponse:
         """
         Check the status of a batch scrape job using the Firecrawl API.
 
         Args:
             id (str): The ID of the batch scrape job.
+            compact_metadata (bool): Store page metadata in a shared, interned MetadataTable.
 
         Returns:
             BatchScrapeStatusResponse: The status of the batch scrape job.
@@ -1596,7 +4193,10 @@ class FirecrawlApp:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
             if status_data['status'] == 'completed':
                 if 'data' in status_data:
+                    table = MetadataTable() if compact_metadata else None
                     data = status_data['data']
+                    if table is not None:
+                        table.compact_documents(data)
                     while 'next' in status_data:
                         if len(status_data['data']) == 0:
                             break
@@ -1607,20 +4207,23 @@ class FirecrawlApp:
                         try:
                             status_response = self._get_request(next_url, headers)
                             if status_response.status_code != 200:
-                                logger.error(f"Failed to fetch next page: {status_response.status_code}")
+                                logger.error("Failed to fetch next page: %s", status_response.status_code)
                                 break
                             try:
                                 next_data = status_response.json()
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            data.extend(next_data.get('data', []))
+                            page = next_data.get('data', [])
+                            if table is not None:
+                                table.compact_documents(page)
+                            data.extend(page)
                             status_data = next_data
                         except Exception as e:
-                            logger.error(f"Error during pagination request: {e}")
+                            logger.error("Error during pagination request: %s", e)
                             break
                     status_data['data'] = data
 
-            return BatchScrapeStatusResponse(**{
+            return _validate_model(BatchScrapeStatusResponse, {
                 'success': False if 'error' in status_data else True,
                 'status': status_data.get('status'),
                 'total': status_data.get('total'),
@@ -1657,7 +4260,7 @@ class FirecrawlApp:
         response = self._get_request(f'{self.api_url}/v1/batch/scrape/{id}/errors', headers)
         if response.status_code == 200:
             try:
-                return CrawlErrorsResponse(**response.json())
+                return _validate_response(CrawlErrorsResponse, response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
@@ -1673,7 +4276,9 @@ class FirecrawlApp:
             allow_external_links: Optional[bool] = False,
             enable_web_search: Optional[bool] = False,
             show_sources: Optional[bool] = False,
-            agent: Optional[Dict[str, Any]] = None) -> ExtractResponse[Any]:
+            agent: Optional[Dict[str, Any]] = None,
+            canonicalize: Union[bool, UrlCanonicalizer] = False,
+            validation: Optional[Literal["strict", "lenient"]] = None) -> ExtractResponse[Any]:
         """
         Extract structured information from URLs.
 
@@ -1686,6 +4291,8 @@ class FirecrawlApp:
             enable_web_search (Optional[bool]): Enable web search
             show_sources (Optional[bool]): Include source URLs
             agent (Optional[Dict[str, Any]]): Agent configuration
+            canonicalize (Union[bool, UrlCanonicalizer]): Canonicalize and deduplicate `urls` before submission
+            validation (Optional[Literal["strict", "lenient"]]): Bind `data` to the schema model; lenient mode collects per-field errors in `validationErrors` instead of raising
 
         Returns:
             ExtractResponse[Any] with:
@@ -1694,19 +4301,25 @@ class FirecrawlApp:
             * error (Optional[str]): Error message if any
 
         Raises:
-            ValueError: If prompt/schema missing or extraction fails
+            ValueError: If prompt/schema missing, extraction fails or strict validation fails
         """
         headers = self._prepare_headers()
 
         if not prompt and not schema:
             raise ValueError("Either prompt or schema is required")
 
+        schema_model = _schema_model(schema, validation)
+
         if not urls and not prompt:
             raise ValueError("Either urls or prompt is required")
 
         if schema:
             schema = self._ensure_schema_dict(schema)
 
+        canonicalizer = _resolve_canonicalizer(canonicalize)
+        if canonicalizer is not None and urls:
+            urls = canonicalizer.dedupe(urls)[0]
+
         request_data = {
             'urls': urls or [],
             'allowExternalLinks': allow_external_links,
@@ -1749,12 +4362,19 @@ class FirecrawlApp:
                             headers
                         )
                         if status_response.status_code == 200:
+                            if schema_model is not None:
+                                # Completed results usually fit the schema: bind them straight from the body
+                                bound = _try_bind_schema(ExtractResponse, schema_model, status_response)
+                                if bound is not None and bound.status == 'completed':
+                                    return bound
                             try:
                                 status_data = status_response.json()
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
                             if status_data['status'] == 'completed':
-                                return ExtractResponse(**status_data)
+                                if schema_model is not None:
+                                    return _bind_schema(ExtractResponse, schema_model, status_data, validation)
+                                return _validate_model(ExtractResponse, status_data)
                             elif status_data['status'] in ['failed', 'cancelled']:
                                 raise Exception(f'Extract job {status_data["status"]}. Error: {status_data["error"]}')
                         else:
@@ -1788,7 +4408,7 @@ class FirecrawlApp:
             response = self._get_request(f'{self.api_url}/v1/extract/{job_id}', headers)
             if response.status_code == 200:
                 try:
-                    return ExtractResponse(**response.json())
+                    return _validate_response(ExtractResponse, response)
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
             else:
@@ -1856,7 +4476,7 @@ class FirecrawlApp:
             response = self._post_request(f'{self.api_url}/v1/extract', request_data, headers)
             if response.status_code == 200:
                 try:
-                    return ExtractResponse(**response.json())
+                    return _validate_response(ExtractResponse, response)
                 except:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
             else:
@@ -1890,11 +4510,11 @@ class FirecrawlApp:
         Raises:
             Exception: If generation fails
         """
-        params = GenerateLLMsTextParams(
-            maxUrls=max_urls,
-            showFullText=show_full_text,
-            __experimental_stream=experimental_stream
-        )
+        params = _validate_params(GenerateLLMsTextParams, {
+            'maxUrls': max_urls,
+            'showFullText': show_full_text,
+            '__experimental_stream': experimental_stream
+        })
 
         response = self.async_generate_llms_text(
             url,
@@ -1954,24 +4574,23 @@ class FirecrawlApp:
         Raises:
             Exception: If the generation job initiation fails.
         """
-        params = GenerateLLMsTextParams(
-            maxUrls=max_urls,
-            showFullText=show_full_text,
-            __experimental_stream=experimental_stream
-        )
+        params = _validate_params(GenerateLLMsTextParams, {
+            'maxUrls': max_urls,
+            'showFullText': show_full_text,
+            '__experimental_stream': experimental_stream
+        })
 
         headers = self._prepare_headers()
-        json_data = {'url': url, **params.dict(exclude_none=True)}
+        json_data = {'url': url, **_model_dump(params)}
         json_data['origin'] = f"python-sdk@{version}"
 
         try:
             req = self._post_request(f'{self.api_url}/v1/llmstxt', json_data, headers)
             response = req.json()
-            print("json_data", json_data)
-            print("response", response)
+            logger.debug("LLMs.txt generation request %s returned %s", json_data, response)
             if response.get('success'):
                 try:
-                    return GenerateLLMsTextResponse(**response)
+                    return _validate_model(GenerateLLMsTextResponse, response)
                 except:
                     raise Exception('Failed to parse Firecrawl response as JSON.')
             else:
@@ -1984,43 +4603,190 @@ class FirecrawlApp:
             error='Internal server error'
         )
 
-    def check_generate_llms_text_status(self, id: str) -> GenerateLLMsTextStatusResponse:
+    def check_generate_llms_text_status(self, id: str) -> GenerateLLMsTextStatusResponse:
+        """
+        Check the status of a LLMs.txt generation operation.
+
+        Args:
+            id (str): The unique identifier of the LLMs.txt generation job to check status for.
+
+        Returns:
+            GenerateLLMsTextStatusResponse: A response containing:
+            * success (bool): Whether the generation was successful
+            * status (str): Status of generation ("processing", "completed", "failed")
+            * data (Dict[str, str], optional): Generated text with fields:
+              * llmstxt (str): Generated LLMs.txt content
+              * llmsfulltxt (str, optional): Full version if requested
+            * error (str, optional): Error message if generation failed
+            * expiresAt (str): When the generated data expires
+
+        Raises:
+            Exception: If the status check fails.
+        """
+        headers = self._prepare_headers()
+        try:
+            response = self._get_request(f'{self.api_url}/v1/llmstxt/{id}', headers)
+            if response.status_code == 200:
+                try:
+                    return _validate_response(GenerateLLMsTextStatusResponse, response)
+                except Exception as e:
+                    raise Exception(f'Failed to parse Firecrawl response as GenerateLLMsTextStatusResponse: {str(e)}')
+            elif response.status_code == 404:
+                raise Exception('LLMs.txt generation job not found')
+            else:
+                self._handle_error(response, 'check LLMs.txt generation status')
+        except Exception as e:
+            raise ValueError(str(e))
+
+        return GenerateLLMsTextStatusResponse(success=False, error='Internal server error', status='failed', expiresAt='')
+
+    def generate_llms_text_many(
+            self,
+            urls: List[str],
+            *,
+            concurrency: int = 4,
+            poll_interval: float = 2,
+            **generate_options) -> Iterator[GenerateLLMsTextManyResult]:
+        """
+        Generate LLMs.txt for many URLs concurrently, yielding results as each job finishes.
+
+        Jobs are started and polled by AsyncFirecrawlApp.generate_llms_text_many on a
+        private event loop driven from the calling thread. Call the async client instead
+        from code that already runs an event loop.
+
+        Args:
+            urls (List[str]): Target URLs
+            concurrency (int): Maximum number of generation jobs running at once
+            poll_interval (float): Seconds between status sweeps
+            **generate_options: Options passed to async_generate_llms_text for every URL
+
+        Returns:
+            Iterator[GenerateLLMsTextManyResult]: One result per URL in completion order; failures carry `error` instead of raising
+        """
+        return _iterate_async(self._async_client().generate_llms_text_many(
+            urls,
+            concurrency=concurrency,
+            poll_interval=poll_interval,
+            **generate_options
+        ))
+
+    def stream_deep_research(
+            self,
+            query: str,
+            *,
+            max_depth: Optional[int] = None,
+            time_limit: Optional[int] = None,
+            max_urls: Optional[int] = None,
+            analysis_prompt: Optional[str] = None,
+            system_prompt: Optional[str] = None,
+            poll_interval: float = 2) -> Iterator[Tuple[str, Any]]:
+        """
+        Start a deep research job with step streaming and yield its progress as it happens.
+
+        The status endpoint is read as a text/event-stream when the server offers one;
+        otherwise it is polled every `poll_interval` seconds and the snapshots are diffed.
+
+        Args:
+            query (str): Research query or topic to investigate
+            max_depth (Optional[int]): Maximum depth of research exploration
+            time_limit (Optional[int]): Time limit in seconds for research
+            max_urls (Optional[int]): Maximum number of URLs to process
+            analysis_prompt (Optional[str]): Custom prompt for analysis
+            system_prompt (Optional[str]): Custom system prompt
+            poll_interval (float): Seconds between status checks when streaming is unavailable
+
+        Returns:
+            Iterator[Tuple[str, Any]]: ('activity', activity) and ('source', source) events,
+            ending with ('done', status) or ('error', status)
+
+        Raises:
+            Exception: If the research job cannot be started or its status cannot be read
+        """
+        response = self.async_deep_research(
+            query,
+            max_depth=max_depth,
+            time_limit=time_limit,
+            max_urls=max_urls,
+            analysis_prompt=analysis_prompt,
+            system_prompt=system_prompt,
+            experimental_stream_steps=True
+        )
+        if not response.get('success') or 'id' not in response:
+            raise Exception(f'Failed to start deep research. Error: {response.get("error")}')
+        return self._stream_job(f'{self.api_url}/v1/deep-research/{response["id"]}', poll_interval)
+
+    def stream_generate_llms_text(
+            self,
+            url: str,
+            *,
+            max_urls: Optional[int] = None,
+            show_full_text: Optional[bool] = None,
+            poll_interval: float = 2) -> Iterator[Tuple[str, Any]]:
         """
-        Check the status of a LLMs.txt generation operation.
+        Start an LLMs.txt generation job with streaming and yield the text as it is produced.
+
+        The status endpoint is read as a text/event-stream when the server offers one;
+        otherwise it is polled every `poll_interval` seconds and the snapshots are diffed.
 
         Args:
-            id (str): The unique identifier of the LLMs.txt generation job to check status for.
+            url (str): Target URL to generate LLMs.txt from
+            max_urls (Optional[int]): Maximum URLs to process (default: 10)
+            show_full_text (Optional[bool]): Include full text in output (default: False)
+            poll_interval (float): Seconds between status checks when streaming is unavailable
 
         Returns:
-            GenerateLLMsTextStatusResponse: A response containing:
-            * success (bool): Whether the generation was successful
-            * status (str): Status of generation ("processing", "completed", "failed")
-            * data (Dict[str, str], optional): Generated text with fields:
-              * llmstxt (str): Generated LLMs.txt content
-              * llmsfulltxt (str, optional): Full version if requested
-            * error (str, optional): Error message if generation failed
-            * expiresAt (str): When the generated data expires
+            Iterator[Tuple[str, Any]]: ('text', {'delta', 'text'}) events, ending with
+            ('done', status) or ('error', status)
 
         Raises:
-            Exception: If the status check fails.
+            Exception: If the generation job cannot be started or its status cannot be read
         """
-        headers = self._prepare_headers()
-        try:
-            response = self._get_request(f'{self.api_url}/v1/llmstxt/{id}', headers)
-            if response.status_code == 200:
-                try:
-                    json_data = response.json()
-                    return GenerateLLMsTextStatusResponse(**json_data)
-                except Exception as e:
-                    raise Exception(f'Failed to parse Firecrawl response as GenerateLLMsTextStatusResponse: {str(e)}')
-            elif response.status_code == 404:
-                raise Exception('LLMs.txt generation job not found')
-            else:
-                self._handle_error(response, 'check LLMs.txt generation status')
-        except Exception as e:
-            raise ValueError(str(e))
+        response = self.async_generate_llms_text(
+            url,
+            max_urls=max_urls,
+            show_full_text=show_full_text,
+            experimental_stream=True
+        )
+        if not response.success or not response.id:
+            raise Exception(f'Failed to start LLMs.txt generation. Error: {response.error}')
+        return self._stream_job(f'{self.api_url}/v1/llmstxt/{response.id}', poll_interval)
 
-        return GenerateLLMsTextStatusResponse(success=False, error='Internal server error', status='failed', expiresAt='')
+    def _stream_job(self, url: str, poll_interval: float) -> Iterator[Tuple[str, Any]]:
+        """Yields the events of a job status URL, from server-sent events or by polling."""
+        headers = {**self._prepare_headers(), 'Accept': 'text/event-stream'}
+        stream = _JobStream()
+        while True:
+            response = self._http.get(url, headers=headers, stream=True)
+            if response.status_code != 200:
+                self._handle_error(response, 'stream job status')
+            if response.headers.get('Content-Type', '').startswith('text/event-stream'):
+                parser = _SSEParser()
+                with contextlib.closing(response):
+                    for line in response.iter_lines():
+                        event = parser.feed(line.decode('utf-8'))
+                        if event is not None:
+                            yield from stream.update_sse(*event)
+                            if stream.finished:
+                                return
+            else:
+                try:
+                    status = response.json()
+                except ValueError:
+                    raise Exception('Failed to parse Firecrawl response as JSON.')
+                yield from stream.update(status)
+                if stream.finished:
+                    return
+            time.sleep(poll_interval)
+
+    def _async_client(self) -> 'AsyncFirecrawlApp':
+        """Returns an AsyncFirecrawlApp sharing this client's credentials, scheduler, hooks and idempotency registry."""
+        app = AsyncFirecrawlApp(api_key=self.api_key, api_url=self.api_url)
+        app.scheduler = self.scheduler
+        app.request_logger = self.request_logger
+        app.hooks = self.hooks
+        app._job_polls = self._job_polls
+        app.idempotency_registry = self.idempotency_registry
+        return app
 
     def _prepare_headers(
             self,
@@ -2046,6 +4812,49 @@ class FirecrawlApp:
             'Authorization': f'Bearer {self.api_key}',
         }
 
+    def _post_job(
+            self,
+            url: str,
+            data: Dict[str, Any],
+            headers: Dict[str, str],
+            auto_idempotency: bool = False) -> requests.Response:
+        """
+        Submit a job, deriving its idempotency key from the request when `auto_idempotency` is set.
+
+        A resubmission that matches a recorded job returns the recorded response instead
+        of starting a new job. An explicit idempotency key in `headers` takes precedence.
+
+        Args:
+            url (str): The job endpoint
+            data (Dict[str, Any]): The final request body
+            headers (Dict[str, str]): Request headers
+            auto_idempotency (bool): Derive the key and re-attach to recorded jobs
+
+        Returns:
+            requests.Response: The response of the submission or the recorded one
+        """
+        if not auto_idempotency or 'x-idempotency-key' in headers:
+            return self._post_request(url, data, headers)
+        key, recorded = self.idempotency_registry.lookup(url, data)
+        if recorded is not None:
+            logger.debug("Re-attaching to job %s for idempotency key %s", recorded.get('id'), key)
+            response = requests.Response()
+            response.status_code = 200
+            response.url = url
+            response._content = json.dumps(recorded).encode()
+            return response
+        # Without a response (e.g. on a timeout) the reservation stays for the retry
+        self.idempotency_registry.reserve(key)
+        response = self._post_request(url, data, {**headers, 'x-idempotency-key': key})
+        if response.status_code == 200:
+            try:
+                self.idempotency_registry.record(key, response.json())
+            except ValueError:
+                pass
+        else:
+            self.idempotency_registry.release(key)
+        return response
+
     def _post_request(
             self,
             url: str,
@@ -2070,8 +4879,9 @@ class FirecrawlApp:
             requests.RequestException: If the request fails after the specified retries.
         """
         for attempt in range(retries):
-            response = requests.post(url, headers=headers, json=data, timeout=((data["timeout"] + 5000) if "timeout" in data else None))
+            response = self._http.post(url, headers=headers, json=data, timeout=((data["timeout"] + 5000) if "timeout" in data else None))
             if response.status_code == 502:
+                self._trace_retry(attempt, retries)
                 time.sleep(backoff_factor * (2 ** attempt))
             else:
                 return response
@@ -2099,8 +4909,9 @@ class FirecrawlApp:
             requests.RequestException: If the request fails after the specified retries.
         """
         for attempt in range(retries):
-            response = requests.get(url, headers=headers)
+            response = self._http.get(url, headers=headers)
             if response.status_code == 502:
+                self._trace_retry(attempt, retries)
                 time.sleep(backoff_factor * (2 ** attempt))
             else:
                 return response
@@ -2128,18 +4939,29 @@ class FirecrawlApp:
             requests.RequestException: If the request fails after the specified retries.
         """
         for attempt in range(retries):
-            response = requests.delete(url, headers=headers)
+            response = self._http.delete(url, headers=headers)
             if response.status_code == 502:
+                self._trace_retry(attempt, retries)
                 time.sleep(backoff_factor * (2 ** attempt))
             else:
                 return response
         return response
 
+    def _trace_retry(self, attempt: int, retries: int) -> None:
+        """Reports a failed attempt that will be retried to the hooks and numbers the next attempt."""
+        if self.hooks is None or attempt + 1 >= retries:
+            return
+        trace = _last_trace.get()
+        if trace is not None:
+            self.hooks.on_retry(trace)
+        _retry_attempt.set(attempt + 1)
+
     def _monitor_job_status(
             self,
             id: str,
             headers: Dict[str, str],
-            poll_interval: int) -> CrawlStatusResponse:
+            poll_interval: int,
+            compact_metadata: bool = False) -> CrawlStatusResponse:
         """
         Monitor the status of a crawl job until completion.
 
@@ -2147,6 +4969,7 @@ class FirecrawlApp:
             id (str): The ID of the crawl job.
             headers (Dict[str, str]): The headers to include in the status check requests.
             poll_interval (int): Seconds between status checks.
+            compact_metadata (bool): Compact page metadata into a shared MetadataTable as pages arrive.
 
         Returns:
             CrawlStatusResponse: The crawl results if the job is completed successfully.
@@ -2165,7 +4988,10 @@ class FirecrawlApp:
                     raise Exception(f'Failed to parse Firecrawl response as JSON.')
                 if status_data['status'] == 'completed':
                     if 'data' in status_data:
+                        table = MetadataTable() if compact_metadata else None
                         data = status_data['data']
+                        if table is not None:
+                            table.compact_documents(data)
                         while 'next' in status_data:
                             if len(status_data['data']) == 0:
                                 break
@@ -2174,9 +5000,12 @@ class FirecrawlApp:
                                 status_data = status_response.json()
                             except:
                                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-                            data.extend(status_data.get('data', []))
+                            page = status_data.get('data', [])
+                            if table is not None:
+                                table.compact_documents(page)
+                            data.extend(page)
                         status_data['data'] = data
-                        return CrawlStatusResponse(**status_data)
+                        return _validate_model(CrawlStatusResponse, status_data)
                     else:
                         raise Exception('Crawl job completed but no data was returned')
                 elif status_data['status'] in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
@@ -2187,6 +5016,136 @@ class FirecrawlApp:
             else:
                 self._handle_error(status_response, 'check crawl status')
 
+    def _retry_failed_batch_urls(
+            self,
+            retry: _BatchRetry,
+            poll_interval: int,
+            compact_metadata: bool) -> BatchScrapeStatusResponse:
+        """
+        Resubmit the failed URLs of a batch scrape with escalating parameters until they succeed or the budget is spent.
+
+        Args:
+            retry (_BatchRetry): The finished batch and its failed URLs
+            poll_interval (int): Seconds between status checks
+            compact_metadata (bool): Compact page metadata of retried pages
+
+        Returns:
+            BatchScrapeStatusResponse: The original results merged with the retried pages, with
+            per-round details in `retries` and still failing URLs in `failedUrls`
+        """
+        headers = self._prepare_headers()
+        while True:
+            request = retry.next_request()
+            if request is None:
+                return retry.result()
+            try:
+                response = self._post_request(f'{self.api_url}/v1/batch/scrape', request, headers)
+                if response.status_code != 200:
+                    self._handle_error(response, 'start batch scrape retry job')
+                retry.started(response.json().get('id'))
+                id = retry.retries[-1].id
+                retry.record(self._monitor_job_status(id, headers, poll_interval, compact_metadata))
+                retry.add_errors(self.check_batch_scrape_errors(id))
+            except Exception as e:
+                logger.warning("Batch scrape retry %d failed: %s", len(retry.retries), e)
+                retry.fail(str(e))
+
+    def _monitor_sharded_batch(
+            self,
+            batch: _ShardedBatch,
+            params_dict: Dict[str, Any],
+            idempotency_key: Optional[str],
+            poll_interval: int) -> BatchScrapeStatusResponse:
+        """
+        Submit the shards of a batch scrape and poll them until all have finished.
+
+        Args:
+            batch (_ShardedBatch): The shards to run
+            params_dict (Dict[str, Any]): Batch scrape request body, without shard URLs
+            idempotency_key (Optional[str]): Base key; each shard attempt gets a key derived from it
+            poll_interval (int): Seconds between polling rounds
+
+        Returns:
+            BatchScrapeStatusResponse: Merged results in input order, with per-shard details in `shards`
+        """
+        for _ in self._iter_sharded_batch(batch, params_dict, idempotency_key, poll_interval):
+            pass
+        return batch.result()
+
+    def _iter_sharded_batch(
+            self,
+            batch: _ShardedBatch,
+            params_dict: Dict[str, Any],
+            idempotency_key: Optional[str],
+            poll_interval: int,
+            source: Optional[Iterator[List[str]]] = None) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Run the shards of a batch scrape, yielding each status page of documents as it arrives.
+
+        Args:
+            batch (_ShardedBatch): The shards to run
+            params_dict (Dict[str, Any]): Batch scrape request body, without shard URLs
+            idempotency_key (Optional[str]): Base key; each shard attempt gets a key derived from it
+            poll_interval (int): Seconds between polling rounds
+            source (Optional[Iterator[List[str]]]): Further shard URL lists, pulled while shards can start
+
+        Yields:
+            List[Dict[str, Any]]: Documents of one status page; a retried shard yields its documents again
+        """
+        while True:
+            while source is not None and batch.has_room:
+                urls = next(source, None)
+                if urls is None:
+                    source = None
+                else:
+                    batch.add_shard(urls)
+            if batch.done and source is None:
+                return
+            for shard in batch.to_start():
+                key = _derive_idempotency_key(idempotency_key, shard.index, shard.attempts) if idempotency_key else None
+                recorded = self.idempotency_registry.get(key) if key else None
+                if recorded is not None:
+                    logger.debug("Re-attaching to shard job %s for idempotency key %s", recorded.get('id'), key)
+                    batch.started(shard, recorded.get('id'))
+                    continue
+                try:
+                    if key:
+                        self.idempotency_registry.reserve(key)
+                    response = self._post_request(
+                        f'{self.api_url}/v1/batch/scrape',
+                        {**params_dict, 'urls': shard.urls},
+                        self._prepare_headers(key)
+                    )
+                    if response.status_code != 200:
+                        if key:
+                            self.idempotency_registry.release(key)
+                        self._handle_error(response, 'start batch scrape job')
+                    shard_response = response.json()
+                    if key and shard_response.get('id'):
+                        self.idempotency_registry.record(key, shard_response)
+                    batch.started(shard, shard_response.get('id'))
+                except Exception as e:
+                    batch.fail(shard, str(e))
+            for shard in list(batch.active):
+                try:
+                    while True:
+                        response = self._get_request(
+                            f'{self.api_url}/v1/batch/scrape/{shard.id}?skip={batch.skip(shard)}',
+                            self._prepare_headers()
+                        )
+                        if response.status_code != 200:
+                            self._handle_error(response, 'check batch scrape status')
+                        status_data = response.json()
+                        more = batch.record(shard, status_data)
+                        if shard.status not in ('pending', 'failed') and status_data.get('data'):
+                            yield status_data['data']
+                        if not more:
+                            break
+                except Exception as e:
+                    batch.fail(shard, str(e))
+            if batch.active:
+                time.sleep(poll_interval)
+
     def _handle_error(
             self,
             response: requests.Response,
@@ -2247,7 +5206,7 @@ class FirecrawlApp:
             max_urls: Optional[int] = None,
             analysis_prompt: Optional[str] = None,
             system_prompt: Optional[str] = None,
-            __experimental_stream_steps: Optional[bool] = None,
+            experimental_stream_steps: Optional[bool] = None,
             on_activity: Optional[Callable[[Dict[str, Any]], None]] = None,
             on_source: Optional[Callable[[Dict[str, Any]], None]] = None) -> DeepResearchStatusResponse:
         """
@@ -2260,7 +5219,7 @@ class FirecrawlApp:
             max_urls (Optional[int]): Maximum number of URLs to process
             analysis_prompt (Optional[str]): Custom prompt for analysis
             system_prompt (Optional[str]): Custom system prompt
-            __experimental_stream_steps (Optional[bool]): Enable experimental streaming
+            experimental_stream_steps (Optional[bool]): Enable experimental streaming
             on_activity (Optional[Callable]): Progress callback receiving {type, status, message, timestamp, depth}
             on_source (Optional[Callable]): Source discovery callback receiving {url, title, description}
 
@@ -2289,8 +5248,8 @@ class FirecrawlApp:
             research_params['analysisPrompt'] = analysis_prompt
         if system_prompt is not None:
             research_params['systemPrompt'] = system_prompt
-        if __experimental_stream_steps is not None:
-            research_params['__experimental_streamSteps'] = __experimental_stream_steps
+        if experimental_stream_steps is not None:
+            research_params['__experimental_streamSteps'] = experimental_stream_steps
         research_params = DeepResearchParams(**research_params)
 
         response = self.async_deep_research(
@@ -2299,7 +5258,8 @@ class FirecrawlApp:
             time_limit=time_limit,
             max_urls=max_urls,
             analysis_prompt=analysis_prompt,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            experimental_stream_steps=experimental_stream_steps
         )
         if not response.get('success') or 'id' not in response:
             return response
@@ -2311,17 +5271,10 @@ class FirecrawlApp:
         while True:
             status = self.check_deep_research_status(job_id)
             
-            if on_activity and 'activities' in status:
-                new_activities = status['activities'][last_activity_count:]
-                for activity in new_activities:
-                    on_activity(activity)
-                last_activity_count = len(status['activities'])
-            
-            if on_source and 'sources' in status:
-                new_sources = status['sources'][last_source_count:]
-                for source in new_sources:
-                    on_source(source)
-                last_source_count = len(status['sources'])
+            if on_activity:
+                last_activity_count = _deliver_progress(status, 'activities', last_activity_count, on_activity)
+            if on_source:
+                last_source_count = _deliver_progress(status, 'sources', last_source_count, on_source)
             
             if status['status'] == 'completed':
                 return status
@@ -2343,7 +5296,7 @@ class FirecrawlApp:
             max_urls: Optional[int] = None,
             analysis_prompt: Optional[str] = None,
             system_prompt: Optional[str] = None,
-            __experimental_stream_steps: Optional[bool] = None) -> Dict[str, Any]:
+            experimental_stream_steps: Optional[bool] = None) -> Dict[str, Any]:
         """
         Initiates an asynchronous deep research operation.
 
@@ -2354,7 +5307,7 @@ class FirecrawlApp:
             max_urls (Optional[int]): Maximum number of URLs to process
             analysis_prompt (Optional[str]): Custom prompt for analysis
             system_prompt (Optional[str]): Custom system prompt
-            __experimental_stream_steps (Optional[bool]): Enable experimental streaming
+            experimental_stream_steps (Optional[bool]): Enable experimental streaming
 
         Returns:
             Dict[str, Any]: A response containing:
@@ -2376,13 +5329,13 @@ class FirecrawlApp:
             research_params['analysisPrompt'] = analysis_prompt
         if system_prompt is not None:
             research_params['systemPrompt'] = system_prompt
-        if __experimental_stream_steps is not None:
-            research_params['__experimental_streamSteps'] = __experimental_stream_steps
+        if experimental_stream_steps is not None:
+            research_params['__experimental_streamSteps'] = experimental_stream_steps
         research_params = DeepResearchParams(**research_params)
 
         headers = self._prepare_headers()
         
-        json_data = {'query': query, **research_params.dict(exclude_none=True)}
+        json_data = {'query': query, **_model_dump(research_params)}
         json_data['origin'] = f"python-sdk@{version}"
 
         # Handle json options schema if present
@@ -2447,6 +5400,42 @@ class FirecrawlApp:
 
         return {'success': False, 'error': 'Internal server error'}
 
+    def deep_research_many(
+            self,
+            queries: List[str],
+            *,
+            concurrency: int = 4,
+            poll_interval: float = 2,
+            on_activity: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+            on_source: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+            **research_options) -> Iterator[DeepResearchManyResult]:
+        """
+        Run deep research for many queries concurrently, yielding results as each job finishes.
+
+        Jobs are started and polled by AsyncFirecrawlApp.deep_research_many on a private
+        event loop driven from the calling thread, so callbacks run on this thread. Call
+        the async client instead from code that already runs an event loop.
+
+        Args:
+            queries (List[str]): Research queries
+            concurrency (int): Maximum number of research jobs running at once
+            poll_interval (float): Seconds between status sweeps
+            on_activity (Optional[Callable]): Called with (index, activity) for each new activity of a job
+            on_source (Optional[Callable]): Called with (index, source) for each new source of a job
+            **research_options: Options passed to async_deep_research for every query
+
+        Returns:
+            Iterator[DeepResearchManyResult]: One result per query in completion order; failures carry `error` instead of raising
+        """
+        return _iterate_async(self._async_client().deep_research_many(
+            queries,
+            concurrency=concurrency,
+            poll_interval=poll_interval,
+            on_activity=on_activity,
+            on_source=on_source,
+            **research_options
+        ))
+
     def _validate_kwargs(self, kwargs: Dict[str, Any], method_name: str) -> None:
         """
         Validate additional keyword arguments before they are passed to the API.
@@ -2499,21 +5488,13 @@ class FirecrawlApp:
 
     def _ensure_schema_dict(self, schema):
         """
-        Utility to ensure a schema is a dict, not a Pydantic model class. Recursively checks dicts and lists.
-        """
-        if schema is None:
-            return schema
-        if isinstance(schema, type):
-            # Pydantic v1/v2 model class
-            if hasattr(schema, 'model_json_schema'):
-                return schema.model_json_schema()
-            elif hasattr(schema, 'schema'):
-                return schema.schema()
-        if isinstance(schema, dict):
-            return {k: self._ensure_schema_dict(v) for k, v in schema.items()}
-        if isinstance(schema, (list, tuple)):
-            return [self._ensure_schema_dict(v) for v in schema]
-        return schema
+        Utility to ensure a schema is a dict, not a Pydantic model class. Model classes
+        nested in dicts and lists are converted too; results are cached FrozenSchemas.
+        """
+        return _compile_schema(schema)
+
+class _ConnectionLost(Exception):
+    """Wraps a transport error raised while receiving, as opposed to one raised by a handler or sink."""
 
 class CrawlWatcher:
     """
@@ -2526,47 +5507,399 @@ class CrawlWatcher:
         status (str): Current status of the crawl job
         ws_url (str): WebSocket URL for the crawl job
         event_handlers (dict): Dictionary of event type to list of handler functions
+        near_duplicate_filter (Optional[NearDuplicateFilter]): Filter applied to incoming documents
+        max_buffered (Optional[int]): Maximum number of undelivered events; when full the reader waits for handlers
+        backpressure_waits (int): Number of times the reader had to wait for a full buffer
+        handler_concurrency (int): Maximum concurrent invocations of each coroutine or offloaded handler
+        offload_sync_handlers (bool): Run plain handlers in `executor` instead of the receive loop
+        executor (Optional[Executor]): Executor for offloaded handlers (the loop's default when None)
+        handler_latency (Dict[str, LatencyHistogram]): Latency histogram per registered handler, labelled with its
+            qualified name; further handlers with the same name (e.g. lambdas) get a "#2", "#3", ... suffix
+        max_reconnects (int): Consecutive failed connection attempts before falling back to polling
+        backoff_factor (float): Reconnect delay is backoff_factor * (2 ** attempt) seconds, capped at 30
+        poll_interval (int): Seconds between status polls when polling
+        fallback_to_polling (bool): Poll the status endpoint when the WebSocket cannot be used
+        reconnects (int): Number of times the WebSocket was re-established
+        retain (str): What to keep in memory: "all" documents in `data`, only their "ids", or "none"
+        max_seen (Optional[int]): Number of most recent document keys remembered to skip redelivered
+            documents; unbounded when None. Defaults to DEFAULT_MAX_SEEN with retain "none", so memory
+            stays bounded (pass a NearDuplicateFilter with max_entries for the same on the filter)
+        ids (List[str]): Scrape IDs (or source URLs) of received documents when retain is "ids"
+        sink: Where each document is written as it arrives: a file path or writable file (JSON lines),
+            a queue.Queue or asyncio.Queue, or a function or coroutine function
+        document_count (int): Number of documents received
+        batch_size (Optional[int]): Deliver documents as 'documents' events of up to this many documents
+            instead of one 'document' event each; function sinks then receive lists
+        batch_interval (float): Maximum seconds a document waits in an incomplete batch
+        job_type (str): "crawl", or "batch" for a batch scrape; selects the status endpoint used when polling
     """
-    def __init__(self, id: str, app: FirecrawlApp):
+    # Keys remembered with retain "none"; a reconnect catchup may redeliver older documents
+    DEFAULT_MAX_SEEN = 100000
+
+    def __init__(
+            self,
+            id: str,
+            app: FirecrawlApp,
+            near_duplicate_filter: Optional[NearDuplicateFilter] = None,
+            max_buffered: Optional[int] = None,
+            handler_concurrency: int = 1,
+            offload_sync_handlers: bool = False,
+            executor: Optional[concurrent.futures.Executor] = None,
+            max_reconnects: int = 5,
+            backoff_factor: float = 0.5,
+            poll_interval: int = 2,
+            fallback_to_polling: bool = True,
+            retain: Literal["all", "ids", "none"] = "all",
+            sink: Optional[Union[str, os.PathLike, IO, queue.Queue, 'asyncio.Queue', Callable[[Dict[str, Any]], Any]]] = None,
+            batch_size: Optional[int] = None,
+            batch_interval: float = 0.1,
+            job_type: Literal["crawl", "batch"] = "crawl",
+            max_seen: Optional[int] = None):
+        if retain not in ("all", "ids", "none"):
+            raise ValueError(f"Unknown retain mode: {retain}")
+        if job_type not in ("crawl", "batch"):
+            raise ValueError(f"Unknown job type: {job_type}")
         self.id = id
         self.app = app
         self.data: List[Dict[str, Any]] = []
         self.status = "scraping"
         self.ws_url = f"{app.api_url.replace('http', 'ws')}/v1/crawl/{id}"
+        self.job_type = job_type
+        self.near_duplicate_filter = near_duplicate_filter
+        self.max_buffered = max_buffered
+        self.backpressure_waits = 0
+        if max_seen is None and retain == 'none':
+            max_seen = self.DEFAULT_MAX_SEEN
+        self.max_seen = max_seen
+        # Document key -> None in least recently seen order
+        self._seen: 'collections.OrderedDict[int, None]' = collections.OrderedDict()
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatch_error: Optional[BaseException] = None
+        self.handler_concurrency = max(1, handler_concurrency)
+        self.offload_sync_handlers = offload_sync_handlers
+        self.executor = executor
+        self.handler_latency: Dict[str, LatencyHistogram] = {}
+        # (event type, id(handler)) -> label in handler_latency; handlers stay referenced by event_handlers
+        self._handler_labels: Dict[Tuple[str, int], str] = {}
+        self._semaphores: Dict[int, asyncio.Semaphore] = {}
+        self._pending: Set[asyncio.Future] = set()
+        self.max_reconnects = max_reconnects
+        self.backoff_factor = backoff_factor
+        self.poll_interval = poll_interval
+        self.fallback_to_polling = fallback_to_polling
+        self.reconnects = 0
+        self._finished = False
+        self._received = 0
+        # Documents of the job received so far, in server order; the skip offset when polling
+        self._document_offset = 0
+        self.retain = retain
+        self.ids: List[str] = []
+        self.sink = sink
+        self.document_count = 0
+        self._sink_file: Optional[IO] = None
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._batch: List[Dict[str, Any]] = []
+        self._batch_duplicates: Dict[int, str] = {}
+        self._batch_lock: Optional[asyncio.Lock] = None
+        self._batch_timer: Optional[asyncio.Future] = None
         self.event_handlers = {
             'done': [],
             'error': [],
-            'document': []
+            'document': [],
+            'documents': []
         }
 
     async def connect(self) -> None:
         """
-        Establishes WebSocket connection and starts listening for messages.
+        Watches the job until it finishes, delivering every document once.
+
+        Dropped connections are re-established with exponential backoff; the catchup
+        sent on reconnect only delivers documents that were not seen yet. After
+        `max_reconnects` consecutive failures, or when the WebSocket handshake is
+        rejected (e.g. by a proxy), the watcher falls back to polling the status
+        endpoint incrementally.
+
+        Raises:
+            Exception: If the connection is lost and `fallback_to_polling` is disabled
+        """
+        try:
+            await self._watch()
+        finally:
+            self._close_sink()
+
+    async def _watch(self) -> None:
+        failures = 0
+        last_error: Optional[BaseException] = None
+        while not self._finished:
+            received = self._received
+            connected = False
+            try:
+                async with websockets.connect(
+                    self.ws_url,
+                    additional_headers=[("Authorization", f"Bearer {self.app.api_key}")]
+                ) as websocket:
+                    connected = True
+                    await self._listen(websocket)
+            except (websockets.exceptions.InvalidHandshake, websockets.exceptions.InvalidURI) as e:
+                logger.warning("WebSocket unavailable for job %s: %s", self.id, e)
+                last_error = e
+                break
+            except _ConnectionLost as e:
+                last_error = e.__cause__
+            except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+                if connected:
+                    # Raised by a handler or the sink: the documents are already marked as
+                    # seen, so reconnecting would silently lose them
+                    raise
+                last_error = e
+            if self._finished:
+                return
+            failures = 1 if self._received > received else failures + 1
+            if failures > self.max_reconnects:
+                break
+            delay = min(self.backoff_factor * (2 ** (failures - 1)), 30)
+            logger.info("WebSocket for job %s closed, reconnecting in %ss", self.id, delay)
+            await asyncio.sleep(delay)
+            self.reconnects += 1
+
+        if self._finished:
+            return
+        if not self.fallback_to_polling:
+            raise Exception(f"Lost connection to job {self.id}") from last_error
+        await self._poll()
+
+    @contextlib.asynccontextmanager
+    async def _delivery(self):
+        """
+        Sets up event delivery for one connection and flushes it on exit.
+
+        When `max_buffered` is set, events are delivered from a bounded queue by a
+        separate task, and the reader stops consuming input while the queue is full.
         """
-        async with websockets.connect(
-            self.ws_url,
-            additional_headers=[("Authorization", f"Bearer {self.app.api_key}")]
-        ) as websocket:
-            await self._listen(websocket)
+        consumer = None
+        self._semaphores = {}
+        self._batch_lock = asyncio.Lock()
+        if self.max_buffered:
+            self._queue = asyncio.Queue(maxsize=self.max_buffered)
+            consumer = asyncio.ensure_future(self._consume_queue())
+        try:
+            yield
+            await self._flush_batch()
+            if consumer is not None:
+                await self._queue.join()
+            await self._wait_pending()
+        finally:
+            if self._batch_timer is not None:
+                self._batch_timer.cancel()
+                self._batch_timer = None
+            if consumer is not None:
+                consumer.cancel()
+                self._queue = None
+        if self._dispatch_error is not None:
+            error, self._dispatch_error = self._dispatch_error, None
+            raise error
 
     async def _listen(self, websocket) -> None:
         """
         Listens for incoming WebSocket messages and handles them.
 
+        The server reports completion and errors in the close frame's reason, so that
+        is handled as a final message once the socket closes.
+
         Args:
             websocket: The WebSocket connection object
         """
-        async for message in websocket:
-            msg = json.loads(message)
-            await self._handle_message(msg)
+        async with self._delivery():
+            messages = websocket.__aiter__()
+            while True:
+                try:
+                    message = await messages.__anext__()
+                except (StopAsyncIteration, websockets.exceptions.ConnectionClosed):
+                    break
+                except (OSError, asyncio.TimeoutError, websockets.exceptions.WebSocketException) as e:
+                    raise _ConnectionLost(e) from e
+                self._received += 1
+                msg = json.loads(message)
+                await self._handle_message(msg)
+            close_message = self._parse_close_reason(getattr(websocket, 'close_reason', None))
+            if close_message is not None and not self._finished:
+                await self._handle_message(close_message)
+
+    @staticmethod
+    def _parse_close_reason(reason: Optional[str]) -> Optional[Dict[str, Any]]:
+        if not reason:
+            return None
+        try:
+            msg = json.loads(reason)
+        except ValueError:
+            return None
+        if isinstance(msg, dict) and msg.get('type') in ('done', 'error'):
+            return msg
+        return None
+
+    async def _poll(self) -> None:
+        """
+        Follows the job through the status endpoint, fetching only documents past
+        the ones already received.
+        """
+        path = 'batch/scrape' if self.job_type == 'batch' else 'crawl'
+        url = f"{self.app.api_url}/v1/{path}/{self.id}"
+        async with self._delivery():
+            while not self._finished:
+                offset = self._document_offset
+                status_data = await self._fetch_status(f"{url}?skip={offset}")
+                docs = status_data.get('data') or []
+                for index, doc in enumerate(docs):
+                    await self._on_document(doc, offset + index)
+                self.status = status_data.get('status', self.status)
+                if status_data.get('next') and docs:
+                    continue
+                if self.status == 'completed':
+                    await self._handle_message({'type': 'done'})
+                elif self.status in ('failed', 'cancelled'):
+                    await self._handle_message({'type': 'error', 'error': status_data.get('error') or f"Job {self.status}"})
+                else:
+                    await asyncio.sleep(self.poll_interval)
+
+    async def _fetch_status(self, url: str) -> Dict[str, Any]:
+        """
+        Fetches one page of job status without blocking the event loop.
+
+        Connection errors, rate limiting and server errors are retried up to
+        `max_reconnects` times with the reconnect backoff; other errors are raised.
+
+        Args:
+            url (str): Status URL including the skip offset
+
+        Returns:
+            Dict[str, Any]: The parsed status response
+        """
+        headers = self.app._prepare_headers()
+        action = 'check batch scrape status' if self.job_type == 'batch' else 'check crawl status'
+        for attempt in range(self.max_reconnects + 1):
+            try:
+                response = await asyncio.get_running_loop().run_in_executor(
+                    None, functools.partial(self.app._get_request, url, headers)
+                )
+            except requests.RequestException as e:
+                if attempt == self.max_reconnects:
+                    raise
+                logger.info("Status check for job %s failed: %s", self.id, e)
+            else:
+                if response.status_code == 200:
+                    return response.json()
+                if attempt == self.max_reconnects or (response.status_code < 500 and response.status_code != 429):
+                    self.app._handle_error(response, action)
+                logger.info("Status check for job %s returned %s", self.id, response.status_code)
+            await asyncio.sleep(min(self.backoff_factor * (2 ** attempt), 30))
+
+    async def _consume_queue(self) -> None:
+        """
+        Delivers buffered events to handlers in order.
+        """
+        while True:
+            event_type, detail = await self._queue.get()
+            try:
+                if self._dispatch_error is None:
+                    await self._dispatch(event_type, detail)
+            except Exception as e:
+                self._dispatch_error = e
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, event_type: str, detail: Dict[str, Any]) -> None:
+        """
+        Dispatches an event directly, or enqueues it when a buffer is configured.
+
+        Args:
+            event_type (str): Type of event to deliver
+            detail (Dict[str, Any]): Event details/data to pass to handlers
+        """
+        if self._dispatch_error is not None:
+            error, self._dispatch_error = self._dispatch_error, None
+            raise error
+        if self._queue is None:
+            await self._dispatch(event_type, detail)
+            return
+        if self._queue.full():
+            self.backpressure_waits += 1
+        await self._queue.put((event_type, detail))
+
+    async def _dispatch(self, event_type: str, detail: Dict[str, Any]) -> None:
+        """
+        Dispatches an event from the receive loop without waiting on slow handlers.
+
+        Coroutine handlers (and plain handlers when `offload_sync_handlers` is set) run
+        as background tasks, at most `handler_concurrency` at a time per handler; the
+        loop only waits when a handler is at its limit. Other plain handlers are called
+        inline. 'done' and 'error' are dispatched after pending document (and batch) handlers finish.
+
+        Args:
+            event_type (str): Type of event to dispatch
+            detail (Dict[str, Any]): Event details/data to pass to handlers
+        """
+        if event_type in ('done', 'error'):
+            await self._wait_pending()
+        for handler in self.event_handlers.get(event_type, []):
+            if asyncio.iscoroutinefunction(handler) or self.offload_sync_handlers:
+                semaphore = self._semaphores.get(id(handler))
+                if semaphore is None:
+                    semaphore = self._semaphores[id(handler)] = asyncio.Semaphore(self.handler_concurrency)
+                await semaphore.acquire()
+                task = asyncio.ensure_future(self._run_handler(event_type, handler, detail, semaphore))
+                self._pending.add(task)
+                task.add_done_callback(self._pending.discard)
+            else:
+                start = time.perf_counter()
+                try:
+                    handler(detail)
+                finally:
+                    self._record_latency(event_type, handler, time.perf_counter() - start)
+
+    async def _run_handler(self, event_type: str, handler: Callable, detail: Dict[str, Any], semaphore: 'asyncio.Semaphore') -> None:
+        """
+        Runs one handler invocation in the background, keeping the first error for the listener.
+        """
+        start = time.perf_counter()
+        try:
+            if asyncio.iscoroutinefunction(handler):
+                await handler(detail)
+            else:
+                await asyncio.get_running_loop().run_in_executor(self.executor, handler, detail)
+        except Exception as e:
+            if self._dispatch_error is None:
+                self._dispatch_error = e
+        finally:
+            self._record_latency(event_type, handler, time.perf_counter() - start)
+            semaphore.release()
+
+    async def _wait_pending(self) -> None:
+        """
+        Waits for all background handler invocations to finish.
+        """
+        while self._pending:
+            await asyncio.gather(*list(self._pending))
+
+    def _record_latency(self, event_type: str, handler: Callable, seconds: float) -> None:
+        label = self._handler_labels.get((event_type, id(handler)))
+        if label is None:
+            name = getattr(handler, '__qualname__', None) or repr(handler)
+            label, suffix = name, 1
+            while label in self.handler_latency:
+                suffix += 1
+                label = f'{name}#{suffix}'
+            self._handler_labels[(event_type, id(handler))] = label
+            self.handler_latency[label] = LatencyHistogram()
+        self.handler_latency[label].record(seconds)
 
     def add_event_listener(self, event_type: str, handler: Callable[[Dict[str, Any]], None]) -> None:
         """
         Adds an event handler function for a specific event type.
 
         Args:
-            event_type (str): Type of event to listen for ('done', 'error', or 'document')
-            handler (Callable): Function to handle the event
+            event_type (str): Type of event to listen for ('done', 'error', 'document', or 'documents' when batching)
+            handler (Callable): Function or coroutine function to handle the event
         """
         if event_type in self.event_handlers:
             self.event_handlers[event_type].append(handler)
@@ -2591,25 +5924,316 @@ class CrawlWatcher:
             msg (Dict[str, Any]): The message to handle
         """
         if msg['type'] == 'done':
+            await self._flush_batch()
             self.status = 'completed'
-            self.dispatch_event('done', {'status': self.status, 'data': self.data, 'id': self.id})
+            self._finished = True
+            await self._deliver('done', self._summary())
         elif msg['type'] == 'error':
+            await self._flush_batch()
             self.status = 'failed'
-            self.dispatch_event('error', {'status': self.status, 'data': self.data, 'error': msg['error'], 'id': self.id})
+            self._finished = True
+            await self._deliver('error', {**self._summary(), 'error': msg['error']})
         elif msg['type'] == 'catchup':
             self.status = msg['data']['status']
-            self.data.extend(msg['data'].get('data', []))
-            for doc in self.data:
-                self.dispatch_event('document', {'data': doc, 'id': self.id})
+            # A catchup carries every document of the job so far; only unseen ones are delivered
+            for index, doc in enumerate(msg['data'].get('data', [])):
+                await self._on_document(doc, index)
         elif msg['type'] == 'document':
-            self.data.append(msg['data'])
-            self.dispatch_event('document', {'data': msg['data'], 'id': self.id})
+            await self._on_document(msg['data'], self._document_offset)
+
+    @staticmethod
+    def _document_key(doc: Dict[str, Any], position: int) -> int:
+        """
+        Computes a compact identity for a document.
+
+        Uses the scrape ID when present, else the document's position in the job, so
+        that a batch scraping the same URL twice still delivers both documents.
+
+        Args:
+            doc (Dict[str, Any]): The document
+            position (int): Index of the document among the job's documents
+
+        Returns:
+            int: A 64-bit hash identifying the document
+        """
+        metadata = doc.get('metadata') or {}
+        identity = metadata.get('scrapeId')
+        if not isinstance(identity, str):
+            identity = f'#{position}'
+        return int.from_bytes(hashlib.blake2b(identity.encode(), digest_size=8).digest(), 'big')
+
+    async def _on_document(self, doc: Dict[str, Any], position: int) -> None:
+        """
+        Records a newly received document and dispatches it, skipping documents that were
+        already delivered and applying the near-duplicate filter.
+
+        Args:
+            doc (Dict[str, Any]): The received document
+            position (int): Index of the document among the job's documents
+        """
+        key = self._document_key(doc, position)
+        if key in self._seen:
+            self._seen.move_to_end(key)
+            return
+        self._seen[key] = None
+        if self.max_seen is not None and len(self._seen) > self.max_seen:
+            self._seen.popitem(last=False)
+        self._document_offset = max(self._document_offset, position + 1)
+        detail = {'data': doc, 'id': self.id}
+        if self.near_duplicate_filter is not None:
+            duplicate_of = self.near_duplicate_filter.check(doc)
+            if duplicate_of is not None:
+                if self.near_duplicate_filter.mode == 'drop':
+                    return
+                detail['duplicateOf'] = duplicate_of
+        self.document_count += 1
+        if self.retain == 'all':
+            self.data.append(doc)
+        elif self.retain == 'ids':
+            metadata = doc.get('metadata') or {}
+            self.ids.append(metadata.get('scrapeId') or metadata.get('sourceURL') or doc.get('url'))
+        if self.batch_size:
+            await self._add_to_batch(doc, detail.get('duplicateOf'))
+            return
+        if self.sink is not None:
+            await self._write_sink([doc])
+        await self._deliver('document', detail)
+
+    async def _add_to_batch(self, doc: Dict[str, Any], duplicate_of: Optional[str]) -> None:
+        """
+        Adds a document to the current batch, flushing it when full.
+
+        Args:
+            doc (Dict[str, Any]): The received document
+            duplicate_of (Optional[str]): Key of the earlier near-duplicate in flag mode
+        """
+        if duplicate_of is not None:
+            self._batch_duplicates[len(self._batch)] = duplicate_of
+        self._batch.append(doc)
+        if len(self._batch) >= self.batch_size:
+            await self._flush_batch()
+        elif self._batch_timer is None:
+            self._batch_timer = asyncio.ensure_future(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.batch_interval)
+        self._batch_timer = None
+        try:
+            await self._flush_batch()
+        except Exception as e:
+            if self._dispatch_error is None:
+                self._dispatch_error = e
+
+    async def _flush_batch(self) -> None:
+        """
+        Writes the current batch to the sink and delivers it as a 'documents' event.
+        """
+        if not self._batch:
+            return
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
+        if self._batch_lock is None:
+            self._batch_lock = asyncio.Lock()
+        async with self._batch_lock:
+            if not self._batch:
+                return
+            docs, self._batch = self._batch, []
+            duplicates, self._batch_duplicates = self._batch_duplicates, {}
+            if self.sink is not None:
+                await self._write_sink(docs)
+            detail = {'data': docs, 'id': self.id}
+            if duplicates:
+                detail['duplicateOf'] = duplicates
+            await self._deliver('documents', detail)
+
+    def _summary(self) -> Dict[str, Any]:
+        """
+        Builds the detail of the final 'done' or 'error' event.
+
+        Returns:
+            Dict[str, Any]: Status, id and document count, plus `data` or `ids` depending on `retain`
+        """
+        summary = {'status': self.status, 'id': self.id, 'count': self.document_count}
+        if self.retain == 'all':
+            summary['data'] = self.data
+        elif self.retain == 'ids':
+            summary['ids'] = self.ids
+        if self.near_duplicate_filter is not None:
+            summary['duplicates'] = self.near_duplicate_filter.duplicates
+        return summary
+
+    async def _write_sink(self, docs: List[Dict[str, Any]]) -> None:
+        """
+        Writes documents to the configured sink.
+
+        Function sinks are called once per document, or once with the whole list
+        when `batch_size` is set.
+
+        Args:
+            docs (List[Dict[str, Any]]): The received documents
+        """
+        sink = self.sink
+        if isinstance(sink, (str, os.PathLike)) or hasattr(sink, 'write'):
+            if isinstance(sink, (str, os.PathLike)):
+                if self._sink_file is None:
+                    self._sink_file = open(sink, 'a', encoding='utf-8')
+                sink = self._sink_file
+            sink.write(''.join(json.dumps(doc, default=str) + '\n' for doc in docs))
+        elif isinstance(sink, asyncio.Queue):
+            for doc in docs:
+                await sink.put(doc)
+        elif isinstance(sink, queue.Queue):
+            for doc in docs:
+                await asyncio.get_running_loop().run_in_executor(None, sink.put, doc)
+        else:
+            for item in ([docs] if self.batch_size else docs):
+                result = sink(item)
+                if asyncio.iscoroutine(result):
+                    await result
+
+    def _close_sink(self) -> None:
+        """
+        Closes the sink file opened by the watcher, or flushes a caller-supplied one.
+        """
+        if self._sink_file is not None:
+            self._sink_file.close()
+            self._sink_file = None
+        elif hasattr(self.sink, 'flush'):
+            self.sink.flush()
+
+class ThreadedCrawlWatcher(CrawlWatcher):
+    """
+    CrawlWatcher for synchronous code: the connection runs on a background thread with
+    its own event loop, and events are read with a blocking iterator.
+
+        with app.crawl_url_and_watch('https://example.com') as watcher:
+            for event_type, detail in watcher:
+                ...
+
+    Iteration ends after the 'done' or 'error' event. Events pass through a queue of at
+    most `max_queued` entries; when the consumer falls behind, the background thread stops
+    reading from the connection, while the event loop keeps serving coroutine handlers
+    and keepalives. Registered event listeners are still called, on the background
+    thread. `connect()` can also be awaited directly as with CrawlWatcher.
+
+    Attributes:
+        max_queued (int): Maximum number of events waiting to be consumed
+    """
+    _END = object()
+
+    def __init__(self, id: str, app: FirecrawlApp, max_queued: int = 1000, **kwargs):
+        super().__init__(id, app, **kwargs)
+        self.max_queued = max_queued
+        self._events: queue.Queue = queue.Queue(maxsize=max_queued)
+        self._thread: Optional[threading.Thread] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._closing = threading.Event()
+        self._streaming = False
+        self._error: Optional[BaseException] = None
+
+    def start(self) -> 'ThreadedCrawlWatcher':
+        """
+        Starts watching on a background thread. Called automatically when iterating.
+
+        Returns:
+            ThreadedCrawlWatcher: The watcher itself
+        """
+        if self._thread is None:
+            self._streaming = True
+            # Created before the thread starts, so close() can always cancel the task
+            self._loop = asyncio.new_event_loop()
+            self._task = self._loop.create_task(self.connect())
+            self._thread = threading.Thread(target=self._run, name=f"firecrawl-watcher-{self.id}", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        try:
+            self._loop.run_until_complete(self._task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self._error = e
+        finally:
+            try:
+                self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            finally:
+                self._loop.close()
+            if self._closing.is_set():
+                # A consumer blocked in get() has an empty queue, so this cannot fail for it
+                try:
+                    self._events.put_nowait(self._END)
+                except queue.Full:
+                    pass
+            else:
+                self._put(self._END)
+
+    def _put(self, item: Any) -> None:
+        while not self._closing.is_set():
+            try:
+                self._events.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                self.backpressure_waits += 1
+
+    async def _dispatch(self, event_type: str, detail: Dict[str, Any]) -> None:
+        await super()._dispatch(event_type, detail)
+        if self._streaming:
+            item = (event_type, detail)
+            try:
+                self._events.put_nowait(item)
+            except queue.Full:
+                # Wait for room on an executor thread so the loop keeps running
+                # coroutine handlers and the connection's keepalive meanwhile
+                await asyncio.get_running_loop().run_in_executor(None, self._put, item)
+
+    def __iter__(self):
+        self.start()
+        while not self._closing.is_set():
+            try:
+                item = self._events.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if item is self._END:
+                break
+            yield item
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops watching and waits for the background thread to exit.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait for the thread
+        """
+        self._closing.set()
+        loop, task = self._loop, self._task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                # The loop has already finished
+                pass
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    def __enter__(self) -> 'ThreadedCrawlWatcher':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
 class AsyncFirecrawlApp(FirecrawlApp):
     """
     Asynchronous version of FirecrawlApp that implements async methods using aiohttp.
     Provides non-blocking alternatives to all FirecrawlApp operations.
     """
+    # Shared aiohttp session; a session per request is used when unset
+    _client_session: Optional['aiohttp.ClientSession'] = None
 
     async def _async_request(
             self,
@@ -2638,23 +6262,138 @@ class AsyncFirecrawlApp(FirecrawlApp):
             aiohttp.ClientError: If the request fails after all retries.
             Exception: If max retries are exceeded or other errors occur.
         """
-        async with aiohttp.ClientSession() as session:
-            for attempt in range(retries):
-                try:
-                    async with session.request(
-                        method=method, url=url, headers=headers, json=data
-                    ) as response:
-                        if response.status == 502:
-                            await asyncio.sleep(backoff_factor * (2 ** attempt))
-                            continue
-                        if response.status >= 300:
-                            await self._handle_error(response, f"make {method} request")
-                        return await response.json()
-                except aiohttp.ClientError as e:
-                    if attempt == retries - 1:
-                        raise e
+        if self.scheduler is None:
+            return await self._async_dispatch(method, url, headers, data, retries, backoff_factor)
+        queued = time.perf_counter()
+        async with self.scheduler.async_slot(method, url):
+            queue = time.perf_counter() - queued
+            return await self._async_dispatch(method, url, headers, data, retries, backoff_factor, queue)
+
+    async def _async_dispatch(
+            self,
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            data: Optional[Dict[str, Any]],
+            retries: int,
+            backoff_factor: float,
+            queue: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send a request on the shared session, or on a session of its own when none is set.
+        """
+        if self._client_session is None:
+            async with aiohttp.ClientSession(trace_configs=_trace_configs(self.hooks)) as session:
+                return await self._async_send(session, method, url, headers, data, retries, backoff_factor, queue)
+        return await self._async_send(self._client_session, method, url, headers, data, retries, backoff_factor, queue)
+
+    async def _async_send(
+            self,
+            session: 'aiohttp.ClientSession',
+            method: str,
+            url: str,
+            headers: Dict[str, str],
+            data: Optional[Dict[str, Any]],
+            retries: int,
+            backoff_factor: float,
+            queue: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Send a request on the given session, retrying as described in _async_request.
+
+        `queue` is the time the request waited for a scheduler slot, reported to the hooks.
+        """
+        request_logger = self.request_logger if self.request_logger is not None and self.request_logger.active() else None
+        hooks = self.hooks
+        for attempt in range(retries):
+            trace = None
+            if hooks is not None:
+                trace = RequestTrace(method, url, attempt)
+                if attempt == 0:
+                    trace.timings.queue = queue
+                hooks.on_request_start(trace)
+            start = time.perf_counter()
+            status = size = error = elapsed = None
+            retry = False
+            try:
+                async with session.request(
+                    method=method, url=url, headers=headers, json=data,
+                    **({'trace_request_ctx': trace.timings} if trace is not None else {})
+                ) as response:
+                    status = response.status
+                    if trace is not None:
+                        trace.status = status
+                        trace.timings.ttfb = time.perf_counter() - start - (trace.timings.connect or 0.0)
+                    if response.status == 502:
+                        elapsed = time.perf_counter() - start
+                        retry = attempt + 1 < retries
+                        continue
+                    if response.status >= 300:
+                        elapsed = time.perf_counter() - start
+                        await self._handle_error(response, f"make {method} request")
+                    if trace is None:
+                        result = await response.json()
+                    else:
+                        body_start = time.perf_counter()
+                        body = await response.read()
+                        decode_start = time.perf_counter()
+                        # json() decodes the body read() buffered
+                        result = await response.json()
+                        trace.timings.download = decode_start - body_start
+                        trace.timings.decode = time.perf_counter() - decode_start
+                        trace._payload = result
+                        _last_trace.set(trace)
+                    if request_logger is not None:
+                        elapsed = time.perf_counter() - start
+                        # The body is already buffered by json(); read() returns it again
+                        size = len(await response.read())
+                    return result
+            except aiohttp.ClientError as e:
+                error, elapsed = e, time.perf_counter() - start
+                if attempt == retries - 1:
+                    raise e
+                retry = True
+            finally:
+                if request_logger is not None:
+                    request_logger.record(method, url, status, size, elapsed if elapsed is not None else time.perf_counter() - start, error)
+                if trace is not None:
+                    if error is not None:
+                        trace.error = error
+                        trace.timings.ttfb = elapsed
+                    _end_trace(hooks, self._job_polls, trace)
+                    if retry:
+                        hooks.on_retry(trace)
+                if retry:
                     await asyncio.sleep(backoff_factor * (2 ** attempt))
-            raise Exception("Max retries exceeded")
+        raise Exception("Max retries exceeded")
+
+    async def _async_post_job(
+            self,
+            url: str,
+            data: Dict[str, Any],
+            headers: Dict[str, str],
+            auto_idempotency: bool = False) -> Dict[str, Any]:
+        """
+        Async counterpart of FirecrawlApp._post_job, returning the parsed response.
+        """
+        if not auto_idempotency or 'x-idempotency-key' in headers:
+            return await self._async_post_request(url, data, headers)
+        key, recorded = self.idempotency_registry.lookup(url, data)
+        if recorded is not None:
+            logger.debug("Re-attaching to job %s for idempotency key %s", recorded.get('id'), key)
+            return dict(recorded)
+        # Without a response (e.g. on a timeout) the reservation stays for the retry
+        self.idempotency_registry.reserve(key)
+        try:
+            response = await self._async_post_request(url, data, {**headers, 'x-idempotency-key': key})
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            raise
+        except Exception:
+            self.idempotency_registry.release(key)
+            raise
+        if response.get('success'):
+            self.idempotency_registry.record(key, response)
+        else:
+            self.idempotency_registry.release(key)
+        return response
 
     async def _async_post_request(
             self, url: str, data: Dict[str, Any], headers: Dict[str, str],
@@ -2701,7 +6440,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         """
         return await self._async_request("GET", url, headers, None, retries, backoff_factor)
 
-    async def _handle_error(self, response: aiohttp.ClientResponse, action: str) -> None:
+    async def _handle_error(self, response: 'aiohttp.ClientResponse', action: str) -> None:
         """
         Handle errors from async API responses with detailed error messages.
 
@@ -2710,7 +6449,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             action (str): Description of the action that was being attempted
 
         Raises:
-            aiohttp.ClientError: With a detailed error message based on the response status:
+            aiohttp.ClientError: With the response status in `status` and a detailed error message based on it:
                 - 402: Payment Required
                 - 408: Request Timeout
                 - 409: Conflict
@@ -2722,11 +6461,15 @@ class AsyncFirecrawlApp(FirecrawlApp):
             error_message = error_data.get('error', 'No error message provided.')
             error_details = error_data.get('details', 'No additional error details provided.')
         except:
-            raise aiohttp.ClientError(f'Failed to parse Firecrawl error response as JSON. Status code: {response.status}')
+            error = aiohttp.ClientError(f'Failed to parse Firecrawl error response as JSON. Status code: {response.status}')
+            error.status = response.status
+            raise error
 
         message = await self._get_async_error_message(response.status, action, error_message, error_details)
 
-        raise aiohttp.ClientError(message)
+        error = aiohttp.ClientError(message)
+        error.status = response.status
+        raise error
 
     async def _get_async_error_message(self, status_code: int, action: str, error_message: str, error_details: str) -> str:
         """
@@ -2747,7 +6490,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
             self,
             url: str,
             params: Optional[CrawlParams] = None,
-            idempotency_key: Optional[str] = None) -> 'AsyncCrawlWatcher':
+            idempotency_key: Optional[str] = None,
+            auto_idempotency: bool = False,
+            near_duplicate_filter: Optional[NearDuplicateFilter] = None) -> 'AsyncCrawlWatcher':
         """
         Initiate an async crawl job and return an AsyncCrawlWatcher to monitor progress via WebSocket.
 
@@ -2773,6 +6518,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
             * ignoreQueryParameters - Ignore URL parameters
             * regexOnFullURL - Apply regex to full URLs
           idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+          auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+              in this process (see IdempotencyRegistry for the limits)
+          near_duplicate_filter (Optional[NearDuplicateFilter]): Client-side filter applied to streamed documents
 
         Returns:
           AsyncCrawlWatcher: An instance to monitor the crawl job via WebSocket
@@ -2780,9 +6528,14 @@ class AsyncFirecrawlApp(FirecrawlApp):
         Raises:
           Exception: If crawl job fails to start
         """
-        crawl_response = await self.async_crawl_url(url, params, idempotency_key)
-        if crawl_response.get('success') and 'id' in crawl_response:
-            return AsyncCrawlWatcher(crawl_response['id'], self)
+        crawl_response = await self.async_crawl_url(
+            url,
+            idempotency_key=idempotency_key,
+            auto_idempotency=auto_idempotency,
+            **(_model_dump(params) if params else {})
+        )
+        if crawl_response.success and crawl_response.id:
+            return AsyncCrawlWatcher(crawl_response.id, self, near_duplicate_filter=near_duplicate_filter)
         else:
             raise Exception("Crawl job failed to start")
 
@@ -2790,7 +6543,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
             self,
             urls: List[str],
             params: Optional[ScrapeParams] = None,
-            idempotency_key: Optional[str] = None) -> 'AsyncCrawlWatcher':
+            idempotency_key: Optional[str] = None,
+            auto_idempotency: bool = False,
+            near_duplicate_filter: Optional[NearDuplicateFilter] = None) -> 'AsyncCrawlWatcher':
         """
         Initiate an async batch scrape job and return an AsyncCrawlWatcher to monitor progress.
 
@@ -2815,6 +6570,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
               * jsonOptions - JSON extraction config
               * actions - Actions to perform
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
+            near_duplicate_filter (Optional[NearDuplicateFilter]): Client-side filter applied to streamed documents
 
         Returns:
             AsyncCrawlWatcher: An instance to monitor the batch scrape job via WebSocket
@@ -2822,9 +6580,19 @@ class AsyncFirecrawlApp(FirecrawlApp):
         Raises:
             Exception: If batch scrape job fails to start
         """
-        batch_response = await self.async_batch_scrape_urls(urls, params, idempotency_key)
-        if batch_response.get('success') and 'id' in batch_response:
-            return AsyncCrawlWatcher(batch_response['id'], self)
+        # async_batch_scrape_urls takes the ScrapeParams fields as snake_case keywords
+        options = {
+            re.sub(r'(?<!^)(?=[A-Z])', '_', key).lower(): value
+            for key, value in (_model_dump(params) if params else {}).items()
+        }
+        batch_response = await self.async_batch_scrape_urls(
+            urls,
+            idempotency_key=idempotency_key,
+            auto_idempotency=auto_idempotency,
+            **options
+        )
+        if batch_response.success and batch_response.id:
+            return AsyncCrawlWatcher(batch_response.id, self, near_duplicate_filter=near_duplicate_filter, job_type='batch')
         else:
             raise Exception("Batch scrape job failed to start")
 
@@ -2847,6 +6615,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             extract: Optional[JsonConfig] = None,
             json_options: Optional[JsonConfig] = None,
             actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction]]] = None,
+            validation: Optional[Literal["strict", "lenient"]] = None,
             **kwargs) -> ScrapeResponse[Any]:
         """
         Scrape a single URL asynchronously.
@@ -2868,6 +6637,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
           extract (Optional[JsonConfig]): Content extraction settings
           json_options (Optional[JsonConfig]): JSON extraction settings
           actions (Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction]]]): Actions to perform
+          validation (Optional[Literal["strict", "lenient"]]): Bind `json` to the json_options schema model; lenient mode collects per-field errors in `validationErrors` instead of raising
           **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -2884,9 +6654,12 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         Raises:
             Exception: If scraping fails
+            ValueError: If validation is requested without a schema model
+            pydantic.ValidationError: If strict validation fails
         """
         # Validate any additional kwargs
         self._validate_kwargs(kwargs, "scrape_url")
+        schema_model = _schema_model(json_options, validation)
 
         headers = self._prepare_headers()
 
@@ -2910,7 +6683,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if timeout:
             scrape_params['timeout'] = timeout
         if location:
-            scrape_params['location'] = location.dict(exclude_none=True)
+            scrape_params['location'] = _model_dump(location)
         if mobile is not None:
             scrape_params['mobile'] = mobile
         if skip_tls_verification is not None:
@@ -2922,22 +6695,13 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if proxy:
             scrape_params['proxy'] = proxy
         if extract is not None:
-            extract = self._ensure_schema_dict(extract)
-            if isinstance(extract, dict) and "schema" in extract:
-                extract["schema"] = self._ensure_schema_dict(extract["schema"])
-            scrape_params['extract'] = extract if isinstance(extract, dict) else extract.dict(exclude_none=True)
+            scrape_params['extract'] = _schema_options(extract)
         if json_options is not None:
-            json_options = self._ensure_schema_dict(json_options)
-            if isinstance(json_options, dict) and "schema" in json_options:
-                json_options["schema"] = self._ensure_schema_dict(json_options["schema"])
-            scrape_params['jsonOptions'] = json_options if isinstance(json_options, dict) else json_options.dict(exclude_none=True)
+            scrape_params['jsonOptions'] = _schema_options(json_options)
         if actions:
-            scrape_params['actions'] = [action if isinstance(action, dict) else action.dict(exclude_none=True) for action in actions]
+            scrape_params['actions'] = [_model_dump(action) for action in actions]
 
-        if 'extract' in scrape_params and scrape_params['extract'] and 'schema' in scrape_params['extract']:
-            scrape_params['extract']['schema'] = self._ensure_schema_dict(scrape_params['extract']['schema'])
-        if 'jsonOptions' in scrape_params and scrape_params['jsonOptions'] and 'schema' in scrape_params['jsonOptions']:
-            scrape_params['jsonOptions']['schema'] = self._ensure_schema_dict(scrape_params['jsonOptions']['schema'])
+        _compile_option_schemas(scrape_params)
 
         # Make async request
         endpoint = f'/v1/scrape'
@@ -2948,7 +6712,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
         )
 
         if response.get('success') and 'data' in response:
-            return ScrapeResponse(**response['data'])
+            if schema_model is not None:
+                return _bind_schema(ScrapeResponse, schema_model, response['data'], validation, 'json')
+            return _validate_model(ScrapeResponse, response['data'])
         elif "error" in response:
             raise Exception(f'Failed to scrape URL. Error: {response["error"]}')
         else:
@@ -2979,6 +6745,14 @@ class AsyncFirecrawlApp(FirecrawlApp):
         agent: Optional[AgentOptions] = None,
         poll_interval: Optional[int] = 2,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
+        compact_metadata: bool = False,
+        shard_size: Optional[int] = None,
+        max_concurrent_shards: Optional[int] = None,
+        shard_retries: int = 0,
+        retry_failed: int = 0,
+        retry_escalation: Optional[List[Dict[str, Any]]] = None,
+        canonicalize: Union[bool, UrlCanonicalizer] = False,
         **kwargs
     ) -> BatchScrapeStatusResponse:
         """
@@ -3005,6 +6779,18 @@ class AsyncFirecrawlApp(FirecrawlApp):
             agent (Optional[AgentOptions]): Agent configuration
             poll_interval (Optional[int]): Seconds between status checks (default: 2)
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
+            compact_metadata (bool): Store page metadata in a shared, interned MetadataTable
+            shard_size (Optional[int]): Split `urls` into sub-jobs of at most this many URLs
+            max_concurrent_shards (Optional[int]): Maximum number of sub-jobs running at once (default: all)
+            shard_retries (int): Times a failed sub-job is submitted again
+            retry_failed (int): Rounds of resubmitting the URLs listed by the errors endpoint
+                (robots-blocked URLs excluded); results are merged into the response
+            retry_escalation (Optional[List[Dict[str, Any]]]): Parameter overrides per retry round, the
+                last one repeating (default: stealth proxy, then stealth proxy with twice the timeout)
+            canonicalize (Union[bool, UrlCanonicalizer]): Canonicalize and deduplicate `urls` before
+                submission; `canonicalUrls` and documents_by_input() map results back to every input URL
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3037,7 +6823,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if timeout is not None:
             scrape_params['timeout'] = timeout
         if location is not None:
-            scrape_params['location'] = location.dict(exclude_none=True)
+            scrape_params['location'] = _model_dump(location)
         if mobile is not None:
             scrape_params['mobile'] = mobile
         if skip_tls_verification is not None:
@@ -3049,50 +6835,60 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if proxy is not None:
             scrape_params['proxy'] = proxy
         if extract is not None:
-            extract = self._ensure_schema_dict(extract)
-            if isinstance(extract, dict) and "schema" in extract:
-                extract["schema"] = self._ensure_schema_dict(extract["schema"])
-            scrape_params['extract'] = extract if isinstance(extract, dict) else extract.dict(exclude_none=True)
+            scrape_params['extract'] = _schema_options(extract)
         if json_options is not None:
-            json_options = self._ensure_schema_dict(json_options)
-            if isinstance(json_options, dict) and "schema" in json_options:
-                json_options["schema"] = self._ensure_schema_dict(json_options["schema"])
-            scrape_params['jsonOptions'] = json_options if isinstance(json_options, dict) else json_options.dict(exclude_none=True)
+            scrape_params['jsonOptions'] = _schema_options(json_options)
         if actions is not None:
-            scrape_params['actions'] = [action.dict(exclude_none=True) for action in actions]
+            scrape_params['actions'] = [_model_dump(action) for action in actions]
         if agent is not None:
-            scrape_params['agent'] = agent.dict(exclude_none=True)
+            scrape_params['agent'] = _model_dump(agent)
 
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
         # Create final params object
         final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
+        canonicalizer = _resolve_canonicalizer(canonicalize)
+        url_map = None
+        if canonicalizer is not None:
+            urls, url_map = canonicalizer.dedupe(urls)
         params_dict['urls'] = urls
         params_dict['origin'] = f"python-sdk@{version}"
 
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
-
-        # Make request
-        headers = self._prepare_headers(idempotency_key)
-        response = await self._async_post_request(
-            f'{self.api_url}/v1/batch/scrape',
-            params_dict,
-            headers
-        )
+        _compile_option_schemas(params_dict, scrape_params)
 
-        if response.get('success'):
-            try:
-                id = response.get('id')
-            except:
-                raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return await self._async_monitor_job_status(id, headers, poll_interval)
+        if shard_size and len(urls) > shard_size:
+            if auto_idempotency and idempotency_key is None:
+                # Shards use keys derived from it and re-attach to the shard jobs recorded under them
+                idempotency_key, _ = self.idempotency_registry.lookup(f'{self.api_url}/v1/batch/scrape', {**params_dict, 'shardSize': shard_size})
+                self.idempotency_registry.reserve(idempotency_key)
+            batch = _ShardedBatch(urls, shard_size, max_concurrent_shards, shard_retries, compact_metadata)
+            status = await self._async_monitor_sharded_batch(batch, params_dict, idempotency_key, poll_interval)
+            job_ids = [shard.id for shard in status.shards if shard.id]
         else:
-            self._handle_error(response, 'start batch scrape job')
+            # Make request
+            headers = self._prepare_headers(idempotency_key)
+            response = await self._async_post_job(f'{self.api_url}/v1/batch/scrape', params_dict, headers, auto_idempotency)
+
+            if response.get('success'):
+                try:
+                    id = response.get('id')
+                except:
+                    raise Exception(f'Failed to parse Firecrawl response as JSON.')
+                status = await self._async_monitor_job_status(id, headers, poll_interval, compact_metadata)
+                job_ids = [id]
+            else:
+                self._handle_error(response, 'start batch scrape job')
+
+        if retry_failed:
+            retry = _BatchRetry(status, params_dict, retry_failed, retry_escalation)
+            for errors in await asyncio.gather(*(self.check_batch_scrape_errors(id) for id in job_ids)):
+                retry.add_errors(errors)
+            status = await self._async_retry_failed_batch_urls(retry, poll_interval, compact_metadata)
+        if url_map is not None:
+            status = _as_batch_status(status, canonicalUrls=url_map)
+        return status
 
 
     async def async_batch_scrape_urls(
@@ -3117,6 +6913,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         actions: Optional[List[Union[WaitAction, ScreenshotAction, ClickAction, WriteAction, PressAction, ScrollAction, ScrapeAction, ExecuteJavascriptAction]]] = None,
         agent: Optional[AgentOptions] = None,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
         **kwargs
     ) -> BatchScrapeResponse:
         """
@@ -3142,6 +6939,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             actions (Optional[List[Union]]): Actions to perform
             agent (Optional[AgentOptions]): Agent configuration
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3175,7 +6974,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if timeout is not None:
             scrape_params['timeout'] = timeout
         if location is not None:
-            scrape_params['location'] = location.dict(exclude_none=True)
+            scrape_params['location'] = _model_dump(location)
         if mobile is not None:
             scrape_params['mobile'] = mobile
         if skip_tls_verification is not None:
@@ -3187,49 +6986,36 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if proxy is not None:
             scrape_params['proxy'] = proxy
         if extract is not None:
-            extract = self._ensure_schema_dict(extract)
-            if isinstance(extract, dict) and "schema" in extract:
-                extract["schema"] = self._ensure_schema_dict(extract["schema"])
-            scrape_params['extract'] = extract if isinstance(extract, dict) else extract.dict(exclude_none=True)
+            scrape_params['extract'] = _schema_options(extract)
         if json_options is not None:
-            json_options = self._ensure_schema_dict(json_options)
-            if isinstance(json_options, dict) and "schema" in json_options:
-                json_options["schema"] = self._ensure_schema_dict(json_options["schema"])
-            scrape_params['jsonOptions'] = json_options if isinstance(json_options, dict) else json_options.dict(exclude_none=True)
+            scrape_params['jsonOptions'] = _schema_options(json_options)
         if actions is not None:
-            scrape_params['actions'] = [action.dict(exclude_none=True) for action in actions]
+            scrape_params['actions'] = [_model_dump(action) for action in actions]
         if agent is not None:
-            scrape_params['agent'] = agent.dict(exclude_none=True)
+            scrape_params['agent'] = _model_dump(agent)
 
         # Add any additional kwargs
         scrape_params.update(kwargs)
 
         # Create final params object
         final_params = ScrapeParams(**scrape_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['urls'] = urls
         params_dict['origin'] = f"python-sdk@{version}"
 
-        if 'extract' in params_dict and params_dict['extract'] and 'schema' in params_dict['extract']:
-            params_dict['extract']['schema'] = self._ensure_schema_dict(params_dict['extract']['schema'])
-        if 'jsonOptions' in params_dict and params_dict['jsonOptions'] and 'schema' in params_dict['jsonOptions']:
-            params_dict['jsonOptions']['schema'] = self._ensure_schema_dict(params_dict['jsonOptions']['schema'])
+        _compile_option_schemas(params_dict, scrape_params)
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
-        response = await self._async_post_request(
-            f'{self.api_url}/v1/batch/scrape',
-            params_dict,
-            headers
-        )
+        response = await self._async_post_job(f'{self.api_url}/v1/batch/scrape', params_dict, headers, auto_idempotency)
 
-        if response.get('status_code') == 200:
+        if response.get('success'):
             try:
-                return BatchScrapeResponse(**response.json())
+                return _validate_model(BatchScrapeResponse, response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
-            self._handle_error(response, 'start batch scrape job')
+            raise Exception(f'Failed to start batch scrape job. Error: {response.get("error")}')
 
     async def crawl_url(
         self,
@@ -3251,6 +7037,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
         delay: Optional[int] = None,
         poll_interval: Optional[int] = 2,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
+        compact_metadata: bool = False,
         **kwargs
     ) -> CrawlStatusResponse:
         """
@@ -3274,6 +7062,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
             delay (Optional[int]): Delay in seconds between scrapes
             poll_interval (Optional[int]): Seconds between status checks (default: 2)
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
+            compact_metadata (bool): Store page metadata in a shared, interned MetadataTable
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3308,7 +7099,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if ignore_sitemap is not None:
             crawl_params['ignoreSitemap'] = ignore_sitemap
         if scrape_options is not None:
-            crawl_params['scrapeOptions'] = scrape_options.dict(exclude_none=True)
+            crawl_params['scrapeOptions'] = _model_dump(scrape_options)
         if webhook is not None:
             crawl_params['webhook'] = webhook
         if deduplicate_similar_urls is not None:
@@ -3325,20 +7116,19 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         # Create final params object
         final_params = CrawlParams(**crawl_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['url'] = url
         params_dict['origin'] = f"python-sdk@{version}"
         # Make request
         headers = self._prepare_headers(idempotency_key)
-        response = await self._async_post_request(
-          f'{self.api_url}/v1/crawl', params_dict, headers)
+        response = await self._async_post_job(f'{self.api_url}/v1/crawl', params_dict, headers, auto_idempotency)
 
         if response.get('success'):
             try:
                 id = response.get('id')
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
-            return await self._async_monitor_job_status(id, headers, poll_interval)
+            return await self._async_monitor_job_status(id, headers, poll_interval, compact_metadata)
         else:
             self._handle_error(response, 'start crawl job')
 
@@ -3363,6 +7153,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         delay: Optional[int] = None,
         poll_interval: Optional[int] = 2,
         idempotency_key: Optional[str] = None,
+        auto_idempotency: bool = False,
         **kwargs
     ) -> CrawlResponse:
         """
@@ -3384,6 +7175,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             ignore_query_parameters (Optional[bool]): Ignore URL parameters
             regex_on_full_url (Optional[bool]): Apply regex to full URLs
             idempotency_key (Optional[str]): Unique key to prevent duplicate requests
+            auto_idempotency (bool): Derive the idempotency key from the request and re-attach to a job it already started
+                in this process (see IdempotencyRegistry for the limits)
             **kwargs: Additional parameters to pass to the API
 
         Returns:
@@ -3416,7 +7209,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if ignore_sitemap is not None:
             crawl_params['ignoreSitemap'] = ignore_sitemap
         if scrape_options is not None:
-            crawl_params['scrapeOptions'] = scrape_options.dict(exclude_none=True)
+            crawl_params['scrapeOptions'] = _model_dump(scrape_options)
         if webhook is not None:
             crawl_params['webhook'] = webhook
         if deduplicate_similar_urls is not None:
@@ -3433,32 +7226,29 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         # Create final params object
         final_params = CrawlParams(**crawl_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['url'] = url
         params_dict['origin'] = f"python-sdk@{version}"
 
         # Make request
         headers = self._prepare_headers(idempotency_key)
-        response = await self._async_post_request(
-          f'{self.api_url}/v1/crawl',
-          params_dict,
-          headers
-        )
+        response = await self._async_post_job(f'{self.api_url}/v1/crawl', params_dict, headers, auto_idempotency)
 
         if response.get('success'):
             try:
-                return CrawlResponse(**response)
+                return _validate_model(CrawlResponse, response)
             except:
                 raise Exception(f'Failed to parse Firecrawl response as JSON.')
         else:
             self._handle_error(response, 'start crawl job')
 
-    async def check_crawl_status(self, id: str) -> CrawlStatusResponse:
+    async def check_crawl_status(self, id: str, compact_metadata: bool = False) -> CrawlStatusResponse:
         """
         Check the status and results of an asynchronous crawl job.
 
         Args:
             id (str): Unique identifier for the crawl job
+            compact_metadata (bool): Store page metadata in a shared, interned MetadataTable
 
         Returns:
             CrawlStatusResponse containing:
@@ -3488,7 +7278,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         if status_data.get('status') == 'completed':
             if 'data' in status_data:
+                table = MetadataTable() if compact_metadata else None
                 data = status_data['data']
+                if table is not None:
+                    table.compact_documents(data)
                 while 'next' in status_data:
                     if len(status_data['data']) == 0:
                         break
@@ -3497,7 +7290,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
                         logger.warning("Expected 'next' URL is missing.")
                         break
                     next_data = await self._async_get_request(next_url, headers)
-                    data.extend(next_data.get('data', []))
+                    page = next_data.get('data', [])
+                    if table is not None:
+                        table.compact_documents(page)
+                    data.extend(page)
                     status_data = next_data
                 status_data['data'] = data
         # Create CrawlStatusResponse object from status data
@@ -3519,7 +7315,122 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         return response
 
-    async def _async_monitor_job_status(self, id: str, headers: Dict[str, str], poll_interval: int = 2) -> CrawlStatusResponse:
+    async def _async_retry_failed_batch_urls(
+            self,
+            retry: _BatchRetry,
+            poll_interval: int,
+            compact_metadata: bool) -> BatchScrapeStatusResponse:
+        """
+        Async counterpart of FirecrawlApp._retry_failed_batch_urls.
+        """
+        headers = self._prepare_headers()
+        while True:
+            request = retry.next_request()
+            if request is None:
+                return retry.result()
+            try:
+                response = await self._async_post_request(f'{self.api_url}/v1/batch/scrape', request, headers)
+                retry.started(response.get('id'))
+                id = retry.retries[-1].id
+                retry.record(await self._async_monitor_job_status(id, headers, poll_interval, compact_metadata))
+                retry.add_errors(await self.check_batch_scrape_errors(id))
+            except Exception as e:
+                logger.warning("Batch scrape retry %d failed: %s", len(retry.retries), e)
+                retry.fail(str(e))
+
+    async def _async_monitor_sharded_batch(
+            self,
+            batch: _ShardedBatch,
+            params_dict: Dict[str, Any],
+            idempotency_key: Optional[str],
+            poll_interval: int) -> BatchScrapeStatusResponse:
+        """
+        Submit the shards of a batch scrape and poll them concurrently until all have finished.
+
+        Args:
+            batch (_ShardedBatch): The shards to run
+            params_dict (Dict[str, Any]): Batch scrape request body, without shard URLs
+            idempotency_key (Optional[str]): Base key; each shard attempt gets a key derived from it
+            poll_interval (int): Seconds between polling rounds
+
+        Returns:
+            BatchScrapeStatusResponse: Merged results in input order, with per-shard details in `shards`
+        """
+        async for _ in self._async_iter_sharded_batch(batch, params_dict, idempotency_key, poll_interval):
+            pass
+        return batch.result()
+
+    async def _async_iter_sharded_batch(
+            self,
+            batch: _ShardedBatch,
+            params_dict: Dict[str, Any],
+            idempotency_key: Optional[str],
+            poll_interval: int,
+            source: Optional[Iterator[List[str]]] = None) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Async counterpart of FirecrawlApp._iter_sharded_batch; active shards are polled concurrently.
+        """
+        async def start(shard: BatchScrapeShard) -> None:
+            key = _derive_idempotency_key(idempotency_key, shard.index, shard.attempts) if idempotency_key else None
+            recorded = self.idempotency_registry.get(key) if key else None
+            if recorded is not None:
+                logger.debug("Re-attaching to shard job %s for idempotency key %s", recorded.get('id'), key)
+                batch.started(shard, recorded.get('id'))
+                return
+            try:
+                if key:
+                    self.idempotency_registry.reserve(key)
+                try:
+                    response = await self._async_post_request(
+                        f'{self.api_url}/v1/batch/scrape',
+                        {**params_dict, 'urls': shard.urls},
+                        self._prepare_headers(key)
+                    )
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    raise
+                except Exception:
+                    if key:
+                        self.idempotency_registry.release(key)
+                    raise
+                if key and response.get('id'):
+                    self.idempotency_registry.record(key, response)
+                batch.started(shard, response.get('id'))
+            except Exception as e:
+                batch.fail(shard, str(e))
+
+        async def poll(shard: BatchScrapeShard) -> List[Dict[str, Any]]:
+            docs = []
+            try:
+                while True:
+                    status_data = await self._async_get_request(
+                        f'{self.api_url}/v1/batch/scrape/{shard.id}?skip={batch.skip(shard)}',
+                        self._prepare_headers())
+                    more = batch.record(shard, status_data)
+                    if shard.status not in ('pending', 'failed'):
+                        docs.extend(status_data.get('data') or [])
+                    if not more:
+                        return docs
+            except Exception as e:
+                batch.fail(shard, str(e))
+                return docs
+
+        while True:
+            while source is not None and batch.has_room:
+                urls = next(source, None)
+                if urls is None:
+                    source = None
+                else:
+                    batch.add_shard(urls)
+            if batch.done and source is None:
+                return
+            await asyncio.gather(*(start(shard) for shard in batch.to_start()))
+            for docs in await asyncio.gather(*(poll(shard) for shard in list(batch.active))):
+                if docs:
+                    yield docs
+            if batch.active:
+                await asyncio.sleep(poll_interval)
+
+    async def _async_monitor_job_status(self, id: str, headers: Dict[str, str], poll_interval: int = 2, compact_metadata: bool = False) -> CrawlStatusResponse:
         """
         Monitor the status of an asynchronous job until completion.
 
@@ -3527,6 +7438,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             id (str): The ID of the job to monitor
             headers (Dict[str, str]): Headers to include in status check requests
             poll_interval (int): Seconds between status checks (default: 2)
+            compact_metadata (bool): Compact page metadata into a shared MetadataTable as pages arrive
 
         Returns:
             CrawlStatusResponse: The job results if completed successfully
@@ -3542,7 +7454,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
             if status_data.get('status') == 'completed':
                 if 'data' in status_data:
+                    table = MetadataTable() if compact_metadata else None
                     data = status_data['data']
+                    if table is not None:
+                        table.compact_documents(data)
                     while 'next' in status_data:
                         if len(status_data['data']) == 0:
                             break
@@ -3551,10 +7466,13 @@ class AsyncFirecrawlApp(FirecrawlApp):
                             logger.warning("Expected 'next' URL is missing.")
                             break
                         next_data = await self._async_get_request(next_url, headers)
-                        data.extend(next_data.get('data', []))
+                        page = next_data.get('data', [])
+                        if table is not None:
+                            table.compact_documents(page)
+                        data.extend(page)
                         status_data = next_data
                     status_data['data'] = data
-                    return CrawlStatusResponse(**status_data)
+                    return _validate_model(CrawlStatusResponse, status_data)
                 else:
                     raise Exception('Job completed but no data was returned')
             elif status_data.get('status') in ['active', 'paused', 'pending', 'queued', 'waiting', 'scraping']:
@@ -3599,7 +7517,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
         """
         map_params = {}
         if params:
-            map_params.update(params.dict(exclude_none=True))
+            map_params.update(_model_dump(params))
 
         # Add individual parameters
         if search is not None:
@@ -3617,7 +7535,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         # Create final params object
         final_params = MapParams(**map_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['url'] = url
         params_dict['origin'] = f"python-sdk@{version}"
 
@@ -3630,12 +7548,44 @@ class AsyncFirecrawlApp(FirecrawlApp):
         )
 
         if response.get('success') and 'links' in response:
-            return MapResponse(**response)
+            return _validate_model(MapResponse, response)
         elif 'error' in response:
             raise Exception(f'Failed to map URL. Error: {response["error"]}')
         else:
             raise Exception(f'Failed to map URL. Error: {response}')
 
+    async def map_and_scrape(
+            self,
+            url: str,
+            *,
+            filter: Optional[Callable[[str], bool]] = None,
+            search: Optional[str] = None,
+            limit: Optional[int] = None,
+            shard_size: int = 25,
+            concurrency: int = 4,
+            scrape_options: Optional[ScrapeOptions] = None,
+            poll_interval: int = 2,
+            shard_retries: int = 1,
+            idempotency_key: Optional[str] = None,
+            canonicalize: Union[bool, UrlCanonicalizer] = False,
+            **map_options) -> AsyncIterator[FirecrawlDocument]:
+        """
+        Asynchronously map a site, filter its links and scrape the selected pages, yielding documents as they arrive.
+
+        Active shards are polled concurrently. See FirecrawlApp.map_and_scrape for the parameters.
+
+        Returns:
+            AsyncIterator[FirecrawlDocument]: Scraped documents in arrival order, each URL at most once
+        """
+        links = (await self.map_url(url, search=search, limit=limit, **map_options)).links or []
+        batch = _ShardedBatch([], shard_size, concurrency, shard_retries, False)
+        params_dict = {**(_model_dump(scrape_options) if scrape_options else {}), 'origin': f"python-sdk@{version}"}
+        source = _map_shards(links, filter, shard_size, _resolve_canonicalizer(canonicalize))
+        seen: Set[str] = set()
+        async for docs in self._async_iter_sharded_batch(batch, params_dict, idempotency_key, poll_interval, source):
+            for document in _unseen_documents(docs, seen):
+                yield document
+
     async def extract(
             self,
             urls: Optional[List[str]] = None,
@@ -3646,7 +7596,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
             allow_external_links: Optional[bool] = False,
             enable_web_search: Optional[bool] = False,
             show_sources: Optional[bool] = False,
-            agent: Optional[Dict[str, Any]] = None) -> ExtractResponse[Any]:
+            agent: Optional[Dict[str, Any]] = None,
+            canonicalize: Union[bool, UrlCanonicalizer] = False,
+            validation: Optional[Literal["strict", "lenient"]] = None) -> ExtractResponse[Any]:
             
         """
         Asynchronously extract structured information from URLs.
@@ -3660,6 +7612,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             enable_web_search (Optional[bool]): Enable web search
             show_sources (Optional[bool]): Include source URLs
             agent (Optional[Dict[str, Any]]): Agent configuration
+            canonicalize (Union[bool, UrlCanonicalizer]): Canonicalize and deduplicate `urls` before submission
+            validation (Optional[Literal["strict", "lenient"]]): Bind `data` to the schema model; lenient mode collects per-field errors in `validationErrors` instead of raising
 
         Returns:
           ExtractResponse with:
@@ -3669,18 +7623,25 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         Raises:
           ValueError: If prompt/schema missing or extraction fails
+          pydantic.ValidationError: If strict validation fails
         """
         headers = self._prepare_headers()
 
         if not prompt and not schema:
             raise ValueError("Either prompt or schema is required")
 
+        schema_model = _schema_model(schema, validation)
+
         if not urls and not prompt:
             raise ValueError("Either urls or prompt is required")
 
         if schema:
             schema = self._ensure_schema_dict(schema)
 
+        canonicalizer = _resolve_canonicalizer(canonicalize)
+        if canonicalizer is not None and urls:
+            urls = canonicalizer.dedupe(urls)[0]
+
         request_data = {
             'urls': urls or [],
             'allowExternalLinks': allow_external_links,
@@ -3717,7 +7678,9 @@ class AsyncFirecrawlApp(FirecrawlApp):
                 )
 
                 if status_data['status'] == 'completed':
-                    return ExtractResponse(**status_data)
+                    if schema_model is not None:
+                        return _bind_schema(ExtractResponse, schema_model, status_data, validation)
+                    return _validate_model(ExtractResponse, status_data)
                 elif status_data['status'] in ['failed', 'cancelled']:
                     raise Exception(f'Extract job {status_data["status"]}. Error: {status_data["error"]}')
 
@@ -3725,12 +7688,13 @@ class AsyncFirecrawlApp(FirecrawlApp):
         else:
             raise Exception(f'Failed to extract. Error: {response.get("error")}')
 
-    async def check_batch_scrape_status(self, id: str) -> BatchScrapeStatusResponse:
+    async def check_batch_scrape_status(self, id: str, compact_metadata: bool = False) -> BatchScrapeStatusResponse:
         """
         Check the status of an asynchronous batch scrape job.
 
         Args:
             id (str): The ID of the batch scrape job
+            compact_metadata (bool): Store page metadata in a shared, interned MetadataTable
 
         Returns:
             BatchScrapeStatusResponse containing:
@@ -3760,7 +7724,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
 
         if status_data['status'] == 'completed':
             if 'data' in status_data:
+                table = MetadataTable() if compact_metadata else None
                 data = status_data['data']
+                if table is not None:
+                    table.compact_documents(data)
                 while 'next' in status_data:
                     if len(status_data['data']) == 0:
                         break
@@ -3769,7 +7736,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
                         logger.warning("Expected 'next' URL is missing.")
                         break
                     next_data = await self._async_get_request(next_url, headers)
-                    data.extend(next_data.get('data', []))
+                    page = next_data.get('data', [])
+                    if table is not None:
+                        table.compact_documents(page)
+                    data.extend(page)
                     status_data = next_data
                 status_data['data'] = data
 
@@ -4054,14 +8024,14 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if experimental_stream is not None:
             params['__experimental_stream'] = experimental_stream
 
-        params = GenerateLLMsTextParams(
-            maxUrls=max_urls,
-            showFullText=show_full_text,
-            __experimental_stream=experimental_stream
-        )
+        params = _validate_params(GenerateLLMsTextParams, {
+            'maxUrls': max_urls,
+            'showFullText': show_full_text,
+            '__experimental_stream': experimental_stream
+        })
 
         headers = self._prepare_headers()
-        json_data = {'url': url, **params.dict(exclude_none=True)}
+        json_data = {'url': url, **_model_dump(params)}
         json_data['origin'] = f"python-sdk@{version}"
 
         try:
@@ -4102,6 +8072,40 @@ class AsyncFirecrawlApp(FirecrawlApp):
         except Exception as e:
             raise ValueError(str(e))
 
+    async def generate_llms_text_many(
+            self,
+            urls: List[str],
+            *,
+            concurrency: int = 4,
+            poll_interval: float = 2,
+            **generate_options) -> AsyncIterator[GenerateLLMsTextManyResult]:
+        """
+        Generate LLMs.txt for many URLs concurrently, yielding results as each job finishes.
+
+        All jobs are polled from one loop sharing one aiohttp connection pool; at most
+        `concurrency` jobs run at once and queued URLs start as earlier jobs finish.
+
+        Args:
+            urls (List[str]): Target URLs
+            concurrency (int): Maximum number of generation jobs running at once
+            poll_interval (float): Seconds between status sweeps
+            **generate_options: Options passed to async_generate_llms_text for every URL
+
+        Returns:
+            AsyncIterator[GenerateLLMsTextManyResult]: One result per URL in completion order; failures carry `error` instead of raising
+        """
+        app = copy.copy(self)
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency), trace_configs=_trace_configs(self.hooks)) as session:
+            app._client_session = session
+            poller = _AsyncJobPoller(
+                lambda url: app.async_generate_llms_text(url, **generate_options),
+                app.check_generate_llms_text_status,
+                concurrency,
+                poll_interval
+            )
+            async for index, job_id, status, error in poller.run(urls):
+                yield GenerateLLMsTextManyResult(index=index, url=urls[index], success=error is None, id=job_id, result=status, error=error)
+
     async def deep_research(
             self,
             query: str,
@@ -4111,7 +8115,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             max_urls: Optional[int] = None,
             analysis_prompt: Optional[str] = None,
             system_prompt: Optional[str] = None,
-            __experimental_stream_steps: Optional[bool] = None,
+            experimental_stream_steps: Optional[bool] = None,
             on_activity: Optional[Callable[[Dict[str, Any]], None]] = None,
             on_source: Optional[Callable[[Dict[str, Any]], None]] = None) -> DeepResearchStatusResponse:
         """
@@ -4124,7 +8128,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             max_urls (Optional[int]): Maximum number of URLs to process
             analysis_prompt (Optional[str]): Custom prompt for analysis
             system_prompt (Optional[str]): Custom system prompt
-            __experimental_stream_steps (Optional[bool]): Enable experimental streaming
+            experimental_stream_steps (Optional[bool]): Enable experimental streaming
             on_activity (Optional[Callable]): Progress callback receiving {type, status, message, timestamp, depth}
             on_source (Optional[Callable]): Source discovery callback receiving {url, title, description}
 
@@ -4153,8 +8157,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             research_params['analysisPrompt'] = analysis_prompt
         if system_prompt is not None:
             research_params['systemPrompt'] = system_prompt
-        if __experimental_stream_steps is not None:
-            research_params['__experimental_streamSteps'] = __experimental_stream_steps
+        if experimental_stream_steps is not None:
+            research_params['__experimental_streamSteps'] = experimental_stream_steps
         research_params = DeepResearchParams(**research_params)
 
         response = await self.async_deep_research(
@@ -4163,7 +8167,8 @@ class AsyncFirecrawlApp(FirecrawlApp):
             time_limit=time_limit,
             max_urls=max_urls,
             analysis_prompt=analysis_prompt,
-            system_prompt=system_prompt
+            system_prompt=system_prompt,
+            experimental_stream_steps=experimental_stream_steps
         )
         if not response.get('success') or 'id' not in response:
             return response
@@ -4175,17 +8180,10 @@ class AsyncFirecrawlApp(FirecrawlApp):
         while True:
             status = await self.check_deep_research_status(job_id)
             
-            if on_activity and 'activities' in status:
-                new_activities = status['activities'][last_activity_count:]
-                for activity in new_activities:
-                    on_activity(activity)
-                last_activity_count = len(status['activities'])
-            
-            if on_source and 'sources' in status:
-                new_sources = status['sources'][last_source_count:]
-                for source in new_sources:
-                    on_source(source)
-                last_source_count = len(status['sources'])
+            if on_activity:
+                last_activity_count = _deliver_progress(status, 'activities', last_activity_count, on_activity)
+            if on_source:
+                last_source_count = _deliver_progress(status, 'sources', last_source_count, on_source)
             
             if status['status'] == 'completed':
                 return status
@@ -4207,7 +8205,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             max_urls: Optional[int] = None,
             analysis_prompt: Optional[str] = None,
             system_prompt: Optional[str] = None,
-            __experimental_stream_steps: Optional[bool] = None) -> Dict[str, Any]:
+            experimental_stream_steps: Optional[bool] = None) -> Dict[str, Any]:
         """
         Initiates an asynchronous deep research operation.
 
@@ -4218,7 +8216,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             max_urls (Optional[int]): Maximum number of URLs to process
             analysis_prompt (Optional[str]): Custom prompt for analysis
             system_prompt (Optional[str]): Custom system prompt
-            __experimental_stream_steps (Optional[bool]): Enable experimental streaming
+            experimental_stream_steps (Optional[bool]): Enable experimental streaming
 
         Returns:
             Dict[str, Any]: A response containing:
@@ -4240,13 +8238,13 @@ class AsyncFirecrawlApp(FirecrawlApp):
             research_params['analysisPrompt'] = analysis_prompt
         if system_prompt is not None:
             research_params['systemPrompt'] = system_prompt
-        if __experimental_stream_steps is not None:
-            research_params['__experimental_streamSteps'] = __experimental_stream_steps
+        if experimental_stream_steps is not None:
+            research_params['__experimental_streamSteps'] = experimental_stream_steps
         research_params = DeepResearchParams(**research_params)
 
         headers = self._prepare_headers()
         
-        json_data = {'query': query, **research_params.dict(exclude_none=True)}
+        json_data = {'query': query, **_model_dump(research_params)}
         json_data['origin'] = f"python-sdk@{version}"
 
         try:
@@ -4292,6 +8290,284 @@ class AsyncFirecrawlApp(FirecrawlApp):
         except Exception as e:
             raise ValueError(str(e))
 
+    async def stream_deep_research(
+            self,
+            query: str,
+            *,
+            max_depth: Optional[int] = None,
+            time_limit: Optional[int] = None,
+            max_urls: Optional[int] = None,
+            analysis_prompt: Optional[str] = None,
+            system_prompt: Optional[str] = None,
+            poll_interval: float = 2) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Start a deep research job with step streaming and yield its progress as it happens.
+
+        The status endpoint is read as a text/event-stream when the server offers one;
+        otherwise it is polled every `poll_interval` seconds and the snapshots are diffed.
+
+        Args:
+            query (str): Research query or topic to investigate
+            max_depth (Optional[int]): Maximum depth of research exploration
+            time_limit (Optional[int]): Time limit in seconds for research
+            max_urls (Optional[int]): Maximum number of URLs to process
+            analysis_prompt (Optional[str]): Custom prompt for analysis
+            system_prompt (Optional[str]): Custom system prompt
+            poll_interval (float): Seconds between status checks when streaming is unavailable
+
+        Returns:
+            AsyncIterator[Tuple[str, Any]]: ('activity', activity) and ('source', source) events,
+            ending with ('done', status) or ('error', status)
+
+        Raises:
+            Exception: If the research job cannot be started or its status cannot be read
+        """
+        response = await self.async_deep_research(
+            query,
+            max_depth=max_depth,
+            time_limit=time_limit,
+            max_urls=max_urls,
+            analysis_prompt=analysis_prompt,
+            system_prompt=system_prompt,
+            experimental_stream_steps=True
+        )
+        if not response.get('success') or 'id' not in response:
+            raise Exception(f'Failed to start deep research. Error: {response.get("error")}')
+        async for event in self._stream_job(f'{self.api_url}/v1/deep-research/{response["id"]}', poll_interval):
+            yield event
+
+    async def stream_generate_llms_text(
+            self,
+            url: str,
+            *,
+            max_urls: Optional[int] = None,
+            show_full_text: Optional[bool] = None,
+            poll_interval: float = 2) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Start an LLMs.txt generation job with streaming and yield the text as it is produced.
+
+        The status endpoint is read as a text/event-stream when the server offers one;
+        otherwise it is polled every `poll_interval` seconds and the snapshots are diffed.
+
+        Args:
+            url (str): Target URL to generate LLMs.txt from
+            max_urls (Optional[int]): Maximum URLs to process (default: 10)
+            show_full_text (Optional[bool]): Include full text in output (default: False)
+            poll_interval (float): Seconds between status checks when streaming is unavailable
+
+        Returns:
+            AsyncIterator[Tuple[str, Any]]: ('text', {'delta', 'text'}) events, ending with
+            ('done', status) or ('error', status)
+
+        Raises:
+            Exception: If the generation job cannot be started or its status cannot be read
+        """
+        response = await self.async_generate_llms_text(
+            url,
+            max_urls=max_urls,
+            show_full_text=show_full_text,
+            experimental_stream=True
+        )
+        if not response.get('success') or 'id' not in response:
+            raise Exception(f'Failed to start LLMs.txt generation. Error: {response.get("error")}')
+        async for event in self._stream_job(f'{self.api_url}/v1/llmstxt/{response["id"]}', poll_interval):
+            yield event
+
+    async def _stream_job(self, url: str, poll_interval: float) -> AsyncIterator[Tuple[str, Any]]:
+        """Yields the events of a job status URL, from server-sent events or by polling."""
+        headers = {**self._prepare_headers(), 'Accept': 'text/event-stream'}
+        stream = _JobStream()
+        session = self._client_session or aiohttp.ClientSession()
+        try:
+            while True:
+                async with session.get(url, headers=headers) as response:
+                    if response.status >= 300:
+                        await self._handle_error(response, 'stream job status')
+                    if response.content_type == 'text/event-stream':
+                        parser = _SSEParser()
+                        async for line in response.content:
+                            event = parser.feed(line.decode('utf-8'))
+                            if event is not None:
+                                for item in stream.update_sse(*event):
+                                    yield item
+                                if stream.finished:
+                                    return
+                    else:
+                        for item in stream.update(await response.json()):
+                            yield item
+                        if stream.finished:
+                            return
+                await asyncio.sleep(poll_interval)
+        finally:
+            if session is not self._client_session:
+                await session.close()
+
+    async def deep_research_many(
+            self,
+            queries: List[str],
+            *,
+            concurrency: int = 4,
+            poll_interval: float = 2,
+            on_activity: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+            on_source: Optional[Callable[[int, Dict[str, Any]], None]] = None,
+            **research_options) -> AsyncIterator[DeepResearchManyResult]:
+        """
+        Run deep research for many queries concurrently, yielding results as each job finishes.
+
+        All jobs are polled from one loop sharing one aiohttp connection pool; at most
+        `concurrency` jobs run at once and queued queries start as earlier jobs finish.
+        A cursor per job tracks the activities and sources already delivered, so each
+        poll only hands the new entries to the callbacks.
+
+        Args:
+            queries (List[str]): Research queries
+            concurrency (int): Maximum number of research jobs running at once
+            poll_interval (float): Seconds between status sweeps
+            on_activity (Optional[Callable]): Called with (index, activity) for each new activity of a job
+            on_source (Optional[Callable]): Called with (index, source) for each new source of a job
+            **research_options: Options passed to async_deep_research for every query
+
+        Returns:
+            AsyncIterator[DeepResearchManyResult]: One result per query in completion order; failures carry `error` instead of raising
+        """
+        app = copy.copy(self)
+        cursors = [[0, 0] for _ in queries]
+
+        def on_progress(index: int, status: Dict[str, Any]) -> None:
+            cursor = cursors[index]
+            if on_activity is not None:
+                cursor[0] = _deliver_progress(status, 'activities', cursor[0], functools.partial(on_activity, index))
+            if on_source is not None:
+                cursor[1] = _deliver_progress(status, 'sources', cursor[1], functools.partial(on_source, index))
+
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency), trace_configs=_trace_configs(self.hooks)) as session:
+            app._client_session = session
+            poller = _AsyncJobPoller(
+                lambda query: app.async_deep_research(query, **research_options),
+                app.check_deep_research_status,
+                concurrency,
+                poll_interval,
+                on_progress
+            )
+            async for index, job_id, status, error in poller.run(queries):
+                yield DeepResearchManyResult(index=index, query=queries[index], success=error is None, id=job_id, result=status, error=error)
+
+    async def scrape_many(
+            self,
+            urls: List[str],
+            *,
+            concurrency: int = 8,
+            ordered: bool = False,
+            deadline: Optional[float] = None,
+            politeness: Optional[DomainDispatcher] = None,
+            canonicalize: Union[bool, UrlCanonicalizer] = False,
+            **scrape_options) -> AsyncIterator[ScrapeManyResult]:
+        """
+        Scrape many URLs concurrently from the client, yielding results as they finish.
+
+        At most `concurrency` requests are in flight, sharing one aiohttp connection
+        pool. Unlike batch_scrape_urls there is no server-side job, so the first results
+        arrive as soon as their pages are scraped.
+
+        Args:
+            urls (List[str]): URLs to scrape
+            concurrency (int): Maximum number of requests in flight
+            ordered (bool): Yield results in input order instead of completion order
+            deadline (Optional[float]): Seconds after which unfinished URLs are reported as failed
+            politeness (Optional[DomainDispatcher]): Dispatches URLs round-robin across hosts with
+                adaptive per-host concurrency caps; all URLs are started as slots free up when unset
+            canonicalize (Union[bool, UrlCanonicalizer]): Scrape each canonical URL once and report
+                its result for every input URL that maps to it
+            **scrape_options: Options passed to scrape_url for every URL
+
+        Returns:
+            AsyncIterator[ScrapeManyResult]: One result per URL; failures carry `error` instead of raising
+        """
+        canonicalizer = _resolve_canonicalizer(canonicalize)
+        if canonicalizer is not None:
+            unique, mapping = canonicalizer.dedupe(urls)
+            fan_out = _FanOut(urls, mapping, ordered)
+            async for result in self.scrape_many(unique, concurrency=concurrency, ordered=ordered, deadline=deadline, politeness=politeness, **scrape_options):
+                for input_result in fan_out.add(result):
+                    yield input_result
+            return
+
+        app = copy.copy(self)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def scrape(index: int, url: str) -> ScrapeManyResult:
+            async with semaphore:
+                try:
+                    document = await app.scrape_url(url, **scrape_options)
+                    return ScrapeManyResult(index=index, url=url, success=True, document=document)
+                except Exception as e:
+                    return ScrapeManyResult(index=index, url=url, success=False, error=str(e))
+
+        end = time.monotonic() + deadline if deadline is not None else None
+        async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=concurrency), trace_configs=_trace_configs(self.hooks)) as session:
+            app._client_session = session
+            workers = []
+            if politeness is None:
+                tasks = [asyncio.ensure_future(scrape(index, url)) for index, url in enumerate(urls)]
+            else:
+                loop = asyncio.get_running_loop()
+                tasks = [loop.create_future() for _ in urls]
+
+                async def polite_scrape(index: int, url: str) -> Optional[bool]:
+                    if tasks[index].done():
+                        return None
+                    try:
+                        document = await app.scrape_url(url, **scrape_options)
+                    except Exception as e:
+                        result = ScrapeManyResult(index=index, url=url, success=False, error=str(e))
+                        healthy = False if politeness.is_site_error(e) else None
+                    else:
+                        result = ScrapeManyResult(index=index, url=url, success=True, document=document)
+                        healthy = politeness.is_healthy(document)
+                    if not tasks[index].done():
+                        tasks[index].set_result(result)
+                    return healthy
+
+                jobs = [functools.partial(polite_scrape, index, url) for index, url in enumerate(urls)]
+                for job, url in zip(jobs, urls):
+                    politeness.put(url, job)
+                workers = [asyncio.ensure_future(politeness.work_async()) for _ in range(concurrency)]
+            yielded = set()
+            try:
+                if ordered:
+                    for index, task in enumerate(tasks):
+                        timeout = max(0, end - time.monotonic()) if end is not None else None
+                        await asyncio.wait([task], timeout=timeout)
+                        if not task.done():
+                            break
+                        yielded.add(index)
+                        yield task.result()
+                else:
+                    try:
+                        timeout = max(0, end - time.monotonic()) if end is not None else None
+                        for next_result in asyncio.as_completed(tasks, timeout=timeout):
+                            result = await next_result
+                            yielded.add(result.index)
+                            yield result
+                    except asyncio.TimeoutError:
+                        pass
+                for index, url in enumerate(urls):
+                    if index in yielded:
+                        continue
+                    if tasks[index].done() and not tasks[index].cancelled():
+                        yield tasks[index].result()
+                    else:
+                        yield ScrapeManyResult(index=index, url=url, success=False, error='Deadline exceeded')
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if workers:
+                    politeness.discard(jobs)
+                    for worker in workers:
+                        worker.cancel()
+                    await asyncio.gather(*workers, return_exceptions=True)
+
     async def search(
             self,
             query: str,
@@ -4338,7 +8614,7 @@ class AsyncFirecrawlApp(FirecrawlApp):
             if isinstance(params, dict):
                 search_params.update(params)
             else:
-                search_params.update(params.dict(exclude_none=True))
+                search_params.update(_model_dump(params))
 
         # Add individual parameters
         if limit is not None:
@@ -4356,14 +8632,14 @@ class AsyncFirecrawlApp(FirecrawlApp):
         if timeout is not None:
             search_params['timeout'] = timeout
         if scrape_options is not None:
-            search_params['scrapeOptions'] = scrape_options.dict(exclude_none=True)
+            search_params['scrapeOptions'] = _model_dump(scrape_options)
         
         # Add any additional kwargs
         search_params.update(kwargs)
 
         # Create final params object
         final_params = SearchParams(query=query, **search_params)
-        params_dict = final_params.dict(exclude_none=True)
+        params_dict = _model_dump(final_params)
         params_dict['origin'] = f"python-sdk@{version}"
 
         return await self._async_post_request(
@@ -4376,53 +8652,28 @@ class AsyncCrawlWatcher(CrawlWatcher):
     """
     Async version of CrawlWatcher that properly handles async operations.
     """
-    def __init__(self, id: str, app: AsyncFirecrawlApp):
-        super().__init__(id, app)
-
-    async def connect(self) -> None:
-        """
-        Establishes async WebSocket connection and starts listening for messages.
-        """
-        async with websockets.connect(
-            self.ws_url,
-            additional_headers=[("Authorization", f"Bearer {self.app.api_key}")]
-        ) as websocket:
-            await self._listen(websocket)
-
-    async def _listen(self, websocket) -> None:
+    def __init__(self, id: str, app: AsyncFirecrawlApp, **kwargs):
         """
-        Listens for incoming WebSocket messages and handles them asynchronously.
-
         Args:
-            websocket: The WebSocket connection object
+            id (str): The ID of the crawl or batch scrape job to watch
+            app (AsyncFirecrawlApp): The AsyncFirecrawlApp instance
+            **kwargs: CrawlWatcher options
         """
-        async for message in websocket:
-            msg = json.loads(message)
-            await self._handle_message(msg)
+        super().__init__(id, app, **kwargs)
 
-    async def _handle_message(self, msg: Dict[str, Any]) -> None:
+    async def _fetch_status(self, url: str) -> Dict[str, Any]:
         """
-        Handles incoming WebSocket messages based on their type asynchronously.
+        Fetches one page of job status using the async client.
 
         Args:
-            msg (Dict[str, Any]): The message to handle
+            url (str): Status URL including the skip offset
+
+        Returns:
+            Dict[str, Any]: The parsed status response
         """
-        if msg['type'] == 'done':
-            self.status = 'completed'
-            self.dispatch_event('done', {'status': self.status, 'data': self.data, 'id': self.id})
-        elif msg['type'] == 'error':
-            self.status = 'failed'
-            self.dispatch_event('error', {'status': self.status, 'data': self.data, 'error': msg['error'], 'id': self.id})
-        elif msg['type'] == 'catchup':
-            self.status = msg['data']['status']
-            self.data.extend(msg['data'].get('data', []))
-            for doc in self.data:
-                self.dispatch_event('document', {'data': doc, 'id': self.id})
-        elif msg['type'] == 'document':
-            self.data.append(msg['data'])
-            self.dispatch_event('document', {'data': msg['data'], 'id': self.id})
+        return await self.app._async_get_request(url, self.app._prepare_headers())
 
-    async def _handle_error(self, response: aiohttp.ClientResponse, action: str) -> None:
+    async def _handle_error(self, response: 'aiohttp.ClientResponse', action: str) -> None:
         """
         Handle errors from async API responses.
         """
@@ -4452,3 +8703,224 @@ class AsyncCrawlWatcher(CrawlWatcher):
             str: A formatted error message
         """
         return self._get_error_message(status_code, action, error_message, error_details)
+
+class WatcherPool:
+    """
+    Watches many crawl and batch scrape jobs on one event loop.
+
+    Every job's events are queued per job and handled by a shared set of worker tasks.
+    Workers take jobs in round-robin order, so a busy job can't starve the others, and
+    each job's events are still handled in order. When a job's queue is full, its
+    watcher stops reading from its connection until workers catch up.
+
+        pool = WatcherPool(app, workers=8)
+        for job_id in job_ids:
+            pool.add(job_id)
+        async for job_id, event_type, detail in pool.events():
+            ...
+
+    Attributes:
+        app (FirecrawlApp): The app used to create watchers
+        workers (int): Number of worker tasks shared by all jobs
+        max_queued_per_job (int): Maximum number of unhandled events per job
+        watchers (Dict[str, CrawlWatcher]): Watchers by job ID
+        errors (Dict[str, BaseException]): Exceptions that ended a watcher, by job ID
+        backpressure_waits (int): Number of times a watcher waited for a full job queue
+    """
+    _END = object()
+
+    def __init__(self, app: FirecrawlApp, workers: int = 8, max_queued_per_job: int = 100, **watcher_options):
+        """
+        Args:
+            app (FirecrawlApp): FirecrawlApp or AsyncFirecrawlApp used to create watchers
+            workers (int): Number of worker tasks shared by all jobs
+            max_queued_per_job (int): Maximum number of unhandled events per job
+            **watcher_options: CrawlWatcher options applied to every watcher
+        """
+        self.app = app
+        self.workers = max(1, workers)
+        self.max_queued_per_job = max(1, max_queued_per_job)
+        self.watcher_options = watcher_options
+        self.watchers: Dict[str, CrawlWatcher] = {}
+        self.errors: Dict[str, BaseException] = {}
+        self.backpressure_waits = 0
+        self.event_handlers: Dict[str, List[Callable]] = {'done': [], 'error': [], 'document': [], 'documents': []}
+        self._queues: Dict[str, collections.deque] = {}
+        self._ready: collections.deque = collections.deque()
+        self._active: Set[str] = set()
+        self._handled: Dict[str, int] = {}
+        self._latency: Dict[str, LatencyHistogram] = {}
+        self._total_latency = LatencyHistogram()
+        self._tasks: Set[asyncio.Future] = set()
+        self._streams: List[asyncio.Queue] = []
+        self._cond: Optional[asyncio.Condition] = None
+        self._running = False
+
+    def add(self, watcher: Union[str, CrawlWatcher]) -> CrawlWatcher:
+        """
+        Adds a job to the pool. Jobs can be added while the pool is running.
+
+        Args:
+            watcher (Union[str, CrawlWatcher]): A job ID, or a watcher created by the caller
+
+        Returns:
+            CrawlWatcher: The watcher for the job
+        """
+        if isinstance(watcher, str):
+            watcher_cls = AsyncCrawlWatcher if isinstance(self.app, AsyncFirecrawlApp) else CrawlWatcher
+            watcher = watcher_cls(watcher, self.app, **self.watcher_options)
+        job_id = watcher.id
+        self.watchers[job_id] = watcher
+        self._queues[job_id] = collections.deque()
+        self._handled[job_id] = 0
+        self._latency[job_id] = LatencyHistogram()
+        for event_type in ('document', 'documents', 'done', 'error'):
+            watcher.add_event_listener(event_type, functools.partial(self._route, job_id, event_type))
+        if self._running:
+            self._start_watcher(watcher)
+        return watcher
+
+    def add_event_listener(self, event_type: str, handler: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+        Adds a handler called by the pool's workers for events of every job.
+
+        Args:
+            event_type (str): Type of event to listen for ('done', 'error', 'document' or 'documents')
+            handler (Callable): Function or coroutine function; the event detail carries the job `id`
+        """
+        if event_type in self.event_handlers:
+            self.event_handlers[event_type].append(handler)
+
+    async def run(self) -> None:
+        """
+        Watches all jobs until each one has finished and all events have been handled.
+        """
+        self._cond = asyncio.Condition()
+        self._running = True
+        workers = [asyncio.ensure_future(self._worker()) for _ in range(self.workers)]
+        try:
+            for watcher in self.watchers.values():
+                self._start_watcher(watcher)
+            while self._tasks:
+                await asyncio.wait(list(self._tasks))
+            async with self._cond:
+                await self._cond.wait_for(lambda: not self._active)
+        finally:
+            self._running = False
+            for worker in workers:
+                worker.cancel()
+            for task in self._tasks:
+                task.cancel()
+            # A slow consumer may have left its stream full; wait for room rather than lose the end
+            for stream in list(self._streams):
+                await stream.put(self._END)
+
+    async def events(self):
+        """
+        Runs the pool and yields a merged stream of events from all jobs.
+
+        Yields:
+            Tuple[str, str, Dict[str, Any]]: (job ID, event type, event detail)
+        """
+        stream: asyncio.Queue = asyncio.Queue(maxsize=self.max_queued_per_job)
+        self._streams.append(stream)
+        runner = asyncio.ensure_future(self.run())
+        try:
+            while True:
+                item = await stream.get()
+                if item is self._END:
+                    break
+                yield item
+            await runner
+        finally:
+            self._streams.remove(stream)
+            runner.cancel()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Returns aggregated metrics for the pool and each job.
+
+        Returns:
+            Dict[str, Any]: Totals plus a `jobs` mapping with status, handled and queued
+            event counts, reconnects, backpressure waits and handler latency per job
+        """
+        jobs = {
+            job_id: {
+                'status': watcher.status,
+                'documents': watcher.document_count,
+                'handled': self._handled[job_id],
+                'queued': len(self._queues[job_id]),
+                'reconnects': watcher.reconnects,
+                'backpressure_waits': watcher.backpressure_waits,
+                'latency': self._latency[job_id].to_dict(),
+            }
+            for job_id, watcher in self.watchers.items()
+        }
+        return {
+            'jobs': jobs,
+            'documents': sum(job['documents'] for job in jobs.values()),
+            'handled': sum(job['handled'] for job in jobs.values()),
+            'queued': sum(job['queued'] for job in jobs.values()),
+            'running': sum(1 for watcher in self.watchers.values() if not watcher._finished),
+            'errors': len(self.errors),
+            'backpressure_waits': self.backpressure_waits,
+            'latency': self._total_latency.to_dict(),
+        }
+
+    def _start_watcher(self, watcher: CrawlWatcher) -> None:
+        task = asyncio.ensure_future(self._run_watcher(watcher))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_watcher(self, watcher: CrawlWatcher) -> None:
+        try:
+            await watcher.connect()
+        except Exception as e:
+            self.errors[watcher.id] = e
+            watcher.status = 'failed'
+            await self._route(watcher.id, 'error', {'status': 'failed', 'id': watcher.id, 'error': str(e)})
+
+    async def _route(self, job_id: str, event_type: str, detail: Dict[str, Any]) -> None:
+        pending = self._queues[job_id]
+        async with self._cond:
+            if len(pending) >= self.max_queued_per_job:
+                self.backpressure_waits += 1
+                await self._cond.wait_for(lambda: len(pending) < self.max_queued_per_job)
+            pending.append((event_type, detail))
+            if job_id not in self._active:
+                self._active.add(job_id)
+                self._ready.append(job_id)
+            self._cond.notify_all()
+
+    async def _worker(self) -> None:
+        while True:
+            async with self._cond:
+                await self._cond.wait_for(lambda: bool(self._ready))
+                job_id = self._ready.popleft()
+                event_type, detail = self._queues[job_id].popleft()
+                self._cond.notify_all()
+            start = time.perf_counter()
+            try:
+                await self._handle(job_id, event_type, detail)
+            except Exception as e:
+                logger.error("Error handling %s event for job %s: %s", event_type, job_id, e)
+            finally:
+                elapsed = time.perf_counter() - start
+                self._latency[job_id].record(elapsed)
+                self._total_latency.record(elapsed)
+                self._handled[job_id] += 1
+                async with self._cond:
+                    # Requeue the job at the back so other jobs get a turn first
+                    if self._queues[job_id]:
+                        self._ready.append(job_id)
+                    else:
+                        self._active.discard(job_id)
+                    self._cond.notify_all()
+
+    async def _handle(self, job_id: str, event_type: str, detail: Dict[str, Any]) -> None:
+        for handler in self.event_handlers.get(event_type, []):
+            result = handler(detail)
+            if asyncio.iscoroutine(result):
+                await result
+        for stream in self._streams:
+            await stream.put((job_id, event_type, detail))
@@ -0,0 +1,88 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import os
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+
+API_URL = 'https://api.firecrawl.dev'
+URLS = ['https://example.com/a', 'https://example.com/b', 'https://example.com/c']
+
+def doc(url):
+    return {'markdown': url, 'metadata': {'sourceURL': url}}
+
+def status(*urls):
+    return {'success': True, 'status': 'completed', 'completed': len(urls), 'total': len(urls),
+            'creditsUsed': len(urls), 'expiresAt': '2025-01-01T00:00:00Z', 'data': [doc(url) for url in urls]}
+
+GETS = {
+    f'{API_URL}/v1/crawl/job-1': status(URLS[0]),
+    f'{API_URL}/v1/batch/scrape/job-1/errors': {
+        'errors': [{'id': '1', 'timestamp': 't', 'url': URLS[1], 'error': 'timeout'},
+                   {'id': '2', 'timestamp': 't', 'url': URLS[2], 'error': 'blocked'}],
+        'robotsBlocked': [URLS[2]],
+    },
+    f'{API_URL}/v1/crawl/retry-1': status(),
+    f'{API_URL}/v1/batch/scrape/retry-1/errors': {
+        'errors': [{'id': '3', 'timestamp': 't', 'url': URLS[1], 'error': 'timeout'}], 'robotsBlocked': []},
+    f'{API_URL}/v1/crawl/retry-2': status(URLS[1]),
+    f'{API_URL}/v1/batch/scrape/retry-2/errors': {'errors': [], 'robotsBlocked': []},
+}
+JOB_IDS = ['job-1', 'retry-1', 'retry-2']
+
+def response(payload):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = payload
+    return mock_response
+
+class TestBatchRetry(unittest.TestCase):
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_retries_failed_urls_with_escalation(self, mock_post, mock_get):
+        mock_post.side_effect = [response({'success': True, 'id': id}) for id in JOB_IDS]
+        mock_get.side_effect = lambda url, headers=None: response(GETS[url])
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        result = app.batch_scrape_urls(URLS, formats=['markdown'], timeout=10000, retry_failed=2)
+
+        bodies = [call.kwargs['json'] for call in mock_post.call_args_list]
+        self.assertEqual(bodies[1]['urls'], [URLS[1]])
+        self.assertEqual(bodies[1]['proxy'], 'stealth')
+        self.assertEqual(bodies[2]['timeout'], 20000)
+        self.assertEqual([document.markdown for document in result.data], URLS[:2])
+        self.assertEqual(result.completed, 2)
+        self.assertEqual([retry.recovered for retry in result.retries], [[], [URLS[1]]])
+        self.assertEqual(result.failedUrls, [])
+
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_budget_limits_retries(self, mock_post, mock_get):
+        mock_post.side_effect = [response({'success': True, 'id': id}) for id in JOB_IDS]
+        mock_get.side_effect = lambda url, headers=None: response(GETS[url])
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        result = app.batch_scrape_urls(URLS, retry_failed=1, retry_escalation=[{'timeout': 60000}])
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(mock_post.call_args.kwargs['json']['timeout'], 60000)
+        self.assertEqual(result.failedUrls, [URLS[1]])
+
+    def test_async_retries_failed_urls(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        ids = iter(JOB_IDS)
+        posts = []
+
+        async def post(url, data, headers):
+            posts.append(data)
+            return {'success': True, 'id': next(ids)}
+
+        async def get(url, headers):
+            return GETS[url]
+
+        with patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=post), \
+                patch.object(AsyncFirecrawlApp, '_async_get_request', side_effect=get):
+            result = asyncio.run(app.batch_scrape_urls(URLS, retry_failed=3))
+
+        self.assertEqual(len(posts), 3)
+        self.assertEqual(len(result.data), 2)
+        self.assertEqual(result.failedUrls, [])
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+from firecrawl import FirecrawlApp
+from firecrawl.firecrawl import _derive_idempotency_key
+
+URLS = [f'https://example.com/{n}' for n in range(5)]
+
+def make_response(body, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    return response
+
+class FakeBatchApi:
+    """Serves batch scrape jobs whose documents come back in reverse order."""
+    def __init__(self, fail_first=()):
+        self.jobs = {}
+        self.fail_first = set(fail_first)
+        self.posted = []
+
+    def post(self, url, headers=None, json=None, timeout=None):
+        job_id = f'job-{len(self.jobs)}'
+        self.jobs[job_id] = json['urls']
+        self.posted.append((json['urls'], headers.get('x-idempotency-key')))
+        return make_response({'success': True, 'id': job_id})
+
+    def get(self, url, headers=None):
+        job_id, _, query = url.rsplit('/', 1)[-1].partition('?')
+        urls = self.jobs[job_id]
+        if urls[0] in self.fail_first:
+            self.fail_first.discard(urls[0])
+            return make_response({'success': True, 'status': 'failed', 'completed': 0, 'total': len(urls),
+                                  'creditsUsed': 0, 'expiresAt': '2025-01-01T00:00:00Z', 'data': []})
+        skip = int(query.split('=')[1])
+        docs = [{'markdown': u, 'metadata': {'sourceURL': u}} for u in reversed(urls)][skip:]
+        return make_response({'success': True, 'status': 'completed', 'completed': len(urls), 'total': len(urls),
+                              'creditsUsed': len(urls), 'expiresAt': '2025-01-01T00:00:00Z', 'data': docs})
+
+class TestBatchSharding(unittest.TestCase):
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_shards_merge_in_input_order(self, mock_post, mock_get):
+        api = FakeBatchApi()
+        mock_post.side_effect = api.post
+        mock_get.side_effect = api.get
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        result = app.batch_scrape_urls(URLS, formats=['markdown'], shard_size=2, poll_interval=0, idempotency_key='key')
+
+        self.assertEqual([urls for urls, key in api.posted], [URLS[0:2], URLS[2:4], URLS[4:5]])
+        self.assertEqual([key for urls, key in api.posted], [_derive_idempotency_key('key', index, 1) for index in range(3)])
+        self.assertEqual([doc.markdown for doc in result.data], URLS)
+        self.assertEqual(result.status, 'completed')
+        self.assertEqual(result.total, 5)
+        self.assertEqual(len(result.shards), 3)
+
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_failed_shards_are_resubmitted(self, mock_post, mock_get):
+        api = FakeBatchApi(fail_first=[URLS[2]])
+        mock_post.side_effect = api.post
+        mock_get.side_effect = api.get
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        result = app.batch_scrape_urls(URLS, shard_size=2, max_concurrent_shards=1, shard_retries=1, poll_interval=0)
+
+        self.assertEqual(len(api.posted), 4)
+        self.assertEqual(api.posted[3][0], URLS[2:4])
+        self.assertEqual(result.shards[1].attempts, 2)
+        self.assertEqual([doc.markdown for doc in result.data], URLS)
+
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_failed_shard_without_retries(self, mock_post, mock_get):
+        api = FakeBatchApi(fail_first=[URLS[4]])
+        mock_post.side_effect = api.post
+        mock_get.side_effect = api.get
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        result = app.batch_scrape_urls(URLS, shard_size=2, poll_interval=0)
+
+        self.assertFalse(result.success)
+        self.assertEqual(result.shards[2].status, 'failed')
+        self.assertEqual([doc.markdown for doc in result.data], URLS[:4])
+
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_resubmission_reattaches_to_shard_jobs(self, mock_post, mock_get):
+        api = FakeBatchApi()
+        mock_post.side_effect = api.post
+        mock_get.side_effect = api.get
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        first = app.batch_scrape_urls(URLS, shard_size=2, poll_interval=0, auto_idempotency=True)
+        second = app.batch_scrape_urls(URLS, shard_size=2, poll_interval=0, auto_idempotency=True)
+
+        self.assertEqual(len(api.posted), 3)
+        self.assertEqual([shard.id for shard in second.shards], [shard.id for shard in first.shards])
+        self.assertEqual([doc.markdown for doc in second.data], URLS)
@@ -0,0 +1,430 @@
+import unittest
+import asyncio
+import threading
+import time
+import queue
+import tempfile
+import json
+import os
+import websockets
+import websockets.exceptions
+from unittest.mock import patch, MagicMock
+from firecrawl import FirecrawlApp
+from firecrawl.firecrawl import CrawlWatcher, ThreadedCrawlWatcher
+
+def make_doc(n):
+    return {'markdown': f'page {n}', 'metadata': {'sourceURL': f'https://example.com/{n}', 'scrapeId': f'scrape-{n}'}}
+
+class FakeWebSocket:
+    def __init__(self, messages, close_reason=None, drop=False):
+        self.messages = [json.dumps(msg) for msg in messages]
+        self.close_reason = close_reason
+        self.drop = drop
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for message in self.messages:
+            yield message
+        if self.drop:
+            raise websockets.exceptions.ConnectionClosedError(None, None)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+class TestWatcherCatchup(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    def test_catchup_only_dispatches_unseen_documents(self):
+        watcher = CrawlWatcher('crawl-1', self.app)
+        delivered = []
+        watcher.add_event_listener('document', lambda detail: delivered.append(detail['data']['metadata']['scrapeId']))
+
+        first = {'type': 'catchup', 'data': {'status': 'scraping', 'data': [make_doc(1), make_doc(2)]}}
+        second = {'type': 'catchup', 'data': {'status': 'scraping', 'data': [make_doc(1), make_doc(2), make_doc(3)]}}
+        asyncio.run(watcher._listen(FakeWebSocket([first, {'type': 'document', 'data': make_doc(3)}])))
+        asyncio.run(watcher._listen(FakeWebSocket([second, {'type': 'document', 'data': make_doc(4)}])))
+
+        self.assertEqual(delivered, ['scrape-1', 'scrape-2', 'scrape-3', 'scrape-4'])
+        self.assertEqual(len(watcher.data), 4)
+
+    def test_repeated_urls_without_scrape_id_are_kept(self):
+        watcher = CrawlWatcher('batch-1', self.app, job_type='batch')
+        doc = {'markdown': 'same page', 'metadata': {'sourceURL': 'https://example.com/'}}
+
+        catchup = {'type': 'catchup', 'data': {'status': 'scraping', 'data': [doc, doc]}}
+        asyncio.run(watcher._listen(FakeWebSocket([catchup, {'type': 'document', 'data': doc}])))
+        asyncio.run(watcher._listen(FakeWebSocket([{'type': 'catchup', 'data': {'status': 'scraping', 'data': [doc] * 3}}])))
+
+        self.assertEqual(watcher.document_count, 3)
+
+    def test_bounded_buffer_applies_backpressure(self):
+        watcher = CrawlWatcher('crawl-1', self.app, max_buffered=2)
+        delivered = []
+        watcher.add_event_listener('document', lambda detail: delivered.append(detail['data']['markdown']))
+        watcher.add_event_listener('done', lambda detail: delivered.append('done'))
+
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(10)] + [{'type': 'done'}]
+        asyncio.run(watcher._listen(FakeWebSocket(messages)))
+
+        self.assertEqual(delivered, [f'page {n}' for n in range(10)] + ['done'])
+        self.assertGreater(watcher.backpressure_waits, 0)
+
+    def test_handler_error_is_raised(self):
+        watcher = CrawlWatcher('crawl-1', self.app, max_buffered=2)
+
+        def handler(detail):
+            raise ValueError('boom')
+
+        watcher.add_event_listener('document', handler)
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(5)]
+        with self.assertRaises(ValueError):
+            asyncio.run(watcher._listen(FakeWebSocket(messages)))
+
+class TestWatcherDispatch(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    def test_coroutine_handlers_run_concurrently(self):
+        watcher = CrawlWatcher('crawl-1', self.app, handler_concurrency=4)
+        state = {'active': 0, 'peak': 0}
+        events = []
+
+        async def on_document(detail):
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+            await asyncio.sleep(0.01)
+            state['active'] -= 1
+            events.append(detail['data']['markdown'])
+
+        watcher.add_event_listener('document', on_document)
+        watcher.add_event_listener('done', lambda detail: events.append('done'))
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(8)] + [{'type': 'done'}]
+        asyncio.run(watcher._listen(FakeWebSocket(messages)))
+
+        self.assertEqual(state['peak'], 4)
+        self.assertEqual(len(events), 9)
+        self.assertEqual(events[-1], 'done')
+        self.assertEqual(watcher.handler_latency[on_document.__qualname__].count, 8)
+
+    def test_same_named_handlers_get_separate_histograms(self):
+        watcher = CrawlWatcher('crawl-1', self.app)
+        watcher.add_event_listener('document', lambda detail: None)
+        watcher.add_event_listener('document', lambda detail: None)
+        watcher.add_event_listener('done', lambda detail: None)
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(3)] + [{'type': 'done'}]
+        asyncio.run(watcher._listen(FakeWebSocket(messages)))
+
+        self.assertEqual({label: h.count for label, h in watcher.handler_latency.items()},
+                         {'TestWatcherDispatch.test_same_named_handlers_get_separate_histograms.<locals>.<lambda>': 3,
+                          'TestWatcherDispatch.test_same_named_handlers_get_separate_histograms.<locals>.<lambda>#2': 3,
+                          'TestWatcherDispatch.test_same_named_handlers_get_separate_histograms.<locals>.<lambda>#3': 1})
+
+    def test_batched_handlers_run_concurrently(self):
+        watcher = CrawlWatcher('crawl-1', self.app, handler_concurrency=4, batch_size=2)
+        state = {'active': 0, 'peak': 0}
+
+        async def on_documents(detail):
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+            await asyncio.sleep(0.01)
+            state['active'] -= 1
+
+        watcher.add_event_listener('documents', on_documents)
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(8)] + [{'type': 'done'}]
+        asyncio.run(watcher._listen(FakeWebSocket(messages)))
+
+        self.assertEqual(state['peak'], 4)
+        self.assertEqual(watcher.handler_latency[on_documents.__qualname__].count, 4)
+
+    def test_sync_handlers_can_be_offloaded(self):
+        watcher = CrawlWatcher('crawl-1', self.app, offload_sync_handlers=True)
+        threads = []
+        watcher.add_event_listener('document', lambda detail: threads.append(threading.get_ident()))
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(3)]
+        asyncio.run(watcher._listen(FakeWebSocket(messages)))
+
+        self.assertEqual(len(threads), 3)
+        self.assertNotIn(threading.get_ident(), threads)
+
+class TestWatcherReconnect(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    @patch('websockets.connect')
+    def test_reconnects_and_resumes_without_duplicates(self, mock_connect):
+        mock_connect.side_effect = [
+            FakeWebSocket([
+                {'type': 'catchup', 'data': {'status': 'scraping', 'data': [make_doc(1)]}},
+                {'type': 'document', 'data': make_doc(2)},
+            ], drop=True),
+            OSError('connection refused'),
+            FakeWebSocket([
+                {'type': 'catchup', 'data': {'status': 'completed', 'data': [make_doc(1), make_doc(2), make_doc(3)]}},
+            ], close_reason='{"type":"done"}'),
+        ]
+        watcher = CrawlWatcher('crawl-1', self.app, backoff_factor=0)
+        delivered = []
+        watcher.add_event_listener('document', lambda detail: delivered.append(detail['data']['metadata']['scrapeId']))
+        watcher.add_event_listener('done', lambda detail: delivered.append('done'))
+        asyncio.run(watcher.connect())
+
+        self.assertEqual(delivered, ['scrape-1', 'scrape-2', 'scrape-3', 'done'])
+        self.assertEqual(watcher.status, 'completed')
+        self.assertEqual(watcher.reconnects, 2)
+
+    @patch('websockets.connect')
+    def test_handler_os_error_is_not_treated_as_a_dropped_connection(self, mock_connect):
+        mock_connect.return_value = FakeWebSocket([{'type': 'document', 'data': make_doc(n)} for n in range(3)])
+        watcher = CrawlWatcher('crawl-1', self.app, backoff_factor=0)
+
+        def on_document(detail):
+            raise OSError('No space left on device')
+
+        watcher.add_event_listener('document', on_document)
+        with self.assertRaises(OSError):
+            asyncio.run(watcher.connect())
+        self.assertEqual(mock_connect.call_count, 1)
+        self.assertEqual(watcher.reconnects, 0)
+
+    @patch('requests.get')
+    @patch('websockets.connect')
+    def test_falls_back_to_polling(self, mock_connect, mock_get):
+        mock_connect.side_effect = websockets.exceptions.InvalidHandshake('blocked by proxy')
+        pages = [
+            {'success': True, 'status': 'scraping', 'data': [make_doc(1)]},
+            {'success': True, 'status': 'completed', 'data': [make_doc(2)], 'next': 'https://api.firecrawl.dev/v1/crawl/crawl-1?skip=2'},
+            {'success': True, 'status': 'completed', 'data': []},
+        ]
+        responses = []
+        for page in pages:
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = page
+            responses.append(response)
+        mock_get.side_effect = responses
+
+        watcher = CrawlWatcher('crawl-1', self.app, poll_interval=0)
+        delivered = []
+        watcher.add_event_listener('document', lambda detail: delivered.append(detail['data']['metadata']['scrapeId']))
+        watcher.add_event_listener('done', lambda detail: delivered.append('done'))
+        asyncio.run(watcher.connect())
+
+        self.assertEqual(delivered, ['scrape-1', 'scrape-2', 'done'])
+        urls = [call.args[0] for call in mock_get.call_args_list]
+        self.assertEqual(urls[1], 'https://api.firecrawl.dev/v1/crawl/crawl-1?skip=1')
+        self.assertEqual(urls[2], 'https://api.firecrawl.dev/v1/crawl/crawl-1?skip=2')
+
+    @patch('requests.get')
+    @patch('websockets.connect')
+    def test_polling_resumes_batch_jobs_after_received_documents(self, mock_connect, mock_get):
+        mock_connect.side_effect = [
+            FakeWebSocket([{'type': 'catchup', 'data': {'status': 'scraping', 'data': [make_doc(1), make_doc(2)]}}], drop=True),
+            websockets.exceptions.InvalidHandshake('blocked by proxy'),
+        ]
+        unavailable = MagicMock()
+        unavailable.status_code = 503
+        completed = MagicMock()
+        completed.status_code = 200
+        completed.json.return_value = {'success': True, 'status': 'completed', 'data': [make_doc(3)]}
+        mock_get.side_effect = [unavailable, completed]
+
+        watcher = CrawlWatcher('batch-1', self.app, job_type='batch', backoff_factor=0, poll_interval=0)
+        delivered = []
+        watcher.add_event_listener('document', lambda detail: delivered.append(detail['data']['metadata']['scrapeId']))
+        asyncio.run(watcher.connect())
+
+        self.assertEqual(delivered, ['scrape-1', 'scrape-2', 'scrape-3'])
+        self.assertEqual(watcher.status, 'completed')
+        urls = [call.args[0] for call in mock_get.call_args_list]
+        self.assertEqual(urls, ['https://api.firecrawl.dev/v1/batch/scrape/batch-1?skip=2'] * 2)
+
+class TestThreadedCrawlWatcher(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    @patch('websockets.connect')
+    def test_iterates_events_from_background_thread(self, mock_connect):
+        mock_connect.return_value = FakeWebSocket(
+            [{'type': 'document', 'data': make_doc(n)} for n in range(5)],
+            close_reason='{"type":"done"}'
+        )
+        threads = set()
+        with ThreadedCrawlWatcher('crawl-1', self.app, max_queued=2) as watcher:
+            watcher.add_event_listener('document', lambda detail: threads.add(threading.get_ident()))
+            events = [event_type for event_type, detail in watcher]
+
+        self.assertEqual(events, ['document'] * 5 + ['done'])
+        self.assertNotIn(threading.get_ident(), threads)
+        self.assertFalse(watcher._thread.is_alive())
+
+    @patch('websockets.connect')
+    def test_close_stops_background_thread(self, mock_connect):
+        mock_connect.return_value = FakeWebSocket(
+            [{'type': 'document', 'data': make_doc(n)} for n in range(50)],
+            close_reason='{"type":"done"}'
+        )
+        watcher = ThreadedCrawlWatcher('crawl-1', self.app, max_queued=1)
+        for event_type, detail in watcher:
+            break
+        watcher.close(timeout=5)
+        self.assertFalse(watcher._thread.is_alive())
+
+    @patch('websockets.connect')
+    def test_slow_consumer_does_not_block_the_loop(self, mock_connect):
+        mock_connect.return_value = FakeWebSocket(
+            [{'type': 'document', 'data': make_doc(n)} for n in range(5)],
+            close_reason='{"type":"done"}'
+        )
+        watcher = ThreadedCrawlWatcher('crawl-1', self.app, max_queued=1).start()
+        deadline = time.monotonic() + 5
+        while not watcher._events.full() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        # The queue is full and nothing consumes it, yet the loop still runs coroutines
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), watcher._loop).result(timeout=1)
+        self.assertEqual([event_type for event_type, detail in watcher], ['document'] * 5 + ['done'])
+
+    def test_close_from_another_thread_ends_iteration(self):
+        watcher = ThreadedCrawlWatcher('crawl-1', self.app)
+
+        async def connect():
+            await asyncio.Event().wait()
+
+        watcher.connect = connect
+        events = []
+        consumer = threading.Thread(target=lambda: events.extend(watcher))
+        consumer.start()
+        time.sleep(0.1)
+        watcher.close(timeout=5)
+        consumer.join(5)
+        self.assertFalse(consumer.is_alive())
+        self.assertEqual(events, [])
+
+    def test_close_right_after_start_cancels_the_watch(self):
+        watcher = ThreadedCrawlWatcher('crawl-1', self.app)
+
+        async def connect():
+            await asyncio.Event().wait()
+
+        watcher.connect = connect
+        new_event_loop = asyncio.new_event_loop
+
+        def slow_new_event_loop():
+            # Widens the window between starting the thread and the loop existing
+            time.sleep(0.1)
+            return new_event_loop()
+
+        with patch('asyncio.new_event_loop', side_effect=slow_new_event_loop):
+            watcher.start()
+            watcher.close(timeout=2)
+        self.assertFalse(watcher._thread.is_alive())
+        self.assertTrue(watcher._task.cancelled())
+
+    @patch('requests.post')
+    def test_crawl_url_and_watch_returns_threaded_watcher(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"success": true, "id": "crawl-1"}'
+        mock_post.return_value = mock_response
+
+        watcher = self.app.crawl_url_and_watch('https://example.com', watcher_options={'retain': 'none', 'batch_size': 10})
+        self.assertIsInstance(watcher, ThreadedCrawlWatcher)
+        self.assertEqual(watcher.id, 'crawl-1')
+        self.assertEqual(watcher.retain, 'none')
+        self.assertEqual(watcher.batch_size, 10)
+        self.assertNotIn('retain', mock_post.call_args.kwargs['json'])
+
+class TestWatcherSinks(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    @patch('websockets.connect')
+    def test_file_sink_without_retaining_documents(self, mock_connect):
+        mock_connect.return_value = FakeWebSocket(
+            [{'type': 'document', 'data': make_doc(n)} for n in range(3)],
+            close_reason='{"type":"done"}'
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'crawl.jsonl')
+            watcher = CrawlWatcher('crawl-1', self.app, retain='none', sink=path)
+            done = []
+            watcher.add_event_listener('done', done.append)
+            asyncio.run(watcher.connect())
+
+            with open(path) as f:
+                lines = [json.loads(line) for line in f]
+
+        self.assertEqual([line['markdown'] for line in lines], ['page 0', 'page 1', 'page 2'])
+        self.assertEqual(watcher.data, [])
+        self.assertEqual(done, [{'status': 'completed', 'id': 'crawl-1', 'count': 3}])
+
+    def test_seen_keys_are_bounded_without_retaining_documents(self):
+        watcher = CrawlWatcher('crawl-1', self.app, retain='none', max_seen=2)
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(5)]
+        asyncio.run(watcher._listen(FakeWebSocket(messages + [{'type': 'document', 'data': make_doc(4)}])))
+
+        self.assertEqual(len(watcher._seen), 2)
+        self.assertEqual(watcher.document_count, 5)
+        self.assertEqual(CrawlWatcher('crawl-2', self.app, retain='none').max_seen, CrawlWatcher.DEFAULT_MAX_SEEN)
+        self.assertIsNone(CrawlWatcher('crawl-3', self.app).max_seen)
+
+    def test_queue_and_callable_sinks_with_ids(self):
+        sink = queue.Queue()
+        watcher = CrawlWatcher('crawl-1', self.app, retain='ids', sink=sink)
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(2)] + [{'type': 'done'}]
+        done = []
+        watcher.add_event_listener('done', done.append)
+        asyncio.run(watcher._listen(FakeWebSocket(messages)))
+
+        self.assertEqual(sink.qsize(), 2)
+        self.assertEqual(done[0]['ids'], ['scrape-0', 'scrape-1'])
+
+        received = []
+
+        async def store(doc):
+            received.append(doc['markdown'])
+
+        watcher = CrawlWatcher('crawl-1', self.app, sink=store)
+        asyncio.run(watcher._listen(FakeWebSocket(messages)))
+        self.assertEqual(received, ['page 0', 'page 1'])
+        self.assertEqual(len(watcher.data), 2)
+
+    def test_invalid_retain_mode(self):
+        with self.assertRaises(ValueError):
+            CrawlWatcher('crawl-1', self.app, retain='some')
+
+class TestWatcherBatching(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    def test_documents_are_delivered_in_batches(self):
+        batches = []
+        written = []
+        watcher = CrawlWatcher('crawl-1', self.app, batch_size=4, sink=written.append)
+        watcher.add_event_listener('documents', lambda detail: batches.append(len(detail['data'])))
+        watcher.add_event_listener('document', lambda detail: self.fail('per-document event while batching'))
+        watcher.add_event_listener('done', lambda detail: batches.append('done'))
+        messages = [{'type': 'document', 'data': make_doc(n)} for n in range(10)] + [{'type': 'done'}]
+        asyncio.run(watcher._listen(FakeWebSocket(messages)))
+
+        self.assertEqual(batches, [4, 4, 2, 'done'])
+        self.assertEqual([len(docs) for docs in written], [4, 4, 2])
+
+    def test_incomplete_batch_is_flushed_after_interval(self):
+        batches = []
+        watcher = CrawlWatcher('crawl-1', self.app, batch_size=100, batch_interval=0.01)
+        watcher.add_event_listener('documents', lambda detail: batches.append(len(detail['data'])))
+
+        async def run():
+            await watcher._handle_message({'type': 'document', 'data': make_doc(1)})
+            await watcher._handle_message({'type': 'document', 'data': make_doc(2)})
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+        self.assertEqual(batches, [2])
@@ -0,0 +1,127 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import collections
+import os
+import threading
+import time
+import requests
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, DomainDispatcher
+
+URLS = [f'https://big.example.com/{n}' for n in range(6)] + ['https://small.example.org/a', 'https://small.example.org/b']
+
+class TestDomainDispatcher(unittest.TestCase):
+    def test_round_robin_across_hosts(self):
+        dispatcher = DomainDispatcher(max_per_host=1)
+        order = []
+        for url in URLS:
+            dispatcher.put(url, lambda url=url: order.append(url) or True)
+        dispatcher.work()
+
+        self.assertEqual(order[:4], [URLS[0], URLS[6], URLS[1], URLS[7]])
+        self.assertEqual(order[4:], URLS[2:6])
+        self.assertEqual(dispatcher.stats()['big.example.com']['active'], 0)
+
+    def test_adaptive_slowdown_and_recovery(self):
+        dispatcher = DomainDispatcher(max_per_host=4, backoff=0.2, error_threshold=0.2, window=5)
+        dispatcher.put('https://a.example.com/1', lambda: False)
+        dispatcher.work()
+        stats = dispatcher.stats()['a.example.com']
+        self.assertEqual(stats['limit'], 2)
+        self.assertEqual(stats['delay'], 0.0)
+        self.assertEqual(stats['errorRate'], 1.0)
+
+        for n in range(2):
+            dispatcher.put(f'https://a.example.com/{n}', lambda: False)
+        dispatcher.work()
+        stats = dispatcher.stats()['a.example.com']
+        self.assertEqual(stats['limit'], 1)
+        self.assertEqual(stats['delay'], 0.2)
+
+        for n in range(10):
+            dispatcher.put(f'https://a.example.com/{n}', lambda: True)
+        start = time.monotonic()
+        dispatcher.work()
+        # The first success waits out the backoff delay, which then decays
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+        stats = dispatcher.stats()['a.example.com']
+        self.assertEqual(stats['limit'], 4)
+        self.assertEqual(stats['delay'], 0.0)
+
+    def test_is_healthy(self):
+        self.assertTrue(DomainDispatcher.is_healthy(MagicMock(metadata={'statusCode': 200})))
+        self.assertFalse(DomainDispatcher.is_healthy(MagicMock(metadata={'statusCode': 429})))
+        self.assertFalse(DomainDispatcher.is_healthy(None))
+
+    def test_is_site_error(self):
+        def http_error(status):
+            response = MagicMock(status_code=status)
+            return requests.exceptions.HTTPError('failed', response=response)
+
+        self.assertTrue(DomainDispatcher.is_site_error(http_error(408)))
+        self.assertTrue(DomainDispatcher.is_site_error(Exception('Failed to scrape URL. Error: blocked')))
+        for status in (401, 402, 429):
+            self.assertFalse(DomainDispatcher.is_site_error(http_error(status)))
+        self.assertFalse(DomainDispatcher.is_site_error(requests.exceptions.ConnectionError()))
+
+    def test_api_errors_do_not_slow_the_host_down(self):
+        def fake_post(url, headers=None, json=None, timeout=None):
+            response = MagicMock()
+            response.status_code = 402
+            response.json.return_value = {'success': False, 'error': 'Insufficient credits'}
+            return response
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        dispatcher = DomainDispatcher(max_per_host=2)
+        with patch('requests.Session.post', side_effect=fake_post):
+            results = list(app.scrape_many(URLS[:4], concurrency=2, politeness=dispatcher))
+
+        self.assertFalse(any(result.success for result in results))
+        stats = dispatcher.stats()['big.example.com']
+        self.assertEqual(stats['limit'], 2)
+        self.assertEqual(stats['errorRate'], 0.0)
+
+    def test_scrape_many_caps_each_host(self):
+        lock = threading.Lock()
+        active = collections.Counter()
+        peak = collections.Counter()
+
+        def fake_post(url, headers=None, json=None, timeout=None):
+            host = DomainDispatcher.host(json['url'])
+            with lock:
+                active[host] += 1
+                peak[host] = max(peak[host], active[host])
+            time.sleep(0.02)
+            with lock:
+                active[host] -= 1
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {'success': True, 'data': {'markdown': json['url'], 'metadata': {'statusCode': 200}}}
+            return response
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        with patch('requests.Session.post', side_effect=fake_post):
+            results = list(app.scrape_many(URLS, concurrency=6, politeness=DomainDispatcher(max_per_host=2)))
+
+        self.assertEqual(sorted(result.index for result in results), list(range(len(URLS))))
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(peak['big.example.com'], 2)
+
+    def test_async_scrape_many_with_politeness(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        started = []
+
+        async def post(url, data, headers):
+            started.append(data['url'])
+            await asyncio.sleep(0.01)
+            return {'success': True, 'data': {'markdown': data['url']}}
+
+        async def collect():
+            return [result async for result in app.scrape_many(URLS, concurrency=2, ordered=True, politeness=DomainDispatcher(max_per_host=1))]
+
+        with patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=post):
+            results = asyncio.run(collect())
+
+        self.assertEqual([result.index for result in results], list(range(len(URLS))))
+        # The small host is served before the large one is finished
+        self.assertLess(started.index(URLS[7]), 4)
@@ -0,0 +1,96 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import os
+import uuid
+import requests
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+from firecrawl.firecrawl import IdempotencyRegistry
+
+API_URL = 'https://api.firecrawl.dev'
+
+class TestIdempotencyRegistry(unittest.TestCase):
+    def test_key_is_stable_uuid(self):
+        registry = IdempotencyRegistry()
+        key = registry.key(f'{API_URL}/v1/crawl', {'url': 'https://example.com', 'limit': 10})
+        self.assertEqual(key, registry.key(f'{API_URL}/v1/crawl', {'limit': 10, 'url': 'https://example.com'}))
+        self.assertNotEqual(key, registry.key(f'{API_URL}/v1/crawl', {'url': 'https://example.com', 'limit': 11}))
+        self.assertEqual(uuid.UUID(key).version, 4)
+
+    def test_lookup_spans_window_boundary(self):
+        registry = IdempotencyRegistry(window=60)
+        params = {'url': 'https://example.com'}
+        with patch('time.time', return_value=119.0):
+            key, recorded = registry.lookup(f'{API_URL}/v1/crawl', params)
+            self.assertIsNone(recorded)
+            registry.record(key, {'id': 'crawl-1'})
+        with patch('time.time', return_value=121.0):
+            self.assertEqual(registry.lookup(f'{API_URL}/v1/crawl', params), (key, {'id': 'crawl-1'}))
+        with patch('time.time', return_value=181.0):
+            self.assertIsNone(registry.lookup(f'{API_URL}/v1/crawl', params)[1])
+
+    @patch('requests.post')
+    def test_unanswered_submission_keeps_its_key_across_windows(self, mock_post):
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        app.idempotency_registry = IdempotencyRegistry(window=60)
+        rejected = MagicMock()
+        rejected.status_code = 400
+        accepted = MagicMock()
+        accepted.status_code = 200
+        accepted.json.return_value = {'success': True, 'id': 'crawl-1', 'url': f'{API_URL}/v1/crawl/crawl-1'}
+        mock_post.side_effect = [requests.Timeout('timed out'), accepted, rejected]
+
+        with patch('time.time', return_value=119.0):
+            with self.assertRaises(requests.Timeout):
+                app.async_crawl_url('https://example.com', auto_idempotency=True)
+        with patch('time.time', return_value=121.0):
+            app.async_crawl_url('https://example.com', auto_idempotency=True)
+        keys = [call.kwargs['headers']['x-idempotency-key'] for call in mock_post.call_args_list]
+        self.assertEqual(keys[0], keys[1])
+
+        # A request the server rejected does not hold on to its key
+        with patch('time.time', return_value=119.0):
+            with self.assertRaises(Exception):
+                app.async_crawl_url('https://example.org', auto_idempotency=True)
+            key = mock_post.call_args.kwargs['headers']['x-idempotency-key']
+        self.assertNotIn(key, app.idempotency_registry._jobs)
+
+    @patch('requests.post')
+    def test_resubmission_reattaches_to_job(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'success': True, 'id': 'crawl-1', 'url': f'{API_URL}/v1/crawl/crawl-1'}
+        mock_post.return_value = mock_response
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        first = app.async_crawl_url('https://example.com', limit=10, auto_idempotency=True)
+        second = app.async_crawl_url('https://example.com', limit=10, auto_idempotency=True)
+
+        self.assertEqual(mock_post.call_count, 1)
+        self.assertEqual(first.id, second.id)
+        key = mock_post.call_args.kwargs['headers']['x-idempotency-key']
+        self.assertEqual(uuid.UUID(key).version, 4)
+
+        app.async_crawl_url('https://example.com', limit=10, idempotency_key='explicit', auto_idempotency=True)
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(mock_post.call_args.kwargs['headers']['x-idempotency-key'], 'explicit')
+
+    def test_async_resubmission_reattaches_to_job(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        posts = []
+
+        async def post(url, data, headers):
+            posts.append(headers)
+            return {'success': True, 'id': f'batch-{len(posts)}'}
+
+        async def submit():
+            return [
+                await app.async_batch_scrape_urls(['https://example.com'], auto_idempotency=True)
+                for _ in range(2)
+            ]
+
+        with patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=post):
+            first, second = asyncio.run(submit())
+
+        self.assertEqual(len(posts), 1)
+        self.assertEqual(second.id, 'batch-1')
@@ -0,0 +1,50 @@
+import unittest
+import os
+import subprocess
+import sys
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules only the async client, watchers and streaming helpers need
+DEFERRED = ('aiohttp', 'websockets', 'asyncio')
+# Own import cost of the package, excluding requests and pydantic (best of 3 runs)
+BUDGET_US = 300_000
+
+def import_times(statement):
+    """Runs `statement` under `python -X importtime` and returns {module: cumulative microseconds}."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True, text=True, cwd=PACKAGE_ROOT, check=True
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+class TestImportTime(unittest.TestCase):
+    def test_async_dependencies_are_deferred(self):
+        baseline = import_times('import requests, pydantic')
+        times = import_times('import firecrawl')
+        for module in DEFERRED:
+            if module not in baseline:
+                self.assertNotIn(module, times)
+
+    def test_sync_client_does_not_load_async_dependencies(self):
+        statement = (
+            'import sys, firecrawl; firecrawl.FirecrawlApp(api_key="fc-test"); '
+            'print(",".join(m for m in %r if m in sys.modules))' % (DEFERRED,)
+        )
+        baseline = subprocess.run([sys.executable, '-c', 'import sys, requests, pydantic; print(",".join(m for m in %r if m in sys.modules))' % (DEFERRED,)],
+                                  capture_output=True, text=True, cwd=PACKAGE_ROOT, check=True).stdout.strip()
+        loaded = subprocess.run([sys.executable, '-c', statement], capture_output=True, text=True, cwd=PACKAGE_ROOT, check=True).stdout.strip()
+        self.assertEqual(loaded, baseline)
+
+    def test_import_budget(self):
+        own = []
+        for _ in range(3):
+            times = import_times('import firecrawl')
+            own.append(times['firecrawl'] - times.get('requests', 0) - times.get('pydantic', 0))
+        self.assertLess(min(own), BUDGET_US)
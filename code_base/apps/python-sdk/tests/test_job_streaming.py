@@ -0,0 +1,132 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import json
+import os
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+from firecrawl.firecrawl import _SSEParser, _model_dump, DeepResearchParams, GenerateLLMsTextParams
+
+def research_status(step, status='processing'):
+    return {
+        'success': True,
+        'status': status,
+        'activities': [{'message': f'step {i}'} for i in range(step)],
+        'sources': [{'url': f'https://example.com/{i}'} for i in range(step // 2)],
+    }
+
+def json_response(payload):
+    response = MagicMock()
+    response.status_code = 200
+    response.headers = {'Content-Type': 'application/json'}
+    response.json.return_value = payload
+    return response
+
+def sse_lines(*events):
+    lines = [': keep-alive', '']
+    for event, payload in events:
+        lines += [f'event: {event}', f'data: {json.dumps(payload)}', '']
+    return [line.encode() for line in lines]
+
+class TestSSEParser(unittest.TestCase):
+    def test_parses_events(self):
+        parser = _SSEParser()
+        events = [parser.feed(line) for line in ['event: status', 'data: {"a":', 'data: 1}', '', ': comment', 'data:x', '']]
+        self.assertEqual([event for event in events if event], [('status', '{"a":\n1}'), ('message', 'x')])
+
+class TestJobStreaming(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    @patch('requests.post')
+    def test_experimental_flags_reach_the_api(self, mock_post):
+        mock_post.return_value = json_response({'success': True, 'id': 'job-1'})
+
+        self.app.async_deep_research('query', experimental_stream_steps=True)
+        self.assertTrue(mock_post.call_args.kwargs['json']['__experimental_streamSteps'])
+
+        self.app.async_generate_llms_text('https://example.com', experimental_stream=True)
+        self.assertTrue(mock_post.call_args.kwargs['json']['__experimental_stream'])
+
+    def test_params_accept_field_names(self):
+        self.assertTrue(_model_dump(DeepResearchParams(experimental_stream_steps=True))['__experimental_streamSteps'])
+        self.assertTrue(_model_dump(GenerateLLMsTextParams(experimental_stream=True))['__experimental_stream'])
+        self.assertTrue(_model_dump(GenerateLLMsTextParams(**{'__experimental_stream': True}))['__experimental_stream'])
+
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_polling_fallback_yields_increments(self, mock_post, mock_get):
+        mock_post.return_value = json_response({'success': True, 'id': 'job-1'})
+        mock_get.side_effect = [
+            json_response(research_status(1)),
+            json_response(research_status(1)),
+            json_response(research_status(3, 'completed')),
+        ]
+
+        events = list(self.app.stream_deep_research('query', poll_interval=0))
+
+        self.assertEqual(
+            [event for event, _ in events],
+            ['activity', 'activity', 'activity', 'source', 'done']
+        )
+        self.assertEqual(events[2][1], {'message': 'step 2'})
+        self.assertEqual(mock_get.call_args.kwargs['headers']['Accept'], 'text/event-stream')
+
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_server_sent_events(self, mock_post, mock_get):
+        mock_post.return_value = json_response({'success': True, 'id': 'job-1'})
+        response = MagicMock()
+        response.status_code = 200
+        response.headers = {'Content-Type': 'text/event-stream; charset=utf-8'}
+        response.iter_lines.return_value = sse_lines(
+            ('status', {'success': True, 'status': 'processing', 'data': {'llmstxt': '# Example'}}),
+            ('status', {'success': True, 'status': 'processing', 'data': {'llmstxt': '# Example\n- a'}}),
+            ('status', {'success': True, 'status': 'completed', 'data': {'llmstxt': '# Example\n- a'}}),
+        )
+        mock_get.return_value = response
+
+        events = list(self.app.stream_generate_llms_text('https://example.com'))
+
+        self.assertEqual([event for event, _ in events], ['text', 'text', 'done'])
+        self.assertEqual(events[1][1], {'delta': '\n- a', 'text': '# Example\n- a'})
+        self.assertEqual(mock_get.call_count, 1)
+
+class FakeStreamResponse:
+    def __init__(self, lines):
+        self.status = 200
+        self.content_type = 'text/event-stream'
+        self.content = self._iterate(lines)
+
+    async def _iterate(self, lines):
+        for line in lines:
+            yield line + b'\n'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+class TestAsyncJobStreaming(unittest.TestCase):
+    def test_async_server_sent_events(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        session = MagicMock()
+        session.get.return_value = FakeStreamResponse(sse_lines(
+            ('activity', {'message': 'searching'}),
+            ('status', research_status(1, 'failed')),
+        ))
+        app._client_session = session
+
+        async def post(url, data, headers, *args, **kwargs):
+            self.assertTrue(data['__experimental_streamSteps'])
+            return {'success': True, 'id': 'job-1'}
+
+        async def run():
+            return [event async for event in app.stream_deep_research('query')]
+
+        with patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=post):
+            events = asyncio.run(run())
+
+        # The snapshot's activity was already delivered as a step event
+        self.assertEqual([event for event, _ in events], ['activity', 'error'])
+        self.assertTrue(session.get.call_args.args[0].endswith('/v1/deep-research/job-1'))
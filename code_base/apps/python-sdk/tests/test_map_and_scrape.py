@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import patch
+import asyncio
+import os
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+from test_batch_sharding import FakeBatchApi, make_response
+
+LINKS = [f'https://example.com/blog/{n}' for n in range(5)] + ['https://example.com/about', 'https://example.com/blog/0']
+
+class FakeMapApi(FakeBatchApi):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.filtered = []
+
+    def post(self, url, headers=None, json=None, timeout=None):
+        if url.endswith('/v1/map'):
+            return make_response({'success': True, 'links': LINKS})
+        return super().post(url, headers=headers, json=json, timeout=timeout)
+
+    def keep(self, link):
+        self.filtered.append((link, len(self.jobs)))
+        return '/blog/' in link
+
+class TestMapAndScrape(unittest.TestCase):
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_streams_filtered_links_through_shards(self, mock_post, mock_get):
+        api = FakeMapApi(fail_first={LINKS[0]})
+        mock_post.side_effect = api.post
+        mock_get.side_effect = api.get
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        documents = app.map_and_scrape('https://example.com', filter=api.keep, shard_size=2, concurrency=1, poll_interval=0)
+        first = next(documents)
+        # Only the first shard's links were filtered before its document arrived
+        self.assertEqual(len(api.filtered), 2)
+        rest = list(documents)
+
+        self.assertEqual(sorted(document.markdown for document in [first, *rest]), LINKS[:5])
+        self.assertEqual([urls for urls, key in api.posted], [LINKS[0:2], LINKS[0:2], LINKS[2:4], LINKS[4:5]])
+
+    def test_async_map_and_scrape(self):
+        api = FakeMapApi()
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+        async def post(url, data, headers):
+            return api.post(url, headers=headers, json=data).json()
+
+        async def get(url, headers):
+            return api.get(url, headers=headers).json()
+
+        async def collect():
+            return [document async for document in app.map_and_scrape(
+                'https://example.com', filter=api.keep, shard_size=2, concurrency=3, poll_interval=0)]
+
+        with patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=post), \
+                patch.object(AsyncFirecrawlApp, '_async_get_request', side_effect=get):
+            documents = asyncio.run(collect())
+
+        self.assertEqual(sorted(document.markdown for document in documents), LINKS[:5])
+        self.assertEqual(len(api.jobs), 3)
@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import copy
+import json
+import os
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+from firecrawl.firecrawl import MetadataTable, CompactMetadata, FirecrawlDocument
+
+class TestMetadataTable(unittest.TestCase):
+    def test_pack_shares_repeated_values(self):
+        table = MetadataTable()
+        first = table.pack({'ogSiteName': 'Example', 'statusCode': 200, 'sourceURL': 'https://example.com/a'})
+        second = table.pack({'ogSiteName': 'Example', 'statusCode': 200, 'sourceURL': 'https://example.com/b'})
+
+        self.assertEqual(first['sourceURL'], 'https://example.com/a')
+        self.assertEqual(second.to_dict(), {'ogSiteName': 'Example', 'statusCode': 200, 'sourceURL': 'https://example.com/b'})
+        # 3 keys + 2 shared values + 2 distinct URLs
+        self.assertEqual(len(table), 7)
+        with self.assertRaises(KeyError):
+            first['missing']
+
+    def test_distinct_types_are_not_merged(self):
+        table = MetadataTable()
+        metadata = table.pack({'a': 1, 'b': True, 'c': ['en', 'de']})
+        self.assertIs(metadata['b'], True)
+        self.assertEqual(metadata['a'], 1)
+        self.assertEqual(metadata['c'], ['en', 'de'])
+
+    @patch('requests.get')
+    def test_check_crawl_status_compacts_metadata(self, mock_get):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'success': True,
+            'status': 'completed',
+            'completed': 2,
+            'total': 2,
+            'creditsUsed': 2,
+            'expiresAt': '2025-01-01T00:00:00Z',
+            'data': [
+                {'markdown': 'a', 'metadata': {'language': 'en', 'sourceURL': 'https://example.com/a'}},
+                {'markdown': 'b', 'metadata': {'language': 'en', 'sourceURL': 'https://example.com/b'}},
+            ]
+        }
+        mock_get.return_value = mock_response
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        result = app.check_crawl_status('crawl-1', compact_metadata=True)
+
+        self.assertIsInstance(result.data[0].metadata, CompactMetadata)
+        self.assertEqual(result.data[1].metadata['sourceURL'], 'https://example.com/b')
+
+    def test_list_items_keep_their_types(self):
+        table = MetadataTable()
+        metadata = table.pack({'a': [1], 'b': [True]})
+        self.assertIs(metadata['b'][0], True)
+        self.assertEqual(len(table), 4)
+
+    def test_mutating_one_documents_list_leaves_the_others_alone(self):
+        table = MetadataTable()
+        first = table.pack({'keywords': ['a', 'b']})
+        second = table.pack({'keywords': ['a', 'b']})
+
+        first['keywords'].append('c')
+        first.to_dict()['keywords'].append('d')
+
+        self.assertEqual(first['keywords'], ['a', 'b'])
+        self.assertEqual(second['keywords'], ['a', 'b'])
+        self.assertEqual(second.to_dict(), {'keywords': ['a', 'b']})
+
+    def test_compact_documents_serialize_as_dicts(self):
+        metadata = {'language': 'en', 'statusCode': 200, 'keywords': ['a', 'b']}
+        document = FirecrawlDocument(markdown='a', metadata=MetadataTable().pack(metadata))
+
+        self.assertEqual(json.loads(json.dumps(document.model_dump()))['metadata'], metadata)
+        restored = FirecrawlDocument.model_validate_json(document.model_dump_json())
+        self.assertEqual(restored.metadata, metadata)
+
+    def test_async_status_checks_compact_metadata(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        status = {
+            'success': True,
+            'status': 'completed',
+            'completed': 1,
+            'total': 1,
+            'creditsUsed': 1,
+            'expiresAt': '2025-01-01T00:00:00Z',
+            'data': [{'markdown': 'a', 'metadata': {'language': 'en'}}],
+        }
+
+        async def get(url, headers, *args, **kwargs):
+            return copy.deepcopy(status)
+
+        with patch.object(AsyncFirecrawlApp, '_async_get_request', side_effect=get):
+            result = asyncio.run(app.check_crawl_status('crawl-1', compact_metadata=True))
+
+        self.assertIsInstance(result.data[0].metadata, CompactMetadata)
@@ -0,0 +1,81 @@
+import unittest
+from unittest.mock import patch
+import asyncio
+import os
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, NearDuplicateFilter
+from firecrawl.firecrawl import CrawlWatcher, ScrapeParams
+
+BASE_TEXT = ' '.join(f'word{i}' for i in range(200))
+
+class TestNearDuplicateFilter(unittest.TestCase):
+    def test_detects_near_duplicates(self):
+        dedup = NearDuplicateFilter()
+        self.assertEqual(dedup.fingerprint(BASE_TEXT), dedup.fingerprint(BASE_TEXT))
+
+        self.assertIsNone(dedup.check({'markdown': BASE_TEXT, 'metadata': {'sourceURL': 'https://example.com/a'}}))
+        near = BASE_TEXT.replace('word100', 'changed')
+        self.assertEqual(
+            dedup.check({'markdown': near, 'metadata': {'sourceURL': 'https://example.com/a?ref=1'}}),
+            'https://example.com/a'
+        )
+        other = ' '.join(f'other{i}' for i in range(200))
+        self.assertIsNone(dedup.check({'markdown': other, 'metadata': {'sourceURL': 'https://example.com/b'}}))
+        self.assertEqual(dedup.duplicates, 1)
+
+    def test_max_entries_forgets_oldest_fingerprints(self):
+        dedup = NearDuplicateFilter(max_entries=2)
+        texts = [' '.join(f'page{n}-{i}' for i in range(50)) for n in range(3)]
+        for n, text in enumerate(texts):
+            self.assertIsNone(dedup.check({'markdown': text, 'metadata': {'sourceURL': f'https://example.com/{n}'}}))
+
+        self.assertEqual(len(dedup._fingerprints), 2)
+        self.assertEqual(sum(len(bucket) for band in dedup._index for bucket in band.values()), 2 * len(dedup._index))
+        # The first page was forgotten, the latest one is still recognised
+        self.assertIsNone(dedup.check({'markdown': texts[0]}))
+        self.assertEqual(dedup.check({'markdown': texts[2]}), 'https://example.com/2')
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            NearDuplicateFilter(max_distance=16)
+        with self.assertRaises(ValueError):
+            NearDuplicateFilter(mode='merge')
+
+    def test_watcher_drop_and_flag_modes(self):
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        docs = [
+            {'markdown': BASE_TEXT, 'metadata': {'sourceURL': 'https://example.com/a'}},
+            {'markdown': BASE_TEXT, 'metadata': {'sourceURL': 'https://example.com/a/'}},
+        ]
+
+        for mode, expected in (('drop', 1), ('flag', 2)):
+            watcher = CrawlWatcher('crawl-1', app, near_duplicate_filter=NearDuplicateFilter(mode=mode))
+            events = []
+            watcher.add_event_listener('document', events.append)
+            for doc in docs:
+                asyncio.run(watcher._handle_message({'type': 'document', 'data': doc}))
+            self.assertEqual(len(watcher.data), expected)
+            self.assertEqual(len(events), expected)
+            if mode == 'flag':
+                self.assertEqual(events[1]['duplicateOf'], 'https://example.com/a')
+
+    def test_async_batch_watch_starts_the_job_through_async_batch_scrape_urls(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        dedup = NearDuplicateFilter()
+
+        async def post(url, data, headers):
+            return {'success': True, 'id': 'batch-1'}
+
+        with patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=post) as mock_post:
+            watcher = asyncio.run(app.batch_scrape_urls_and_watch(
+                ['https://example.com'],
+                ScrapeParams(formats=['markdown'], onlyMainContent=True),
+                near_duplicate_filter=dedup
+            ))
+
+        url, data, headers = mock_post.call_args.args
+        self.assertEqual(url, f'{app.api_url}/v1/batch/scrape')
+        self.assertEqual(data['urls'], ['https://example.com'])
+        self.assertTrue(data['onlyMainContent'])
+        self.assertEqual(watcher.id, 'batch-1')
+        self.assertEqual(watcher.job_type, 'batch')
+        self.assertIs(watcher.near_duplicate_filter, dedup)
@@ -0,0 +1,100 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import json
+import logging
+import os
+import requests
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, RequestLogger
+from firecrawl import _JsonFormatter
+
+def make_response(status_code, payload):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(payload).encode()
+    response.headers = {}
+    response.json.return_value = payload
+    return response
+
+class TestRequestLogger(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    @patch('requests.post')
+    def test_logs_request_fields(self, mock_post):
+        mock_post.return_value = make_response(200, {'success': True, 'data': {'markdown': '# Hi'}})
+        self.app.request_logger = RequestLogger(format='json')
+
+        with self.assertLogs('firecrawl.requests', logging.INFO) as logs:
+            self.app.scrape_url('https://example.com')
+
+        fields = logs.records[0].firecrawl
+        self.assertEqual(fields['method'], 'POST')
+        self.assertEqual(fields['endpoint'], '/v1/scrape')
+        self.assertEqual(fields['status'], 200)
+        self.assertEqual(fields['bytes'], len(mock_post.return_value.content))
+        self.assertEqual(json.loads(logs.records[0].getMessage()), fields)
+
+        entry = json.loads(_JsonFormatter().format(logs.records[0]))
+        self.assertEqual((entry['level'], entry['endpoint']), ('INFO', '/v1/scrape'))
+
+    def test_disabled_logger_adds_no_wrapper(self):
+        logger = logging.getLogger('firecrawl.test.disabled')
+        logger.setLevel(logging.ERROR)
+        self.app.request_logger = RequestLogger(logger)
+        self.assertIs(self.app._http, requests)
+
+    @patch('requests.get')
+    def test_sampling_keeps_errors(self, mock_get):
+        self.app.request_logger = RequestLogger(format='kv', sample_rate=0)
+
+        with self.assertLogs('firecrawl.requests', logging.INFO) as logs:
+            mock_get.return_value = make_response(200, {})
+            self.app._get_request('https://api.firecrawl.dev/v1/crawl/1', {})
+            mock_get.return_value = make_response(500, {})
+            self.app._get_request('https://api.firecrawl.dev/v1/crawl/2', {})
+            mock_get.side_effect = requests.ConnectionError('reset')
+            with self.assertRaises(requests.ConnectionError):
+                self.app._get_request('https://api.firecrawl.dev/v1/crawl/3', {})
+
+        self.assertEqual([record.levelno for record in logs.records], [logging.WARNING, logging.WARNING])
+        self.assertIn('endpoint=/v1/crawl/2 status=500', logs.records[0].getMessage())
+        self.assertIn('error=ConnectionError: reset', logs.records[1].getMessage())
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            RequestLogger(format='xml')
+        with self.assertRaises(ValueError):
+            RequestLogger(sample_rate=2)
+
+class FakeAsyncResponse:
+    def __init__(self, status, body):
+        self.status = status
+        self._body = body
+
+    async def json(self):
+        return json.loads(self._body)
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+class TestAsyncRequestLogger(unittest.TestCase):
+    def test_async_requests_are_logged(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        app.request_logger = RequestLogger()
+        body = b'{"success": true}'
+        session = MagicMock()
+        session.request.return_value = FakeAsyncResponse(200, body)
+
+        with self.assertLogs('firecrawl.requests', logging.INFO) as logs:
+            result = asyncio.run(app._async_send(session, 'GET', 'https://api.firecrawl.dev/v1/map', {}, None, 1, 0))
+
+        self.assertEqual(result, {'success': True})
+        self.assertEqual(logs.records[0].firecrawl['bytes'], len(body))
+        self.assertEqual(logs.records[0].firecrawl['method'], 'GET')
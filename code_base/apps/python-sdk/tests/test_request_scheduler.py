@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import os
+import threading
+import time
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, RequestScheduler
+
+API_URL = 'https://api.firecrawl.dev'
+
+class TestRequestScheduler(unittest.TestCase):
+    def test_classifies_by_endpoint(self):
+        scheduler = RequestScheduler()
+        self.assertEqual(scheduler.classify('POST', f'{API_URL}/v1/scrape'), 'interactive')
+        self.assertEqual(scheduler.classify('POST', f'{API_URL}/v1/search'), 'interactive')
+        self.assertEqual(scheduler.classify('POST', f'{API_URL}/v1/batch/scrape'), 'background')
+        self.assertEqual(scheduler.classify('GET', f'{API_URL}/v1/crawl/abc'), 'background')
+        self.assertEqual(scheduler.classify('DELETE', f'{API_URL}/v1/other'), 'default')
+        with scheduler.priority('interactive'):
+            self.assertEqual(scheduler.classify('GET', f'{API_URL}/v1/crawl/abc'), 'interactive')
+        with self.assertRaises(ValueError):
+            with scheduler.priority('urgent'):
+                pass
+        with self.assertRaises(ValueError):
+            RequestScheduler(limits={'interactive': 0})
+
+    def test_interactive_jumps_the_queue(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+        order = []
+        release = threading.Event()
+
+        def request(method, path):
+            with scheduler.slot(method, f'{API_URL}{path}') as priority:
+                order.append(priority)
+                release.wait()
+
+        holder = threading.Thread(target=request, args=('GET', '/v1/crawl/a'))
+        holder.start()
+        while not scheduler.stats()['background']['active']:
+            time.sleep(0.001)
+        background = threading.Thread(target=request, args=('GET', '/v1/crawl/b'))
+        background.start()
+        while not scheduler.stats()['background']['queued']:
+            time.sleep(0.001)
+        interactive = threading.Thread(target=request, args=('POST', '/v1/scrape'))
+        interactive.start()
+        while not scheduler.stats()['interactive']['queued']:
+            time.sleep(0.001)
+        release.set()
+        for thread in (holder, background, interactive):
+            thread.join(5)
+
+        self.assertEqual(order, ['background', 'interactive', 'background'])
+        stats = scheduler.stats()
+        self.assertEqual(stats['interactive']['wait']['count'], 1)
+        self.assertEqual(stats['background']['service']['count'], 2)
+
+    def test_class_limit_leaves_room_for_interactive(self):
+        scheduler = RequestScheduler(max_concurrency=2, limits={'interactive': 2, 'background': 1})
+
+        async def run():
+            async with scheduler.async_slot('GET', f'{API_URL}/v1/crawl/a'):
+                blocked = asyncio.ensure_future(self._slot(scheduler, 'GET', '/v1/crawl/b'))
+                await asyncio.sleep(0.01)
+                self.assertFalse(blocked.done())
+                # The second slot is still free for interactive requests
+                await asyncio.wait_for(self._slot(scheduler, 'POST', '/v1/scrape'), 1)
+                blocked.cancel()
+            self.assertEqual(scheduler.stats()['background']['queued'], 0)
+
+        asyncio.run(run())
+        self.assertEqual(scheduler.stats()['background']['active'], 0)
+
+    def test_cancel_after_grant_releases_the_slot(self):
+        scheduler = RequestScheduler(max_concurrency=1)
+
+        async def run():
+            async with scheduler.async_slot('GET', f'{API_URL}/v1/crawl/a'):
+                waiting = asyncio.ensure_future(self._slot(scheduler, 'GET', '/v1/crawl/b'))
+                await asyncio.sleep(0.01)
+            # Let _wake hand the slot over, then cancel before the waiter resumes
+            await asyncio.sleep(0)
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+            self.assertTrue(waiting.cancelled())
+            await asyncio.wait_for(self._slot(scheduler, 'GET', '/v1/crawl/c'), 1)
+
+        asyncio.run(run())
+        self.assertEqual(scheduler.stats()['background']['active'], 0)
+
+    async def _slot(self, scheduler, method, path):
+        async with scheduler.async_slot(method, f'{API_URL}{path}'):
+            pass
+
+    @patch('requests.post')
+    def test_sync_client_requests_are_scheduled(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'success': True, 'data': {'markdown': '# Example'}}
+        mock_post.return_value = mock_response
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        app.scheduler = RequestScheduler()
+        app.scrape_url('https://example.com')
+
+        self.assertEqual(app.scheduler.stats()['interactive']['service']['count'], 1)
+
+    def test_async_client_requests_are_scheduled(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        app.scheduler = RequestScheduler()
+
+        async def dispatch(*args):
+            return {'success': True}
+
+        with patch.object(AsyncFirecrawlApp, '_async_dispatch', side_effect=dispatch):
+            asyncio.run(app._async_get_request(f'{API_URL}/v1/crawl/abc', {}))
+
+        self.assertEqual(app.scheduler.stats()['background']['service']['count'], 1)
@@ -0,0 +1,89 @@
+import unittest
+from unittest.mock import patch
+import asyncio
+import os
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+
+class FakeJobApi:
+    """Jobs finish after `polls[query]` status checks; each check adds one activity."""
+    def __init__(self, polls):
+        self.polls = polls
+        self.jobs = {}
+        self.running = 0
+        self.max_running = 0
+
+    async def post(self, url, data, headers, *args, **kwargs):
+        key = data.get('query') or data.get('url')
+        if key == 'bad':
+            return {'success': False, 'error': 'Invalid query'}
+        job_id = f'job-{len(self.jobs)}'
+        self.jobs[job_id] = {'key': key, 'checks': 0}
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        return {'success': True, 'id': job_id}
+
+    async def get(self, url, headers, *args, **kwargs):
+        job = self.jobs[url.rsplit('/', 1)[-1]]
+        job['checks'] += 1
+        done = job['checks'] >= abs(self.polls[job['key']])
+        if done:
+            self.running -= 1
+        if self.polls[job['key']] < 0:
+            return {'success': False, 'status': 'failed', 'error': 'Research failed'}
+        status = 'completed' if done else 'processing'
+        return {
+            'success': True,
+            'status': status,
+            'data': {'finalAnalysis': job['key']} if done else None,
+            'activities': [{'message': f"{job['key']} step {i}"} for i in range(job['checks'])],
+            'sources': [{'url': f"https://example.com/{job['key']}"}],
+        }
+
+    def patches(self):
+        return (
+            patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=self.post),
+            patch.object(AsyncFirecrawlApp, '_async_get_request', side_effect=self.get),
+        )
+
+class TestDeepResearchMany(unittest.TestCase):
+    def test_results_arrive_as_jobs_finish(self):
+        api = FakeJobApi({'slow': 3, 'fast': 1, 'medium': 2, 'broken': -1, 'bad': 1})
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        activities, sources = [], []
+
+        async def run():
+            results = []
+            async for result in app.deep_research_many(
+                    ['slow', 'fast', 'medium', 'broken', 'bad'],
+                    concurrency=2,
+                    poll_interval=0,
+                    on_activity=lambda index, activity: activities.append((index, activity['message'])),
+                    on_source=lambda index, source: sources.append(index)):
+                results.append(result)
+            return results
+
+        post_patch, get_patch = api.patches()
+        with post_patch, get_patch:
+            results = asyncio.run(run())
+
+        self.assertEqual([result.query for result in results], ['fast', 'slow', 'medium', 'bad', 'broken'])
+        self.assertEqual(results[0].result['data'], {'finalAnalysis': 'fast'})
+        self.assertEqual(results[3].error, 'Invalid query')
+        self.assertEqual(results[4].error, 'Research failed')
+        self.assertLessEqual(api.max_running, 2)
+        # Every activity and source is delivered once, despite the full lists being resent
+        self.assertEqual(activities, sorted(set(activities), key=activities.index))
+        self.assertEqual(len([a for a in activities if a[0] == 0]), 3)
+        self.assertEqual(sorted(sources), [0, 1, 2])
+
+    def test_sync_client_drives_the_async_poller(self):
+        api = FakeJobApi({'https://a.example.com': 2, 'https://b.example.com': 1})
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+        post_patch, get_patch = api.patches()
+        with post_patch, get_patch:
+            results = list(app.generate_llms_text_many(['https://a.example.com', 'https://b.example.com'], poll_interval=0))
+
+        self.assertEqual([result.index for result in results], [1, 0])
+        self.assertTrue(all(result.success for result in results))
+        self.assertEqual(results[0].id, 'job-1')
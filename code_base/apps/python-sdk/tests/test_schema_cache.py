@@ -0,0 +1,67 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import copy
+import json
+import os
+import pickle
+from typing import List
+import pydantic
+from firecrawl import FirecrawlApp, JsonConfig
+from firecrawl.firecrawl import FrozenSchema, _compile_schema
+
+class Item(pydantic.BaseModel):
+    name: str
+    tags: List[str]
+
+class TestSchemaCache(unittest.TestCase):
+    def test_model_schema_is_compiled_once(self):
+        with patch.object(Item, 'model_json_schema', wraps=Item.model_json_schema) as mock_schema:
+            first = _compile_schema(Item)
+            second = _compile_schema(Item)
+        self.assertIs(first, second)
+        self.assertLessEqual(mock_schema.call_count, 1)
+        self.assertEqual(json.loads(first.json), Item.model_json_schema())
+
+    def test_dict_schemas_are_cached_by_content(self):
+        schema = {'type': 'object', 'properties': {'item': Item}}
+        compiled = _compile_schema(schema)
+        self.assertIs(compiled, _compile_schema({'type': 'object', 'properties': {'item': Item}}))
+        self.assertEqual(compiled['properties']['item'], Item.model_json_schema())
+        self.assertIsNot(compiled, _compile_schema({'type': 'object'}))
+
+    def test_nested_classes_are_keyed_by_schema_not_identity(self):
+        # Short-lived classes with one name reuse ids once collected
+        for i in range(50):
+            row = pydantic.create_model('Row', **{f'field_{i}': (str, ...)})
+            compiled = _compile_schema({'type': 'array', 'items': row})
+            self.assertEqual(list(compiled['items']['properties']), [f'field_{i}'])
+
+    def test_frozen_schema_is_immutable(self):
+        compiled = _compile_schema(Item)
+        with self.assertRaises(TypeError):
+            compiled['title'] = 'Other'
+        with self.assertRaises(TypeError):
+            compiled['properties'].pop('name')
+        with self.assertRaises(TypeError):
+            compiled['required'].append('other')
+        editable = copy.deepcopy(compiled)
+        editable['properties']['name']['title'] = 'Other'
+        self.assertEqual(compiled['properties']['name']['title'], 'Name')
+        self.assertEqual(pickle.loads(pickle.dumps(compiled)), Item.model_json_schema())
+
+    @patch('requests.post')
+    def test_scrape_url_sends_compiled_schema_without_mutating_options(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {'success': True, 'data': {'markdown': 'x'}}
+        mock_post.return_value = mock_response
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        options = {'schema': Item, 'prompt': 'Find items'}
+        app.scrape_url('https://example.com', formats=['json'], json_options=options)
+        app.scrape_url('https://example.com', formats=['json'], json_options=JsonConfig(schema=Item))
+
+        self.assertIs(options['schema'], Item)
+        bodies = [call.kwargs['json'] for call in mock_post.call_args_list]
+        self.assertIs(bodies[0]['jsonOptions']['schema'], bodies[1]['jsonOptions']['schema'])
+        self.assertEqual(bodies[0]['jsonOptions']['prompt'], 'Find items')
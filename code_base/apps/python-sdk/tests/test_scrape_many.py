@@ -0,0 +1,80 @@
+import unittest
+from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
+import os
+import time
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp
+
+URLS = [f'https://example.com/{n}' for n in range(4)]
+DELAYS = {URLS[0]: 0.15, URLS[1]: 0.0, URLS[2]: 0.05, URLS[3]: 0.5}
+
+def fake_post(url, headers=None, json=None, timeout=None):
+    time.sleep(DELAYS[json['url']])
+    response = MagicMock()
+    if json['url'] == URLS[2]:
+        response.status_code = 500
+        response.json.return_value = {'success': False, 'error': 'boom'}
+    else:
+        response.status_code = 200
+        response.json.return_value = {'success': True, 'data': {'markdown': json['url']}}
+    return response
+
+class TestScrapeMany(unittest.TestCase):
+    @patch('requests.Session.post', side_effect=fake_post)
+    def test_yields_in_completion_order_with_errors(self, mock_post):
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        results = list(app.scrape_many(URLS[:3], concurrency=3, formats=['markdown']))
+
+        self.assertEqual([result.url for result in results], [URLS[1], URLS[2], URLS[0]])
+        self.assertFalse(results[1].success)
+        self.assertIn('boom', results[1].error)
+        self.assertEqual(results[2].document.markdown, URLS[0])
+        self.assertEqual(mock_post.call_args.kwargs['json']['formats'], ['markdown'])
+
+    @patch('requests.Session.post', side_effect=fake_post)
+    def test_ordered_results_and_deadline(self, mock_post):
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        results = list(app.scrape_many(URLS, concurrency=4, ordered=True, deadline=0.3))
+
+        self.assertEqual([result.index for result in results], [0, 1, 2, 3])
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[3].error, 'Deadline exceeded')
+
+    @patch('requests.Session.close')
+    @patch('requests.Session.post', side_effect=fake_post)
+    def test_deadline_keeps_finished_results_and_closes_session_later(self, mock_post, mock_close):
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        results = list(app.scrape_many([URLS[3], URLS[1]], concurrency=2, ordered=True, deadline=0.1))
+
+        self.assertEqual(results[0].error, 'Deadline exceeded')
+        self.assertTrue(results[1].success)
+        # The slow request is still running, so the session stays open until it finishes
+        mock_close.assert_not_called()
+        time.sleep(0.6)
+        mock_close.assert_called_once_with()
+
+    def test_async_scrape_many(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        state = {'active': 0, 'peak': 0}
+
+        async def post(url, data, headers):
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+            await asyncio.sleep(DELAYS[data['url']])
+            state['active'] -= 1
+            if data['url'] == URLS[2]:
+                raise Exception('boom')
+            return {'success': True, 'data': {'markdown': data['url']}}
+
+        async def collect():
+            return [result async for result in app.scrape_many(URLS, concurrency=2, deadline=0.4)]
+
+        with patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=post):
+            results = asyncio.run(collect())
+
+        self.assertEqual(state['peak'], 2)
+        self.assertEqual(len(results), 4)
+        by_url = {result.url: result for result in results}
+        self.assertEqual(by_url[URLS[0]].document.markdown, URLS[0])
+        self.assertEqual(by_url[URLS[2]].error, 'boom')
+        self.assertEqual(by_url[URLS[3]].error, 'Deadline exceeded')
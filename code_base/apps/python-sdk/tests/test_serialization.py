@@ -0,0 +1,34 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import json
+import os
+from firecrawl import FirecrawlApp
+from firecrawl.firecrawl import LocationConfig, ScrapeOptions, CrawlResponse, _model_dump, _validate_response
+
+class TestSerialization(unittest.TestCase):
+    def test_model_dump_excludes_none(self):
+        options = ScrapeOptions(formats=['markdown'], location=LocationConfig(country='us'))
+        self.assertEqual(_model_dump(options), {'formats': ['markdown'], 'location': {'country': 'us'}})
+        self.assertEqual(_model_dump({'country': 'de'}), {'country': 'de'})
+
+    def test_validate_response_from_bytes(self):
+        response = MagicMock()
+        response.content = json.dumps({'success': True, 'id': 'abc', 'url': 'https://api.firecrawl.dev/v1/crawl/abc'}).encode()
+        result = _validate_response(CrawlResponse, response)
+        self.assertIsInstance(result, CrawlResponse)
+        self.assertEqual(result.id, 'abc')
+        response.json.assert_not_called()
+
+    @patch('requests.post')
+    def test_async_crawl_url_parses_body(self, mock_post):
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'{"success": true, "id": "crawl-1"}'
+        mock_post.return_value = mock_response
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        result = app.async_crawl_url('https://example.com', scrape_options=ScrapeOptions(formats=['markdown']))
+
+        args, kwargs = mock_post.call_args
+        self.assertEqual(kwargs['json']['scrapeOptions'], {'formats': ['markdown']})
+        self.assertEqual(result.id, 'crawl-1')
@@ -0,0 +1,172 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import json
+import os
+from datetime import timedelta
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, RequestHooks, RequestScheduler, OpenTelemetryHooks
+from firecrawl.firecrawl import ScrapeResponse, _validate_model
+
+def make_response(status_code, payload):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = {}
+    response.elapsed = timedelta(seconds=0)
+    response.json.return_value = payload
+    return response
+
+class RecordingHooks(RequestHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request_start(self, trace):
+        self.events.append(('start', trace.endpoint, trace.attempt))
+
+    def on_request_end(self, trace):
+        self.events.append(('end', trace.endpoint, trace.status))
+
+    def on_retry(self, trace):
+        self.events.append(('retry', trace.endpoint, trace.attempt))
+
+    def on_job_poll(self, trace):
+        self.events.append(('poll', trace.job_id, trace.timings.polls))
+
+class TestRequestHooks(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        self.hooks = RecordingHooks()
+        self.app.hooks = self.hooks
+
+    @patch('requests.post')
+    def test_response_timings(self, mock_post):
+        mock_post.return_value = make_response(200, {'success': True, 'data': {'markdown': '# Hi'}})
+        self.app.scheduler = RequestScheduler()
+
+        result = self.app.scrape_url('https://example.com')
+
+        self.assertEqual(self.hooks.events, [('start', '/v1/scrape', 0), ('end', '/v1/scrape', 200)])
+        timings = result.timings
+        self.assertIs(timings, mock_post.return_value.timings)
+        for phase in ('queue', 'ttfb', 'download', 'decode', 'validate'):
+            self.assertIsNotNone(getattr(timings, phase), phase)
+        self.assertIsNone(timings.connect)
+        self.assertEqual(timings.retries, 0)
+        self.assertAlmostEqual(timings.total, sum(v for k, v in timings.to_dict().items() if k in timings.PHASES and v))
+        # The attribute stays out of the model's data
+        self.assertNotIn('timings', result.model_dump())
+
+    @patch('requests.post')
+    def test_back_to_back_requests_keep_their_own_timings(self, mock_post):
+        first = make_response(200, {'success': True, 'data': {'markdown': '# One'}})
+        second = make_response(200, {'success': True, 'data': {'markdown': '# Two'}})
+        mock_post.side_effect = [first, second]
+
+        # The first response is decoded but never validated into a model
+        self.app._post_request('https://api.firecrawl.dev/v1/scrape', {'url': 'https://example.com'}, {}).json()
+        unrelated = _validate_model(ScrapeResponse, {'markdown': '# Local'})
+        result = self.app.scrape_url('https://example.com/two')
+
+        self.assertFalse(hasattr(unrelated, 'timings'))
+        self.assertIsNone(first.timings.validate)
+        self.assertEqual(result.markdown, '# Two')
+        self.assertIs(result.timings, second.timings)
+
+    @patch('requests.get')
+    def test_retries_and_job_polls(self, mock_get):
+        url = 'https://api.firecrawl.dev/v1/crawl/job-1'
+        mock_get.side_effect = [make_response(502, {}), make_response(200, {}), make_response(200, {})]
+
+        retried = self.app._get_request(url, {}, backoff_factor=0)
+        polled = self.app._get_request(url, {}, backoff_factor=0)
+
+        self.assertEqual(self.hooks.events, [
+            ('start', '/v1/crawl/job-1', 0), ('end', '/v1/crawl/job-1', 502), ('retry', '/v1/crawl/job-1', 0),
+            ('start', '/v1/crawl/job-1', 1), ('end', '/v1/crawl/job-1', 200), ('poll', 'job-1', 1),
+            ('start', '/v1/crawl/job-1', 0), ('end', '/v1/crawl/job-1', 200), ('poll', 'job-1', 2),
+        ])
+        self.assertEqual(retried.timings.retries, 1)
+        self.assertEqual(polled.timings.retries, 0)
+        self.assertGreaterEqual(polled.timings.waited, 0)
+
+    def test_no_hooks_adds_no_wrapper(self):
+        self.app.hooks = None
+        self.assertEqual(self.app._http.__class__.__name__, 'module')
+
+class FakeAsyncResponse:
+    def __init__(self, status, payload):
+        self.status = status
+        self._body = json.dumps(payload).encode()
+
+    async def json(self):
+        return json.loads(self._body)
+
+    async def read(self):
+        return self._body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+class TestAsyncRequestHooks(unittest.TestCase):
+    def setUp(self):
+        self.app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        self.hooks = RecordingHooks()
+        self.app.hooks = self.hooks
+        self.session = MagicMock()
+        self.app._client_session = self.session
+
+    def test_async_timings(self):
+        self.session.request.side_effect = [
+            FakeAsyncResponse(200, {'success': True, 'id': 'job-2'}),
+            FakeAsyncResponse(200, {'success': True, 'status': 'completed', 'data': {'name': 'Widget'}}),
+        ]
+        self.app.scheduler = RequestScheduler()
+
+        result = asyncio.run(self.app.extract(['https://example.com'], prompt='Extract the name'))
+
+        self.assertEqual(self.hooks.events, [
+            ('start', '/v1/extract', 0), ('end', '/v1/extract', 200),
+            ('start', '/v1/extract/job-2', 0), ('end', '/v1/extract/job-2', 200), ('poll', 'job-2', 1),
+        ])
+        timings = result.timings
+        self.assertIs(self.session.request.call_args.kwargs['trace_request_ctx'], timings)
+        for phase in ('queue', 'ttfb', 'download', 'decode', 'validate'):
+            self.assertIsNotNone(getattr(timings, phase), phase)
+
+    def test_async_retries(self):
+        self.session.request.side_effect = [FakeAsyncResponse(502, {}), FakeAsyncResponse(200, {'success': True})]
+
+        asyncio.run(self.app._async_send(self.session, 'GET', 'https://api.firecrawl.dev/v1/map', {}, None, 3, 0))
+
+        self.assertEqual(self.hooks.events, [
+            ('start', '/v1/map', 0), ('end', '/v1/map', 502), ('retry', '/v1/map', 0),
+            ('start', '/v1/map', 1), ('end', '/v1/map', 200),
+        ])
+
+class TestOpenTelemetryHooks(unittest.TestCase):
+    @patch('requests.post')
+    def test_spans_carry_timings(self, mock_post):
+        otel = MagicMock()
+        tracer = MagicMock()
+        span = tracer.start_span.return_value
+        mock_post.return_value = make_response(500, {'success': False, 'error': 'boom'})
+
+        with patch.dict('sys.modules', {'opentelemetry': otel, 'opentelemetry.trace': otel.trace}):
+            app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+            app.hooks = OpenTelemetryHooks(tracer)
+            with self.assertRaises(Exception):
+                app.scrape_url('https://example.com')
+
+        self.assertEqual(tracer.start_span.call_args.args[0], 'POST /v1/scrape')
+        attributes = dict(call.args for call in span.set_attribute.call_args_list)
+        self.assertEqual(attributes['http.response.status_code'], 500)
+        self.assertIn('firecrawl.timing.ttfb_ms', attributes)
+        otel.trace.Status.assert_called_once_with(otel.trace.StatusCode.ERROR)
+        span.end.assert_called_once_with()
+
+    def test_requires_opentelemetry(self):
+        with patch.dict('sys.modules', {'opentelemetry': None}):
+            with self.assertRaises(ImportError):
+                OpenTelemetryHooks()
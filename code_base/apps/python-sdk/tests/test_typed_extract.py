@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import asyncio
+import json
+import os
+from typing import List
+import pydantic
+from firecrawl import FirecrawlApp, AsyncFirecrawlApp, JsonConfig
+
+class Product(pydantic.BaseModel):
+    name: str
+    price: float
+    tags: List[str] = []
+
+COMPLETED = {
+    'success': True,
+    'id': 'extract-1',
+    'status': 'completed',
+    'data': {'name': 'Widget', 'price': '9.5', 'tags': ['a']}
+}
+
+INVALID = {**COMPLETED, 'data': {'name': 'Widget', 'price': 'n/a'}}
+
+def make_response(payload, with_content=True):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = payload
+    if with_content:
+        response.content = json.dumps(payload).encode()
+    return response
+
+class TestTypedExtract(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    def extract(self, status, **kwargs):
+        with patch('requests.post') as mock_post, patch('requests.get') as mock_get:
+            mock_post.return_value = make_response({'success': True, 'id': 'extract-1'})
+            mock_get.return_value = status
+            return self.app.extract(['https://example.com'], schema=Product, **kwargs)
+
+    def test_default_returns_raw_dict(self):
+        result = self.extract(make_response(COMPLETED))
+        self.assertEqual(result.data, COMPLETED['data'])
+
+    def test_strict_binds_schema_model(self):
+        for with_content in (True, False):
+            result = self.extract(make_response(COMPLETED, with_content), validation='strict')
+            self.assertIsInstance(result.data, Product)
+            self.assertEqual(result.data.price, 9.5)
+            self.assertIsNone(result.validationErrors)
+
+    def test_strict_raises_on_mismatch(self):
+        with self.assertRaises(ValueError) as ctx:
+            self.extract(make_response(INVALID), validation='strict')
+        self.assertIn('price', str(ctx.exception))
+
+    def test_lenient_collects_field_errors(self):
+        result = self.extract(make_response(INVALID), validation='lenient')
+        self.assertIsInstance(result.data, Product)
+        self.assertEqual(result.data.price, 'n/a')
+        self.assertEqual([error['loc'] for error in result.validationErrors], [['price']])
+        self.assertEqual(result.status, 'completed')
+
+    def test_validation_requires_model_schema(self):
+        with self.assertRaises(ValueError):
+            self.app.extract(['https://example.com'], schema={'type': 'object'}, validation='strict')
+        with self.assertRaises(ValueError):
+            self.app.extract(['https://example.com'], schema=Product, validation='loose')
+
+    @patch('requests.post')
+    def test_scrape_url_binds_json(self, mock_post):
+        mock_post.return_value = make_response({'success': True, 'data': {'markdown': '# Widget', 'json': INVALID['data']}})
+
+        result = self.app.scrape_url('https://example.com', formats=['json'], json_options=JsonConfig(schema=Product), validation='lenient')
+        self.assertIsInstance(result.json, Product)
+        self.assertEqual(result.markdown, '# Widget')
+        self.assertEqual(result.validationErrors[0]['loc'], ['price'])
+
+        mock_post.return_value = make_response({'success': True, 'data': {'json': COMPLETED['data']}})
+        result = self.app.scrape_url('https://example.com', formats=['json'], json_options={'schema': Product}, validation='strict')
+        self.assertEqual(result.json, Product(name='Widget', price=9.5, tags=['a']))
+
+class TestAsyncTypedExtract(unittest.TestCase):
+    def test_async_extract_and_scrape(self):
+        app = AsyncFirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+        async def post(url, data, headers, *args, **kwargs):
+            if url.endswith('/v1/scrape'):
+                return {'success': True, 'data': {'json': COMPLETED['data']}}
+            return {'success': True, 'id': 'extract-1'}
+
+        async def get(url, headers, *args, **kwargs):
+            return INVALID
+
+        async def run():
+            extracted = await app.extract(['https://example.com'], schema=Product, validation='lenient')
+            scraped = await app.scrape_url('https://example.com', formats=['json'], json_options=JsonConfig(schema=Product), validation='strict')
+            return extracted, scraped
+
+        with patch.object(AsyncFirecrawlApp, '_async_post_request', side_effect=post), \
+                patch.object(AsyncFirecrawlApp, '_async_get_request', side_effect=get):
+            extracted, scraped = asyncio.run(run())
+
+        self.assertEqual(extracted.validationErrors[0]['loc'], ['price'])
+        self.assertIsInstance(scraped.json, Product)
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+from firecrawl import FirecrawlApp, UrlCanonicalizer
+
+INPUTS = [
+    'https://example.com/a',
+    'HTTP://Example.com:80/a/?utm_source=news#top',
+    'https://example.com/b?y=2&x=1',
+    'https://example.com/b?x=1&y=2&gclid=abc',
+]
+
+class TestUrlCanonicalizer(unittest.TestCase):
+    def test_canonicalize(self):
+        canonicalizer = UrlCanonicalizer()
+        self.assertEqual(canonicalizer.canonicalize(INPUTS[1]), 'https://example.com/a')
+        self.assertEqual(canonicalizer.canonicalize(INPUTS[3]), 'https://example.com/b?x=1&y=2')
+        self.assertEqual(canonicalizer.canonicalize('http://example.com'), 'https://example.com/')
+        self.assertEqual(canonicalizer.canonicalize('https://example.com/docs/*'), 'https://example.com/docs/*')
+        self.assertEqual(canonicalizer.canonicalize('firecrawl.dev'), 'firecrawl.dev')
+
+    def test_configurable_rules(self):
+        canonicalizer = UrlCanonicalizer(['ref'], force_https=False, strip_fragment=False)
+        self.assertEqual(
+            canonicalizer.canonicalize('http://example.com/a/?ref=x&utm_source=y#frag'),
+            'http://example.com/a?utm_source=y#frag'
+        )
+
+    def test_dedupe_keeps_first_seen_order(self):
+        unique, mapping = UrlCanonicalizer().dedupe(INPUTS)
+        self.assertEqual(unique, ['https://example.com/a', 'https://example.com/b?x=1&y=2'])
+        self.assertEqual(mapping[INPUTS[1]], unique[0])
+        self.assertEqual(mapping[INPUTS[3]], unique[1])
+
+    @patch('requests.get')
+    @patch('requests.post')
+    def test_batch_scrape_maps_results_to_inputs(self, mock_post, mock_get):
+        post_response = MagicMock()
+        post_response.status_code = 200
+        post_response.json.return_value = {'success': True, 'id': 'job-1'}
+        mock_post.return_value = post_response
+        get_response = MagicMock()
+        get_response.status_code = 200
+        get_response.json.return_value = {
+            'success': True, 'status': 'completed', 'completed': 1, 'total': 2, 'creditsUsed': 1,
+            'expiresAt': '2025-01-01T00:00:00Z',
+            'data': [{'markdown': 'a', 'metadata': {'sourceURL': 'https://example.com/a'}}],
+        }
+        mock_get.return_value = get_response
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        result = app.batch_scrape_urls(INPUTS, canonicalize=True)
+
+        self.assertEqual(mock_post.call_args.kwargs['json']['urls'], ['https://example.com/a', 'https://example.com/b?x=1&y=2'])
+        documents = result.documents_by_input()
+        self.assertEqual(documents[INPUTS[0]].markdown, 'a')
+        self.assertIs(documents[INPUTS[1]], documents[INPUTS[0]])
+        self.assertIsNone(documents[INPUTS[3]])
+
+    @patch('requests.Session.post')
+    def test_scrape_many_fans_out_results(self, mock_post):
+        def fake_post(url, headers=None, json=None, timeout=None):
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {'success': True, 'data': {'markdown': json['url']}}
+            return response
+        mock_post.side_effect = fake_post
+
+        app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+        results = list(app.scrape_many(INPUTS, ordered=True, canonicalize=True))
+
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual([result.url for result in results], INPUTS)
+        self.assertEqual(results[1].document.markdown, 'https://example.com/a')
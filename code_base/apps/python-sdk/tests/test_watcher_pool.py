@@ -0,0 +1,107 @@
+import unittest
+from unittest.mock import patch
+import asyncio
+import json
+import os
+from firecrawl import FirecrawlApp, WatcherPool
+
+def make_doc(job_id, n):
+    return {'markdown': f'{job_id} page {n}', 'metadata': {'scrapeId': f'{job_id}-{n}'}}
+
+class FakeWebSocket:
+    def __init__(self, job_id, count):
+        self.messages = [json.dumps({'type': 'document', 'data': make_doc(job_id, n)}) for n in range(count)]
+        self.close_reason = '{"type":"done"}'
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for message in self.messages:
+            yield message
+            await asyncio.sleep(0)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+def fake_connect(counts):
+    def connect(url, **kwargs):
+        job_id = url.rsplit('/', 1)[-1]
+        return FakeWebSocket(job_id, counts[job_id])
+    return connect
+
+class TestWatcherPool(unittest.TestCase):
+    def setUp(self):
+        self.app = FirecrawlApp(api_key=os.environ.get('TEST_API_KEY', 'dummy-api-key-for-testing'))
+
+    @patch('websockets.connect')
+    def test_merged_stream_is_tagged_and_fair(self, mock_connect):
+        mock_connect.side_effect = fake_connect({'big': 20, 'small': 2})
+        pool = WatcherPool(self.app, workers=1, max_queued_per_job=4, retain='none')
+        pool.add('big')
+        pool.add('small')
+
+        async def collect():
+            return [(job_id, event_type) async for job_id, event_type, detail in pool.events()]
+
+        events = asyncio.run(collect())
+
+        self.assertEqual(len(events), 24)
+        self.assertEqual(events.count(('big', 'done')), 1)
+        self.assertEqual(events.count(('small', 'done')), 1)
+        # The small job finishes long before the big one instead of waiting behind it
+        self.assertLess(events.index(('small', 'done')), events.index(('big', 'done')) - 10)
+
+        metrics = pool.metrics()
+        self.assertEqual(metrics['documents'], 22)
+        self.assertEqual(metrics['handled'], 24)
+        self.assertEqual(metrics['jobs']['big']['status'], 'completed')
+        self.assertEqual(metrics['queued'], 0)
+
+    @patch('websockets.connect')
+    def test_slow_consumer_still_receives_the_end(self, mock_connect):
+        mock_connect.side_effect = fake_connect({'a': 3, 'b': 3})
+        pool = WatcherPool(self.app, workers=2, max_queued_per_job=1)
+        pool.add('a')
+        pool.add('b')
+
+        async def collect():
+            events = []
+            async for job_id, event_type, detail in pool.events():
+                await asyncio.sleep(0.02)
+                events.append((job_id, event_type))
+            return events
+
+        events = asyncio.run(asyncio.wait_for(collect(), 5))
+
+        self.assertEqual(len(events), 8)
+
+    @patch('websockets.connect')
+    def test_global_handlers_and_watcher_errors(self, mock_connect):
+        counts = {'ok': 3}
+
+        def connect(url, **kwargs):
+            if url.endswith('/broken'):
+                raise OSError('unreachable')
+            return fake_connect(counts)(url)
+
+        mock_connect.side_effect = connect
+        pool = WatcherPool(self.app, workers=2, max_reconnects=0, backoff_factor=0, fallback_to_polling=False)
+        pool.add('ok')
+        pool.add('broken')
+        documents = []
+        errors = []
+
+        async def on_document(detail):
+            documents.append(detail['id'])
+
+        pool.add_event_listener('document', on_document)
+        pool.add_event_listener('error', errors.append)
+        asyncio.run(pool.run())
+
+        self.assertEqual(documents, ['ok'] * 3)
+        self.assertEqual(errors[0]['id'], 'broken')
+        self.assertIn('broken', pool.errors)